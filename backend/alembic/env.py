@@ -27,6 +27,15 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = SQLModel.metadata
 
+# Postgres-only search objects: full text search (migration b4f1d8a2c6e3)
+# and the note embedding vector index (c5e2a9f7b3d1). They are not part of
+# the models, so keep autogenerate from proposing to drop them.
+DATABASE_ONLY_OBJECTS = {"search_vector", "ix_notes_search_vector", "ix_topics_search_vector", "ix_note_embeddings_embedding_hnsw"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    return not (reflected and compare_to is None and name in DATABASE_ONLY_OBJECTS)
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -49,6 +58,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -72,7 +82,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
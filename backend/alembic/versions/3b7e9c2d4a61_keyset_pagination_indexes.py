@@ -0,0 +1,32 @@
+"""keyset pagination indexes
+
+Revision ID: 3b7e9c2d4a61
+Revises: a962359d4fc8
+Create Date: 2026-10-17 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e9c2d4a61'
+down_revision: Union[str, Sequence[str], None] = 'a962359d4fc8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_topics_user_id_created_at_id', 'topics', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_notes_user_id_topic_id_created_at_id', 'notes', ['user_id', 'topic_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_note_tags_user_id_created_at_id', 'note_tags', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_note_tags_user_id_created_at_id', table_name='note_tags')
+    op.drop_index('ix_notes_user_id_topic_id_created_at_id', table_name='notes')
+    op.drop_index('ix_topics_user_id_created_at_id', table_name='topics')
@@ -0,0 +1,40 @@
+"""server side timestamps
+
+Revision ID: 5e1f0b7d9c28
+Revises: 7c4d2e8f1a93
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1f0b7d9c28'
+down_revision: Union[str, Sequence[str], None] = '7c4d2e8f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TIMESTAMP_COLUMNS = [
+    ('users', 'created_at'),
+    ('topics', 'created_at'),
+    ('topics', 'updated_at'),
+    ('notes', 'created_at'),
+    ('notes', 'updated_at'),
+    ('note_tags', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,38 @@
+"""unique topic edge source target
+
+Revision ID: 7c4d2e8f1a93
+Revises: 3b7e9c2d4a61
+Create Date: 2026-10-17 12:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4d2e8f1a93'
+down_revision: Union[str, Sequence[str], None] = '3b7e9c2d4a61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Drop duplicate edges left behind by the old check-then-insert path, keeping one per pair
+    op.execute(
+        """
+        DELETE FROM topic_edges a
+        USING topic_edges b
+        WHERE a.source = b.source
+          AND a.target = b.target
+          AND a.ctid > b.ctid
+        """
+    )
+    op.create_unique_constraint('uq_topic_edges_source_target', 'topic_edges', ['source', 'target'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_topic_edges_source_target', 'topic_edges', type_='unique')
@@ -0,0 +1,42 @@
+"""composite lookup indexes
+
+Revision ID: 9a2c6e4b8d17
+Revises: 5e1f0b7d9c28
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a2c6e4b8d17'
+down_revision: Union[str, Sequence[str], None] = '5e1f0b7d9c28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# notes(user_id, topic_id, ...), topics(user_id, created_at, ...) and
+# topic_edges(source, target) are already covered by the keyset pagination
+# indexes and the edge unique constraint.
+INDEXES = [
+    ('ix_note_tag_map_tag_id_note_id', 'note_tag_map', ['tag_id', 'note_id']),
+    ('ix_note_tags_user_id_name', 'note_tags', ['user_id', 'name']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction, and doesn't block writes
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,52 @@
+"""full text search
+
+Revision ID: b4f1d8a2c6e3
+Revises: 9a2c6e4b8d17
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4f1d8a2c6e3'
+down_revision: Union[str, Sequence[str], None] = '9a2c6e4b8d17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Titles weigh more than bodies when ranking. Keep in sync with
+# app/data/repository/search.py.
+SEARCH_VECTORS = {
+    'notes': "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+             "setweight(to_tsvector('english', coalesce(content, '')), 'B')",
+    'topics': "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+              "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Adding a stored generated column rewrites the table once
+    for table, expression in SEARCH_VECTORS.items():
+        op.execute(f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({expression}) STORED")
+
+    with op.get_context().autocommit_block():
+        for table in SEARCH_VECTORS:
+            op.create_index(
+                f'ix_{table}_search_vector', table, ['search_vector'],
+                postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in SEARCH_VECTORS:
+            op.drop_index(f'ix_{table}_search_vector', table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    for table in SEARCH_VECTORS:
+        op.drop_column(table, 'search_vector')
@@ -0,0 +1,55 @@
+"""note embeddings
+
+Revision ID: c5e2a9f7b3d1
+Revises: b4f1d8a2c6e3
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e2a9f7b3d1'
+down_revision: Union[str, Sequence[str], None] = 'b4f1d8a2c6e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Keep in sync with app.models.embedding.EMBEDDING_DIMENSIONS
+DIMENSIONS = 256
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    op.create_table(
+        'note_embeddings',
+        sa.Column('note_id', sa.Uuid(), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('embedding', Vector(DIMENSIONS), nullable=False),
+        sa.Column('note_updated_at', sa.DateTime(), nullable=False),
+        sa.Column('embedded_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['note_id'], ['notes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('note_id'),
+    )
+
+    # HNSW over cosine distance: no training step (unlike IVFFlat), so it can be
+    # built on an empty table and stays accurate as notes are added
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_note_embeddings_embedding_hnsw', 'note_embeddings', ['embedding'],
+            postgresql_using='hnsw', postgresql_ops={'embedding': 'vector_cosine_ops'},
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_note_embeddings_embedding_hnsw', table_name='note_embeddings', postgresql_concurrently=True, if_exists=True)
+    op.drop_table('note_embeddings')
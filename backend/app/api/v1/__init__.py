@@ -1,7 +1,38 @@
+from fastapi import APIRouter
+
+from app.core.config import settings
 from app.api.v1.routes.user import router as user_router
 from app.api.v1.routes.auth import router as auth_router
 from app.api.v1.routes.topic import router as topic_router
 from app.api.v1.routes.note import router as note_router
 from app.api.v1.routes.tag import router as tag_router
+from app.api.v1.routes.search import router as search_router
+from app.api.v1.routes.job import router as job_router
+from app.api.v1.routes.data_import import router as import_router
+
+
+def _with_async_reads(sync_router: APIRouter, async_router: APIRouter) -> APIRouter:
+    """Serve the async router's endpoints in place of matching sync ones.
+
+    Async routes are registered first so that, e.g., GET /topics/graph still
+    wins over GET /topics/{topicid}.
+    """
+    replaced = {(route.path, method) for route in async_router.routes for method in route.methods}
+    router = APIRouter()
+    router.routes.extend(async_router.routes)
+    router.routes.extend(
+        route for route in sync_router.routes
+        if not any((route.path, method) in replaced for method in route.methods)
+    )
+    return router
+
+
+if settings.ASYNC_ROUTES:
+    from app.api.v1.async_routes import user as async_user, topic as async_topic, note as async_note, tag as async_tag
+
+    user_router = _with_async_reads(user_router, async_user.router)
+    topic_router = _with_async_reads(topic_router, async_topic.router)
+    note_router = _with_async_reads(note_router, async_note.router)
+    tag_router = _with_async_reads(tag_router, async_tag.router)
 
-__all__ = ["user_router", "auth_router", "topic_router", "note_router", "tag_router"]
\ No newline at end of file
+__all__ = ["user_router", "auth_router", "topic_router", "note_router", "tag_router", "search_router", "job_router", "import_router"]
@@ -0,0 +1,55 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.deps import get_async_user_repository, get_async_note_repository, verify_token, get_async_topic_repository
+from app.core.config import settings
+from app.core.domain import Error
+from app.data.async_repository import AsyncUserRepository, AsyncNoteRepository, AsyncTopicRepository
+from app.domain.models import UserError, TopicError
+from app.domain.models.note_errors import NoteError
+from app.domain.use_case.note import read_all_notes_by_topic_id_async, read_note_by_id_async
+from app.domain.use_case.topic import read_topic_by_id_async
+from app.domain.use_case.user.get_user import get_user_async
+from app.dtos import NoteApiResponse
+from app.models import NoteReadWithTags, Page
+
+router = APIRouter(
+    prefix="/notes",
+    tags=["note"],
+    responses={404: {"description": "Not found"}}
+)
+
+@router.get("/{topicId}", response_model=NoteApiResponse[Page[NoteReadWithTags]], response_model_exclude_none=True)
+async def read_all_notes(topicId: str, limit: int = Query(default=settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE), cursor: Optional[str] = None, decoded_token : dict = Depends(verify_token), note_repository: AsyncNoteRepository = Depends(get_async_note_repository), user_repository: AsyncUserRepository = Depends(get_async_user_repository), topic_repository: AsyncTopicRepository = Depends(get_async_topic_repository)):
+    db_user = await get_user_async(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return NoteApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    db_topic = await read_topic_by_id_async(str(db_user.data.id), topicId, topic_repository)
+    if isinstance(db_topic, Error):
+        if db_topic.error == TopicError.NOT_FOUND:
+            return NoteApiResponse.error_response(message="Topic not found.", status=404).model_dump()
+
+    result = await read_all_notes_by_topic_id_async(topicId, str(db_user.data.id), note_repository, limit, cursor)
+    if isinstance(result, Error):
+        if result.error == NoteError.NOT_FOUND:
+            return NoteApiResponse.error_response(message="Notes not found.", status=404).model_dump()
+        elif result.error == NoteError.INVALID_CURSOR:
+            return NoteApiResponse.error_response(message="Invalid cursor.", status=400).model_dump()
+    return NoteApiResponse.success_response(message="Notes fetched successfully.", data=result.data).model_dump()
+
+@router.get("/single/{noteid}", response_model=NoteApiResponse[NoteReadWithTags], response_model_exclude_none=True)
+async def read_note(noteid: str, decoded_token: dict = Depends(verify_token), note_repository: AsyncNoteRepository = Depends(get_async_note_repository), user_repository: AsyncUserRepository = Depends(get_async_user_repository)):
+    db_user = await get_user_async(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return NoteApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = await read_note_by_id_async(noteid, str(db_user.data.id), note_repository)
+    if isinstance(result, Error):
+        if result.error == NoteError.NOT_FOUND:
+            return NoteApiResponse.error_response(message="Note not found.", status=404).model_dump()
+
+    return NoteApiResponse.success_response(message="Note fetched successfully.", data=result.data).model_dump()
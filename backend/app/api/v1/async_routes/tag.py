@@ -0,0 +1,50 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.deps import get_async_user_repository, get_async_tag_repository, verify_token
+from app.core.config import settings
+from app.core.domain import Error
+from app.data.async_repository import AsyncUserRepository, AsyncTagRepository
+from app.domain.models import UserError
+from app.domain.models.tag_errors import TagError
+from app.domain.use_case.tag import read_all_tags_by_user_async, read_tag_by_id_async
+from app.domain.use_case.user.get_user import get_user_async
+from app.dtos import TagApiResponse
+from app.models import NoteTagRead, Page
+
+router = APIRouter(
+    prefix="/tags",
+    tags=["tag"],
+    responses={404: {"description": "Not found"}}
+)
+
+@router.get("/", response_model=TagApiResponse[Page[NoteTagRead]], response_model_exclude_none=True)
+async def read_all_tags(limit: int = Query(default=settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE), cursor: Optional[str] = None, decoded_token: dict = Depends(verify_token), tag_repository: AsyncTagRepository = Depends(get_async_tag_repository), user_repository: AsyncUserRepository = Depends(get_async_user_repository)):
+    db_user = await get_user_async(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return TagApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = await read_all_tags_by_user_async(str(db_user.data.id), tag_repository, limit, cursor)
+    if isinstance(result, Error):
+        if result.error == TagError.EMPTY:
+            return TagApiResponse.error_response(message="No tags found.", status=404).model_dump()
+        elif result.error == TagError.INVALID_CURSOR:
+            return TagApiResponse.error_response(message="Invalid cursor.", status=400).model_dump()
+
+    return TagApiResponse.success_response(message="Tags fetched successfully.", data=result.data).model_dump()
+
+@router.get("/{tagid}", response_model=TagApiResponse[NoteTagRead], response_model_exclude_none=True)
+async def read_tag(tagid: str, decoded_token: dict = Depends(verify_token), tag_repository: AsyncTagRepository = Depends(get_async_tag_repository), user_repository: AsyncUserRepository = Depends(get_async_user_repository)):
+    db_user = await get_user_async(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return TagApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = await read_tag_by_id_async(tagid, str(db_user.data.id), tag_repository)
+    if isinstance(result, Error):
+        if result.error == TagError.NOT_FOUND:
+            return TagApiResponse.error_response(message="Tag not found.", status=404).model_dump()
+
+    return TagApiResponse.success_response(message="Tag fetched successfully.", data=result.data).model_dump()
@@ -0,0 +1,72 @@
+from typing import Optional
+
+from fastapi import APIRouter, Query, Response
+from fastapi.params import Depends
+
+from app.core.config import settings
+from app.core.deps import get_async_topic_repository, get_async_topic_edge_repository, verify_token, get_async_user_repository
+from app.core.domain import Error
+from app.data.async_repository import AsyncTopicRepository, AsyncTopicEdgeRepository, AsyncUserRepository
+from app.domain.models import TopicError, UserError
+from app.domain.use_case.topic import read_all_topics_async, read_topic_by_id_async, read_topic_graph_async
+from app.domain.use_case.user.get_user import get_user_async
+from app.dtos import TopicApiResponse
+from app.models import TopicRead, TopicGraphRead, Page
+
+router = APIRouter(
+    prefix="/topics",
+    tags=["topic"],
+    responses={404: {"description": "Not found"}}
+)
+
+@router.get("/", response_model=TopicApiResponse[Page[TopicRead]], response_model_exclude_none=True)
+async def read_topics(limit: int = Query(default=settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE), cursor: Optional[str] = None, decoded_token : dict = Depends(verify_token), topic_repository: AsyncTopicRepository = Depends(get_async_topic_repository), user_repository: AsyncUserRepository = Depends(get_async_user_repository)):
+    db_user = await get_user_async(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return TopicApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = await read_all_topics_async(db_user.data, topic_repository, limit, cursor)
+    if isinstance(result, Error):
+        if result.error == TopicError.EMPTY:
+            return TopicApiResponse.error_response(message="No topics found.", status=404).model_dump()
+        elif result.error == TopicError.INVALID_CURSOR:
+            return TopicApiResponse.error_response(message="Invalid cursor.", status=400).model_dump()
+    return TopicApiResponse.success_response(message="Topics fetched successfully.", data=result.data).model_dump()
+
+@router.get("/graph", response_model=TopicApiResponse[TopicGraphRead], response_model_exclude_none=True)
+async def read_graph(include_description: bool = True, decoded_token: dict = Depends(verify_token), topic_repository: AsyncTopicRepository = Depends(get_async_topic_repository), topic_edge_repository: AsyncTopicEdgeRepository = Depends(get_async_topic_edge_repository), user_repository: AsyncUserRepository = Depends(get_async_user_repository)):
+    db_user = await get_user_async(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return TopicApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = await read_topic_graph_async(db_user.data, topic_repository, topic_edge_repository, include_description)
+    response = TopicApiResponse[TopicGraphRead].success_response(message="Topic graph fetched successfully.", data=result.data)
+    return Response(content=response.model_dump_json(exclude_none=True), media_type="application/json")
+
+@router.get("/{topicid}", response_model=TopicApiResponse[TopicRead], response_model_exclude_none=True)
+async def read_topic(topicid: str, decoded_token : dict = Depends(verify_token), topic_repository: AsyncTopicRepository = Depends(get_async_topic_repository), user_repository: AsyncUserRepository = Depends(get_async_user_repository)):
+    db_user = await get_user_async(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return TopicApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = await read_topic_by_id_async(str(db_user.data.id), topicid, topic_repository)
+    if isinstance(result, Error):
+        if result.error == TopicError.NOT_FOUND:
+            return TopicApiResponse.error_response(message="Topic not found.", status=404).model_dump()
+
+    return TopicApiResponse.success_response(message="Topic fetched successfully.", data=result.data).model_dump()
+
+@router.get("/{topicid}/edges", response_model=TopicApiResponse, response_model_exclude_none=True)
+async def get_topic_edges(topicid: str, decoded_token: dict = Depends(verify_token), topic_edge_repository: AsyncTopicEdgeRepository = Depends(get_async_topic_edge_repository), user_repository: AsyncUserRepository = Depends(get_async_user_repository)):
+    db_user = await get_user_async(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return TopicApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    edges = await topic_edge_repository.get_edges_by_source(topicid)
+    edge_data = [{"target_topic_id": str(edge.target), "relation_type": edge.relation_type} for edge in edges]
+
+    return TopicApiResponse.success_response(message="Topic edges fetched successfully.", data=edge_data).model_dump()
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.core.deps import get_async_user_repository, verify_token
+from app.core.domain import Error
+from app.data.async_repository import AsyncUserRepository
+from app.domain.models import UserError
+from app.domain.use_case.user.get_user import get_user_async
+from app.domain.use_case.user.get_user_stats import get_user_stats_async
+from app.dtos import UserApiResponse
+from app.models import UserRead, UserStatsRead
+
+router = APIRouter(
+    prefix="/user",
+    tags=["user"],
+    responses={404: {"description": "Not found"}}
+)
+
+@router.get("/", response_model=UserApiResponse[UserRead], response_model_exclude_none=True)
+async def read_user(decoded_token: dict = Depends(verify_token), user_repository: AsyncUserRepository = Depends(get_async_user_repository)):
+    result = await get_user_async(decoded_token, user_repository)
+    if isinstance(result, Error):
+        if UserError.NOT_FOUND == result.error:
+            return UserApiResponse.error_response(message="User not found.").model_dump()
+
+    user_response = UserRead(
+        id=str(result.data.id),
+        username=result.data.username,
+        email=result.data.email,
+        created_at=result.data.created_at
+    )
+
+    return UserApiResponse.success_response(message="Fetched user successfully", data=user_response).model_dump()
+
+
+@router.get("/stats", response_model=UserApiResponse[UserStatsRead], response_model_exclude_none=True)
+async def read_user_stats(recent_limit: int = Query(default=3, ge=0, le=50), decoded_token: dict = Depends(verify_token), user_repository: AsyncUserRepository = Depends(get_async_user_repository)):
+    db_user = await get_user_async(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if UserError.NOT_FOUND == db_user.error:
+            return UserApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = await get_user_stats_async(db_user.data, user_repository, recent_limit)
+    return UserApiResponse.success_response(message="Fetched user stats successfully", data=result.data).model_dump()
@@ -17,13 +17,17 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Async so that waiting on bcrypt (see app.core.hashing) holds no threadpool
+# slot; the use cases run their database calls in the threadpool
 @router.post("/register", response_model=UserApiResponse[UserRead], response_model_exclude_none=True)
-def create_user(user: UserCreate, session: Session = Depends(get_session), user_repository: UserRepository = Depends(get_user_repository)):
-    result = register_user(user, user_repository)
+async def create_user(user: UserCreate, session: Session = Depends(get_session), user_repository: UserRepository = Depends(get_user_repository)):
+    result = await register_user(user, user_repository)
 
     if isinstance(result, Error):
         if UserError.ALREADY_EXISTS == result.error:
             return UserApiResponse.error_response(message="User already exists with that email.").model_dump()
+        if UserError.SERVICE_BUSY == result.error:
+            return UserApiResponse.error_response(message="Server is busy, please try again.", status=503).model_dump()
 
     user_response = UserRead(
         id=str(result.data.id),
@@ -36,11 +40,13 @@ def create_user(user: UserCreate, session: Session = Depends(get_session), user_
 
 
 @router.post("/login", response_model=UserApiResponse[UserLoginResponse], response_model_exclude_none=True)
-def login(user: UserLogin, session: Session = Depends(get_session), user_repository: UserRepository = Depends(get_user_repository)):
-    result = login_user(user, user_repository)
+async def login(user: UserLogin, session: Session = Depends(get_session), user_repository: UserRepository = Depends(get_user_repository)):
+    result = await login_user(user, user_repository)
     if isinstance(result, Error):
         if UserError.INVALID_CREDENTIALS == result.error:
             return UserApiResponse.error_response(message="Invalid credentials", status=401).model_dump()
+        if UserError.SERVICE_BUSY == result.error:
+            return UserApiResponse.error_response(message="Server is busy, please try again.", status=503).model_dump()
 
     jwt_token = create_access_token({
         "userId": str(result.data.id),
@@ -0,0 +1,77 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.deps import get_user_repository, get_import_repository, get_job_repository, verify_token
+from app.core.domain import Error
+from app.core.jobs import enqueue
+from app.data.repository import UserRepository, ImportRepository, JobRepository
+from app.domain.models import UserError
+from app.domain.use_case.user.get_user import get_user
+from app.domain.use_case.user.import_user_data import import_user_data
+from app.dtos import UserApiResponse
+from app.models import ImportResult, JobKind
+from app.util.compression import BoundedDecompressor, TooLarge, decompression_errors, zstd_available
+
+router = APIRouter(
+    prefix="/import",
+    tags=["import"],
+    responses={404: {"description": "Not found"}}
+)
+
+CONTENT_ENCODINGS = {"identity": "none", "gzip": "gzip", "zstd": "zstd"}
+
+
+async def _read_body(request: Request, compression: str, max_bytes: int) -> Optional[bytes]:
+    """The decompressed request body, or None once it grows past max_bytes"""
+    unpacker = BoundedDecompressor(compression, max_bytes)
+    body = bytearray()
+    try:
+        async for chunk in request.stream():
+            if compression == "gzip":
+                # Inflating is CPU-bound; keep it off the event loop
+                body += await run_in_threadpool(unpacker.decompress, chunk)
+            else:
+                body += unpacker.decompress(chunk)
+        body += await run_in_threadpool(unpacker.flush)
+    except TooLarge:
+        return None
+    return bytes(body)
+
+
+def _import(user_id: str, body: bytes, dry_run: bool, import_repository: ImportRepository, job_repository: JobRepository):
+    result = import_user_data(user_id, body.splitlines(), import_repository, dry_run)
+    if isinstance(result, Error):
+        if result.error == UserError.IMPORT_CONFLICT:
+            return UserApiResponse.error_response(message="The import conflicted with a concurrent change; nothing was imported.", status=409).model_dump()
+
+    if result.data.created.get("note"):
+        enqueue(job_repository, JobKind.EMBED_NOTES, {"user_id": user_id}, user_id=user_id, dedupe_key=f"embed_notes:{user_id}")
+    message = "Import checked successfully." if dry_run else "Import completed successfully."
+    return UserApiResponse.success_response(message=message, data=result.data).model_dump()
+
+
+# Async so the body can be read as it arrives; the database work runs in the
+# thread pool like any sync endpoint
+@router.post("/", response_model=UserApiResponse[ImportResult], response_model_exclude_none=True)
+async def import_data(request: Request, dry_run: bool = False, decoded_token: dict = Depends(verify_token), user_repository: UserRepository = Depends(get_user_repository), import_repository: ImportRepository = Depends(get_import_repository), job_repository: JobRepository = Depends(get_job_repository)):
+    db_user = await run_in_threadpool(get_user, decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return UserApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    encoding = request.headers.get("Content-Encoding", "identity").strip().lower()
+    compression = CONTENT_ENCODINGS.get(encoding)
+    if compression is None or (compression == "zstd" and not zstd_available()):
+        return UserApiResponse.error_response(message=f"Unsupported Content-Encoding {encoding!r}.", status=415).model_dump()
+
+    try:
+        body = await _read_body(request, compression, settings.IMPORT_MAX_BYTES)
+    except decompression_errors():
+        return UserApiResponse.error_response(message=f"The request body is not valid {encoding} data.", status=400).model_dump()
+    if body is None:
+        return UserApiResponse.error_response(message=f"Imports are limited to {settings.IMPORT_MAX_BYTES} bytes.", status=413).model_dump()
+
+    return await run_in_threadpool(_import, str(db_user.data.id), body, dry_run, import_repository, job_repository)
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+
+from app.core.deps import get_user_repository, get_job_repository, verify_token
+from app.core.domain import Error
+from app.data.repository import UserRepository, JobRepository
+from app.domain.models import JobError, UserError
+from app.domain.use_case.job import read_job_by_id
+from app.domain.use_case.user.get_user import get_user
+from app.dtos import JobApiResponse
+from app.models import JobRead
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["job"],
+    responses={404: {"description": "Not found"}}
+)
+
+@router.get("/{jobid}", response_model=JobApiResponse[JobRead], response_model_exclude_none=True)
+def read_job(jobid: str, decoded_token: dict = Depends(verify_token), job_repository: JobRepository = Depends(get_job_repository), user_repository: UserRepository = Depends(get_user_repository)):
+    db_user = get_user(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return JobApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = read_job_by_id(jobid, str(db_user.data.id), job_repository)
+    if isinstance(result, Error):
+        if result.error == JobError.NOT_FOUND:
+            return JobApiResponse.error_response(message="Job not found.", status=404).model_dump()
+    return JobApiResponse.success_response(message="Job fetched successfully.", data=result.data).model_dump()
@@ -1,17 +1,20 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
-from app.core.deps import get_user_repository, get_note_repository, verify_token, get_topic_repository
+from app.core.deps import get_user_repository, get_note_repository, verify_token, get_topic_repository, get_embedding_repository, get_job_repository
+from app.core.config import settings
 from app.core.domain import Error
-from app.data.repository import UserRepository, NoteRepository, TopicRepository
+from app.core.embeddings import Embedder, get_embedder
+from app.core.jobs import enqueue
+from app.data.repository import UserRepository, NoteRepository, TopicRepository, NoteEmbeddingRepository, JobRepository
 from app.domain.models import UserError, TopicError
 from app.domain.models.note_errors import NoteError
-from app.domain.use_case.note import read_all_notes_by_topic_id, create_new_note, read_note_by_id, update_note_by_id, delete_note_by_id
+from app.domain.use_case.note import read_all_notes_by_topic_id, create_new_note, read_note_by_id, update_note_by_id, delete_note_by_id, read_similar_notes
 from app.domain.use_case.topic import read_topic_by_id
 from app.domain.use_case.user.get_user import get_user
 from app.dtos import NoteApiResponse
-from app.models import Note, NoteCreate, NoteRead, NoteUpdate, NoteReadWithTags
+from app.models import Note, NoteCreate, NoteRead, NoteUpdate, NoteReadWithTags, Page, SimilarNote, JobKind
 
 router = APIRouter(
     prefix="/notes",
@@ -19,8 +22,8 @@ router = APIRouter(
     responses={404: {"description": "Not found"}}
 )
 
-@router.get("/{topicId}", response_model=NoteApiResponse[List[NoteReadWithTags]], response_model_exclude_none=True)
-def read_all_notes(topicId: str, decoded_token : dict = Depends(verify_token), note_repository: NoteRepository = Depends(get_note_repository), user_repository: UserRepository = Depends(get_user_repository), topic_repository: TopicRepository = Depends(get_topic_repository)):
+@router.get("/{topicId}", response_model=NoteApiResponse[Page[NoteReadWithTags]], response_model_exclude_none=True)
+def read_all_notes(topicId: str, limit: int = Query(default=settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE), cursor: Optional[str] = None, decoded_token : dict = Depends(verify_token), note_repository: NoteRepository = Depends(get_note_repository), user_repository: UserRepository = Depends(get_user_repository), topic_repository: TopicRepository = Depends(get_topic_repository)):
     db_user = get_user(decoded_token, user_repository)
     if isinstance(db_user, Error):
         if db_user.error == UserError.NOT_FOUND:
@@ -31,14 +34,16 @@ def read_all_notes(topicId: str, decoded_token : dict = Depends(verify_token), n
         if db_topic.error == TopicError.NOT_FOUND:
             return NoteApiResponse.error_response(message="Topic not found.", status=404).model_dump()
 
-    result = read_all_notes_by_topic_id(topicId, str(db_user.data.id), note_repository)
+    result = read_all_notes_by_topic_id(topicId, str(db_user.data.id), note_repository, limit, cursor)
     if isinstance(result, Error):
         if result.error == NoteError.NOT_FOUND:
             return NoteApiResponse.error_response(message="Notes not found.", status=404).model_dump()
+        elif result.error == NoteError.INVALID_CURSOR:
+            return NoteApiResponse.error_response(message="Invalid cursor.", status=400).model_dump()
     return NoteApiResponse.success_response(message="Notes fetched successfully.", data=result.data).model_dump()
 
 @router.post("/", response_model=NoteApiResponse[NoteReadWithTags], response_model_exclude_none=True)
-def create_note(note: NoteCreate, decoded_token : dict = Depends(verify_token), note_repository: NoteRepository = Depends(get_note_repository), user_repository: UserRepository = Depends(get_user_repository), topic_repository: TopicRepository = Depends(get_topic_repository)):
+def create_note(note: NoteCreate, decoded_token : dict = Depends(verify_token), note_repository: NoteRepository = Depends(get_note_repository), user_repository: UserRepository = Depends(get_user_repository), topic_repository: TopicRepository = Depends(get_topic_repository), job_repository: JobRepository = Depends(get_job_repository)):
     db_user = get_user(decoded_token, user_repository)
     if isinstance(db_user, Error):
         if db_user.error == UserError.NOT_FOUND:
@@ -53,9 +58,25 @@ def create_note(note: NoteCreate, decoded_token : dict = Depends(verify_token),
     if isinstance(result, Error):
         if result.error == NoteError.INVALID_TAGS:
             return NoteApiResponse.error_response(message="Invalid tags provided.", status=400).model_dump()
-    
+
+    user_id = str(db_user.data.id)
+    enqueue(job_repository, JobKind.EMBED_NOTES, {"user_id": user_id}, user_id=user_id, dedupe_key=f"embed_notes:{user_id}")
     return NoteApiResponse.success_response(message="Note created successfully.", data=result.data).model_dump()
 
+@router.get("/similar/{noteid}", response_model=NoteApiResponse[List[SimilarNote]], response_model_exclude_none=True)
+def read_similar(noteid: str, limit: int = Query(default=10, ge=1, le=settings.MAX_PAGE_SIZE), decoded_token: dict = Depends(verify_token), embedding_repository: NoteEmbeddingRepository = Depends(get_embedding_repository), embedder: Embedder = Depends(get_embedder), user_repository: UserRepository = Depends(get_user_repository)):
+    db_user = get_user(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return NoteApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = read_similar_notes(noteid, str(db_user.data.id), embedding_repository, embedder, limit)
+    if isinstance(result, Error):
+        if result.error == NoteError.NOT_FOUND:
+            return NoteApiResponse.error_response(message="Note not found.", status=404).model_dump()
+
+    return NoteApiResponse.success_response(message="Similar notes fetched successfully.", data=result.data).model_dump()
+
 @router.get("/single/{noteid}", response_model=NoteApiResponse[NoteReadWithTags], response_model_exclude_none=True)
 def read_note(noteid: str, decoded_token: dict = Depends(verify_token), note_repository: NoteRepository = Depends(get_note_repository), user_repository: UserRepository = Depends(get_user_repository)):
     db_user = get_user(decoded_token, user_repository)
@@ -71,7 +92,7 @@ def read_note(noteid: str, decoded_token: dict = Depends(verify_token), note_rep
     return NoteApiResponse.success_response(message="Note fetched successfully.", data=result.data).model_dump()
 
 @router.patch("/{noteid}", response_model=NoteApiResponse[NoteReadWithTags], response_model_exclude_none=True)
-def update_note(noteid: str, note: NoteUpdate, decoded_token: dict = Depends(verify_token), note_repository: NoteRepository = Depends(get_note_repository), user_repository: UserRepository = Depends(get_user_repository)):
+def update_note(noteid: str, note: NoteUpdate, decoded_token: dict = Depends(verify_token), note_repository: NoteRepository = Depends(get_note_repository), user_repository: UserRepository = Depends(get_user_repository), job_repository: JobRepository = Depends(get_job_repository)):
     db_user = get_user(decoded_token, user_repository)
     if isinstance(db_user, Error):
         if db_user.error == UserError.NOT_FOUND:
@@ -83,7 +104,9 @@ def update_note(noteid: str, note: NoteUpdate, decoded_token: dict = Depends(ver
             return NoteApiResponse.error_response(message="Note not found.", status=404).model_dump()
         elif result.error == NoteError.INVALID_TAGS:
             return NoteApiResponse.error_response(message="Invalid tags provided.", status=400).model_dump()
-    
+
+    user_id = str(db_user.data.id)
+    enqueue(job_repository, JobKind.EMBED_NOTES, {"user_id": user_id}, user_id=user_id, dedupe_key=f"embed_notes:{user_id}")
     return NoteApiResponse.success_response(message="Note updated successfully.", data=result.data).model_dump()
 
 @router.delete("/{noteid}", response_model=NoteApiResponse[bool], response_model_exclude_none=True)
@@ -0,0 +1,50 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.deps import get_user_repository, get_search_repository, get_embedding_repository, verify_token
+from app.core.config import settings
+from app.core.domain import Error
+from app.core.embeddings import Embedder, get_embedder
+from app.data.repository import UserRepository
+from app.data.repository.search import SearchRepository
+from app.data.repository.embedding import NoteEmbeddingRepository
+from app.domain.models import SearchError, UserError
+from app.domain.use_case.search import search_notes_and_topics, semantic_search
+from app.domain.use_case.user.get_user import get_user
+from app.dtos import SearchApiResponse
+from app.models import Page, SearchHit, SemanticSearchRequest, SimilarNote
+
+router = APIRouter(
+    prefix="/search",
+    tags=["search"],
+    responses={404: {"description": "Not found"}}
+)
+
+@router.get("/", response_model=SearchApiResponse[Page[SearchHit]], response_model_exclude_none=True)
+def search(q: str = Query(max_length=200), limit: int = Query(default=settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE), cursor: Optional[str] = None, decoded_token: dict = Depends(verify_token), search_repository: SearchRepository = Depends(get_search_repository), user_repository: UserRepository = Depends(get_user_repository)):
+    db_user = get_user(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return SearchApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = search_notes_and_topics(str(db_user.data.id), q, search_repository, limit, cursor)
+    if isinstance(result, Error):
+        if result.error == SearchError.EMPTY_QUERY:
+            return SearchApiResponse.error_response(message="Search query is empty.", status=400).model_dump()
+        elif result.error == SearchError.INVALID_CURSOR:
+            return SearchApiResponse.error_response(message="Invalid cursor.", status=400).model_dump()
+    return SearchApiResponse.success_response(message="Search results fetched successfully.", data=result.data).model_dump()
+
+@router.post("/semantic", response_model=SearchApiResponse[List[SimilarNote]], response_model_exclude_none=True)
+def search_semantic(request: SemanticSearchRequest, decoded_token: dict = Depends(verify_token), embedding_repository: NoteEmbeddingRepository = Depends(get_embedding_repository), embedder: Embedder = Depends(get_embedder), user_repository: UserRepository = Depends(get_user_repository)):
+    db_user = get_user(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return SearchApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = semantic_search(str(db_user.data.id), request.query, embedding_repository, embedder, request.limit)
+    if isinstance(result, Error):
+        if result.error == SearchError.EMPTY_QUERY:
+            return SearchApiResponse.error_response(message="Search query is empty.", status=400).model_dump()
+    return SearchApiResponse.success_response(message="Similar notes fetched successfully.", data=result.data).model_dump()
@@ -1,8 +1,9 @@
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from app.core.deps import get_user_repository, get_tag_repository, verify_token
+from app.core.config import settings
 from app.core.domain import Error
 from app.data.repository import UserRepository
 from app.data.repository.tag import TagRepository
@@ -11,7 +12,7 @@ from app.domain.models.tag_errors import TagError
 from app.domain.use_case.tag import create_tag, read_all_tags_by_user, read_tag_by_id, update_tag_by_id, delete_tag_by_id
 from app.domain.use_case.user.get_user import get_user
 from app.dtos import TagApiResponse
-from app.models import NoteTag, NoteTagCreate, NoteTagRead, NoteTagUpdate
+from app.models import NoteTag, NoteTagCreate, NoteTagRead, NoteTagUpdate, Page
 
 router = APIRouter(
     prefix="/tags",
@@ -33,17 +34,19 @@ def create_new_tag(tag: NoteTagCreate, decoded_token: dict = Depends(verify_toke
     
     return TagApiResponse.success_response(message="Tag created successfully.", data=result.data).model_dump()
 
-@router.get("/", response_model=TagApiResponse[List[NoteTagRead]], response_model_exclude_none=True)
-def read_all_tags(decoded_token: dict = Depends(verify_token), tag_repository: TagRepository = Depends(get_tag_repository), user_repository: UserRepository = Depends(get_user_repository)):
+@router.get("/", response_model=TagApiResponse[Page[NoteTagRead]], response_model_exclude_none=True)
+def read_all_tags(limit: int = Query(default=settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE), cursor: Optional[str] = None, decoded_token: dict = Depends(verify_token), tag_repository: TagRepository = Depends(get_tag_repository), user_repository: UserRepository = Depends(get_user_repository)):
     db_user = get_user(decoded_token, user_repository)
     if isinstance(db_user, Error):
         if db_user.error == UserError.NOT_FOUND:
             return TagApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
 
-    result = read_all_tags_by_user(str(db_user.data.id), tag_repository)
+    result = read_all_tags_by_user(str(db_user.data.id), tag_repository, limit, cursor)
     if isinstance(result, Error):
         if result.error == TagError.EMPTY:
             return TagApiResponse.error_response(message="No tags found.", status=404).model_dump()
+        elif result.error == TagError.INVALID_CURSOR:
+            return TagApiResponse.error_response(message="Invalid cursor.", status=400).model_dump()
     
     return TagApiResponse.success_response(message="Tags fetched successfully.", data=result.data).model_dump()
 
@@ -1,17 +1,19 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Response
 from fastapi.params import Depends
 
-from app.core.deps import get_topic_repository, get_topic_edge_repository, verify_token, get_user_repository
-from app.core.domain import Error
-from app.data.repository import TopicRepository, TopicEdgeRepository, UserRepository
+from app.core.config import settings
+from app.core.deps import get_topic_repository, get_topic_edge_repository, verify_token, get_user_repository, get_job_repository
+from app.core.domain import Error, Success
+from app.core.jobs import enqueue
+from app.data.repository import TopicRepository, TopicEdgeRepository, UserRepository, JobRepository
 from app.domain.models import TopicError, UserError, TopicEdgeError
 from app.domain.use_case.topic import create_topic as create_topic_use_case, read_all_topics, read_topic_by_id, \
-    update_topic_by_id, delete_topic_by_id
+    update_topic_by_id, update_topic_positions, delete_topic_by_id, read_topic_graph
 from app.domain.use_case.user.get_user import get_user
 from app.dtos import TopicApiResponse
-from app.models import TopicCreate, TopicRead, TopicUpdate, TopicEdge, TopicEdgeCreate
+from app.models import TopicCreate, TopicRead, TopicUpdate, TopicEdge, TopicEdgeCreate, TopicEdgeRead, TopicGraphRead, TopicPositionUpdate, Page, JobKind
 
 router = APIRouter(
     prefix="/topics",
@@ -33,19 +35,47 @@ def create_topic(topic: TopicCreate, decoded_token: dict = Depends(verify_token)
     return TopicApiResponse.success_response(message="Topic created successfully.", data=topic).model_dump()
 
 
-@router.get("/", response_model=TopicApiResponse[List[TopicRead]], response_model_exclude_none=True)
-def read_topics(decoded_token : dict = Depends(verify_token), topic_repository: TopicRepository = Depends(get_topic_repository), user_repository: UserRepository = Depends(get_user_repository)):
+@router.get("/", response_model=TopicApiResponse[Page[TopicRead]], response_model_exclude_none=True)
+def read_topics(limit: int = Query(default=settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE), cursor: Optional[str] = None, decoded_token : dict = Depends(verify_token), topic_repository: TopicRepository = Depends(get_topic_repository), user_repository: UserRepository = Depends(get_user_repository)):
     db_user = get_user(decoded_token, user_repository)
     if isinstance(db_user, Error):
         if db_user.error == UserError.NOT_FOUND:
             return TopicApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
 
-    result = read_all_topics(db_user.data, topic_repository)
+    result = read_all_topics(db_user.data, topic_repository, limit, cursor)
     if isinstance(result, Error):
         if result.error == TopicError.EMPTY:
             return TopicApiResponse.error_response(message="No topics found.", status=404).model_dump()
+        elif result.error == TopicError.INVALID_CURSOR:
+            return TopicApiResponse.error_response(message="Invalid cursor.", status=400).model_dump()
     return TopicApiResponse.success_response(message="Topics fetched successfully.", data=result.data).model_dump()
 
+@router.get("/graph", response_model=TopicApiResponse[TopicGraphRead], response_model_exclude_none=True)
+def read_graph(include_description: bool = True, decoded_token: dict = Depends(verify_token), topic_repository: TopicRepository = Depends(get_topic_repository), topic_edge_repository: TopicEdgeRepository = Depends(get_topic_edge_repository), user_repository: UserRepository = Depends(get_user_repository)):
+    db_user = get_user(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return TopicApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = read_topic_graph(db_user.data, topic_repository, topic_edge_repository, include_description)
+    response = TopicApiResponse[TopicGraphRead].success_response(message="Topic graph fetched successfully.", data=result.data)
+    # The graph can hold thousands of nodes, so serialize it once here instead of
+    # round-tripping through model_dump() and response_model validation.
+    return Response(content=response.model_dump_json(exclude_none=True), media_type="application/json")
+
+@router.patch("/positions", response_model=TopicApiResponse[int], response_model_exclude_none=True)
+def update_positions(positions: List[TopicPositionUpdate], decoded_token: dict = Depends(verify_token), topic_repository: TopicRepository = Depends(get_topic_repository), user_repository: UserRepository = Depends(get_user_repository)):
+    db_user = get_user(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return TopicApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = update_topic_positions(str(db_user.data.id), positions, topic_repository)
+    if isinstance(result, Error):
+        if result.error == TopicError.NOT_FOUND:
+            return TopicApiResponse.error_response(message="Topic not found.", status=404).model_dump()
+    return TopicApiResponse.success_response(message="Topic positions updated successfully.", data=result.data).model_dump()
+
 @router.get("/{topicid}", response_model=TopicApiResponse[TopicRead], response_model_exclude_none=True)
 def read_topic(topicid: str, decoded_token : dict = Depends(verify_token), topic_repository: TopicRepository = Depends(get_topic_repository), user_repository: UserRepository = Depends(get_user_repository)):
     db_user = get_user(decoded_token, user_repository)
@@ -105,7 +135,10 @@ def create_topic_edge(edge_data: TopicEdgeCreate, decoded_token: dict = Depends(
         relation_type=edge_data.relation_type
     )
 
-    result = topic_edge_repository.create_edge(edge)
+    result = topic_edge_repository.create_edges(str(db_user.data.id), [edge])
+    if isinstance(result, Success) and not result.data:
+        # Nothing inserted: the pair already had an edge
+        result = Error(TopicEdgeError.ALREADY_EXISTS)
     if isinstance(result, Error):
         if result.error == TopicEdgeError.ALREADY_EXISTS:
             return TopicApiResponse.error_response(message="Edge already exists.", status=409).model_dump()
@@ -114,7 +147,25 @@ def create_topic_edge(edge_data: TopicEdgeCreate, decoded_token: dict = Depends(
         else:
             return TopicApiResponse.error_response(message="Failed to create edge.", status=500).model_dump()
 
-    return TopicApiResponse.success_response(message="Edge created successfully.", data=result.data).model_dump()
+    return TopicApiResponse.success_response(message="Edge created successfully.", data=result.data[0]).model_dump()
+
+@router.post("/topic-edges/bulk", response_model=TopicApiResponse[List[TopicEdgeRead]], response_model_exclude_none=True)
+def create_topic_edges(edges_data: List[TopicEdgeCreate], decoded_token: dict = Depends(verify_token), topic_edge_repository: TopicEdgeRepository = Depends(get_topic_edge_repository), user_repository: UserRepository = Depends(get_user_repository)):
+    db_user = get_user(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if db_user.error == UserError.NOT_FOUND:
+            return TopicApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    edges = [TopicEdge(**edge_data.model_dump()) for edge_data in edges_data]
+
+    result = topic_edge_repository.create_edges(str(db_user.data.id), edges)
+    if isinstance(result, Error):
+        if result.error == TopicEdgeError.INVALID_EDGE:
+            return TopicApiResponse.error_response(message="Invalid edge.", status=400).model_dump()
+        else:
+            return TopicApiResponse.error_response(message="Failed to create edges.", status=500).model_dump()
+
+    return TopicApiResponse.success_response(message="Edges created successfully.", data=result.data).model_dump()
 
 @router.delete("/topic-edges/{source_id}/{target_id}", response_model=TopicApiResponse, response_model_exclude_none=True)
 def delete_topic_edge(source_id: str, target_id: str, decoded_token: dict = Depends(verify_token), topic_edge_repository: TopicEdgeRepository = Depends(get_topic_edge_repository), user_repository: UserRepository = Depends(get_user_repository)):
@@ -124,20 +175,27 @@ def delete_topic_edge(source_id: str, target_id: str, decoded_token: dict = Depe
             return TopicApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
 
     # Delete the edge
-    result = topic_edge_repository.delete_edge_by_source_target(source_id, target_id)
+    result = topic_edge_repository.delete_edge_by_source_target(source_id, target_id, str(db_user.data.id))
     if not result:
         return TopicApiResponse.error_response(message="Edge not found.", status=404).model_dump()
 
     return TopicApiResponse.success_response(message="Edge deleted successfully.", data=True).model_dump()
 
 @router.delete("/{topicid}", response_model=TopicApiResponse[bool], response_model_exclude_none=True)
-def delete_topic(topicid: str, decoded_token : dict = Depends(verify_token), topic_repository: TopicRepository = Depends(get_topic_repository), user_repository: UserRepository = Depends(get_user_repository)):
+def delete_topic(topicid: str, response: Response, decoded_token : dict = Depends(verify_token), topic_repository: TopicRepository = Depends(get_topic_repository), user_repository: UserRepository = Depends(get_user_repository), job_repository: JobRepository = Depends(get_job_repository)):
     db_user = get_user(decoded_token, user_repository)
     if isinstance(db_user, Error):
         if db_user.error == UserError.NOT_FOUND:
             return TopicApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
 
-    result = delete_topic_by_id(topicid, str(db_user.data.id), topic_repository)
+    user_id = str(db_user.data.id)
+    # Very large topics are removed chunk by chunk by a background job
+    if topic_repository.has_at_least_notes(topicid, user_id, settings.BACKGROUND_DELETE_MIN_NOTES):
+        job_id = enqueue(job_repository, JobKind.DELETE_TOPIC, {"topic_id": topicid, "user_id": user_id}, user_id=user_id, dedupe_key=f"delete_topic:{topicid}")
+        response.headers["Location"] = f"{settings.API_V1_STR}/jobs/{job_id}"
+        return TopicApiResponse.success_response(message="Topic deletion scheduled.", data=True, status=202).model_dump()
+
+    result = delete_topic_by_id(topicid, user_id, topic_repository)
     if isinstance(result, Error):
         if result.error == TopicError.NOT_FOUND:
             return TopicApiResponse.error_response(message="Topic not found.", status=404).model_dump()
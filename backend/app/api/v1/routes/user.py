@@ -1,14 +1,24 @@
-from fastapi import APIRouter, Depends
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
 from app.core import get_session
-from app.core.deps import get_user_repository, verify_token
+from app.core.cache import invalidate_user
+from app.core.deps import get_user_repository, get_job_repository, verify_token
+from app.core.database import new_snapshot_session
 from app.core.domain import Error
-from app.data.repository import UserRepository
+from app.core.jobs import enqueue
+from app.data.repository import UserRepository, JobRepository
 from app.domain.models import UserError
+from app.domain.use_case.user.export_user_data import export_user_data
 from app.domain.use_case.user.get_user import get_user
+from app.domain.use_case.user.get_user_stats import get_user_stats
 from app.dtos import UserApiResponse
-from app.models import UserRead
+from app.models import UserRead, UserStatsRead, JobKind
+from app.util.compression import FORMATS
 
 router = APIRouter(
     prefix="/user",
@@ -31,3 +41,47 @@ async def read_user(session: Session = Depends(get_session), decoded_token: dict
     )
 
     return UserApiResponse.success_response(message="Fetched user successfully", data=user_response).model_dump()
+
+
+@router.get("/stats", response_model=UserApiResponse[UserStatsRead], response_model_exclude_none=True)
+def read_user_stats(recent_limit: int = Query(default=3, ge=0, le=50), decoded_token: dict = Depends(verify_token), user_repository: UserRepository = Depends(get_user_repository)):
+    db_user = get_user(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if UserError.NOT_FOUND == db_user.error:
+            return UserApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    result = get_user_stats(db_user.data, user_repository, recent_limit)
+    return UserApiResponse.success_response(message="Fetched user stats successfully", data=result.data).model_dump()
+
+
+@router.get("/export", response_model=None)
+def export_account(compression: Literal["none", "gzip", "zstd"] = "none", decoded_token: dict = Depends(verify_token), user_repository: UserRepository = Depends(get_user_repository)):
+    db_user = get_user(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if UserError.NOT_FOUND == db_user.error:
+            return UserApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    # Streamed from its own snapshot session: the request's session is closed
+    # before the body is sent
+    result = export_user_data(str(db_user.data.id), new_snapshot_session, compression)
+    if isinstance(result, Error):
+        if result.error == UserError.UNSUPPORTED_COMPRESSION:
+            return UserApiResponse.error_response(message="zstd compression is not available.", status=400).model_dump()
+
+    media_type, extension = FORMATS[compression]
+    filename = f"neuronotes-export-{date.today():%Y%m%d}.ndjson{extension}"
+    return StreamingResponse(result.data, media_type=media_type, headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
+
+@router.delete("/", response_model=UserApiResponse[bool], response_model_exclude_none=True)
+def delete_account(decoded_token: dict = Depends(verify_token), user_repository: UserRepository = Depends(get_user_repository), job_repository: JobRepository = Depends(get_job_repository)):
+    db_user = get_user(decoded_token, user_repository)
+    if isinstance(db_user, Error):
+        if UserError.NOT_FOUND == db_user.error:
+            return UserApiResponse.error_response(message="Unauthorized.", status=401).model_dump()
+
+    # An account can own an arbitrarily large tree, so it is always removed in chunks
+    user_id = str(db_user.data.id)
+    enqueue(job_repository, JobKind.DELETE_USER, {"user_id": user_id}, user_id=user_id, dedupe_key=f"delete_user:{user_id}")
+    invalidate_user(user_id)
+    return UserApiResponse.success_response(message="Account deletion scheduled.", data=True, status=202).model_dump()
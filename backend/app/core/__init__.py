@@ -1,5 +1,5 @@
 from .database import get_session
 from .security import create_access_token
-from .exceptions import validation_exception_handler
+from .exceptions import validation_exception_handler, integrity_error_handler
 
-__all__ = ["get_session", "create_access_token", "validation_exception_handler"]
\ No newline at end of file
+__all__ = ["get_session", "create_access_token", "validation_exception_handler", "integrity_error_handler"]
\ No newline at end of file
@@ -0,0 +1,36 @@
+# app/core/cache.py
+from app.core.config import settings
+from app.util import TTLCache
+
+# Per-user dashboard stats, keyed by user id
+stats_cache = TTLCache(
+    maxsize=settings.STATS_CACHE_MAX_ENTRIES,
+    ttl=settings.STATS_CACHE_TTL_SECONDS,
+)
+
+# Decoded JWT claims, keyed by a SHA-256 hash of the raw token
+token_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+# Detached snapshots of users known to exist, keyed by user id string
+user_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+# Clients that wrote recently, keyed by a SHA-256 hash of their Authorization
+# header; their reads stay on the primary until the entry expires
+recent_writers = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.READ_YOUR_WRITES_SECONDS,
+)
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop a user from this process's principal cache, e.g. once the account is being deleted.
+
+    Other processes keep serving their copy for up to PRINCIPAL_CACHE_TTL_SECONDS.
+    """
+    user_cache.invalidate(str(user_id))
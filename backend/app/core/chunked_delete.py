@@ -0,0 +1,60 @@
+# app/core/chunked_delete.py
+from sqlalchemy import delete, or_
+from sqlmodel import select
+
+from app.core.config import settings
+from app.core.database import new_session
+from app.models import Note, NoteTag, Topic, TopicEdge, User
+
+
+class ChunkedDeleter:
+    """Deletes large subtrees a chunk at a time, one short transaction per chunk.
+
+    A single DELETE of a topic with hundreds of thousands of notes cascades
+    through every note and tag link inside one transaction, holding row locks
+    and growing WAL until it finishes. Here children are removed in batches of
+    `chunk_size` rows and the parent row last, so each transaction stays small
+    and concurrent requests only ever wait on one chunk.
+    """
+
+    def __init__(self, session_factory, chunk_size: int):
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+
+    def _drain(self, model, *criteria) -> int:
+        total = 0
+        while True:
+            with self.session_factory() as session:
+                batch = select(model.id).where(*criteria).limit(self.chunk_size)
+                deleted = session.exec(
+                    delete(model)
+                    .where(model.id.in_(batch.scalar_subquery()))
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                session.commit()
+            total += deleted
+            if deleted < self.chunk_size:
+                return total
+
+    def delete_topic(self, topic_id: str, user_id: str) -> bool:
+        with self.session_factory() as session:
+            owned = session.exec(select(Topic.id).where(Topic.id == topic_id, Topic.user_id == user_id)).first()
+        if owned is None:
+            return False
+
+        self._drain(Note, Note.topic_id == topic_id, Note.user_id == user_id)
+        self._drain(TopicEdge, or_(TopicEdge.source == topic_id, TopicEdge.target == topic_id))
+        self._drain(Topic, Topic.id == topic_id, Topic.user_id == user_id)
+        return True
+
+    def delete_user(self, user_id: str) -> bool:
+        user_topics = select(Topic.id).where(Topic.user_id == user_id)
+
+        self._drain(Note, Note.user_id == user_id)
+        self._drain(TopicEdge, or_(TopicEdge.source.in_(user_topics), TopicEdge.target.in_(user_topics)))
+        self._drain(NoteTag, NoteTag.user_id == user_id)
+        self._drain(Topic, Topic.user_id == user_id)
+        return self._drain(User, User.id == user_id) > 0
+
+
+chunked_deleter = ChunkedDeleter(new_session, settings.DELETE_CHUNK_SIZE)
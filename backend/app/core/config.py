@@ -5,9 +5,61 @@ from typing import Optional
 
 class Settings(BaseSettings):
     # Database settings
+    # A postgresql:// URL, or sqlite:///path/to/file.db for the embedded
+    # single-user mode (sqlite:// keeps everything in memory)
     DATABASE_URL: str
     ASYNC_DATABASE_URL: Optional[str] = None
     DATABASE_ECHO: bool = False
+    # Serve read endpoints from native async handlers on the asyncpg engine
+    ASYNC_ROUTES: bool = False
+    # UUID version for new primary keys: 4 (random) or 7 (time-ordered)
+    ID_UUID_VERSION: int = 4
+
+    # Connection pool, applied to the sync and the async engine separately, so
+    # each worker process holds up to 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    # connections. Size against Postgres max_connections.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    # Seconds to wait for a free connection before failing the checkout
+    DB_POOL_TIMEOUT: float = 30.0
+    # Seconds after which a connection is replaced on its next checkout (-1 disables)
+    DB_POOL_RECYCLE: int = 300
+    # Test each connection with a round trip on checkout. When off, dead
+    # connections are detected on first use and the pool is invalidated.
+    DB_POOL_PRE_PING: bool = True
+    # Expose live pool metrics at /internal/pool-metrics. Off by default: the
+    # endpoint reveals load and replica layout, so only enable it where it
+    # can't be reached from outside, and/or set a token.
+    POOL_METRICS_ENABLED: bool = False
+    # When set, /internal/pool-metrics requires it in the X-Metrics-Token header
+    POOL_METRICS_TOKEN: Optional[str] = None
+
+    # Read replicas for GET requests, as a JSON list of database URLs
+    READ_REPLICA_URLS: list[str] = []
+    # Seconds between health checks of each replica
+    READ_REPLICA_CHECK_INTERVAL_SECONDS: float = 5.0
+    # Replicas further behind the primary than this are skipped (Postgres only)
+    READ_REPLICA_MAX_LAG_SECONDS: float = 10.0
+    # After a write, the same client's reads stay on the primary for this long
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    @staticmethod
+    def to_async_url(url: str) -> str:
+        """Convert postgres[ql] scheme variants to asyncpg, and sqlite to aiosqlite."""
+        if url.startswith("sqlite://"):
+            return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+        if url.startswith("postgresql://"):
+            return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+        if url.startswith("postgres://"):
+            return url.replace("postgres://", "postgresql+asyncpg://", 1)
+        return url
+
+    @staticmethod
+    def to_sync_url(url: str) -> str:
+        """Normalize 'postgres://' to 'postgresql://' for SQLAlchemy/psycopg."""
+        if url.startswith("postgres://"):
+            return url.replace("postgres://", "postgresql://", 1)
+        return url
 
     @property
     def async_database_url(self) -> str:
@@ -18,31 +70,31 @@ class Settings(BaseSettings):
         """
         if self.ASYNC_DATABASE_URL:
             return self.ASYNC_DATABASE_URL
-
-        url = self.DATABASE_URL
-        # Normalize any postgres scheme variants to asyncpg
-        if url.startswith("postgresql://"):
-            return url.replace("postgresql://", "postgresql+asyncpg://", 1)
-        if url.startswith("postgres://"):
-            return url.replace("postgres://", "postgresql+asyncpg://", 1)
-        return url
+        return self.to_async_url(self.DATABASE_URL)
 
     @property
     def sync_database_url(self) -> str:
-        """Return a sync-compatible DB URL for SQLAlchemy/psycopg.
-
-        Normalizes 'postgres://' to 'postgresql://' as needed.
-        """
-        url = self.DATABASE_URL
-        if url.startswith("postgres://"):
-            return url.replace("postgres://", "postgresql://", 1)
-        return url
+        """Return a sync-compatible DB URL for SQLAlchemy/psycopg."""
+        return self.to_sync_url(self.DATABASE_URL)
 
     # Security settings
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Password hashing
+    BCRYPT_ROUNDS: int = 12
+    HASH_WORKERS: int = 2
+    HASH_MAX_PENDING: int = 16
+
+    # Authenticated principal cache (0 disables caching). The cache is per
+    # process: deleting an account clears it only in the process that handles
+    # the request and the one that runs the job, so other processes keep
+    # accepting the user's tokens for up to the TTL. Writes in that window
+    # fail on the user_id foreign key and are answered with 401.
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+
     # API settings
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "NeuroNotes"
@@ -81,9 +133,39 @@ class Settings(BaseSettings):
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
 
-    # Vector embeddings (if using OpenAI or similar)
+    # Deletes: topics with at least this many notes, and whole accounts, are
+    # removed in the background in chunks of DELETE_CHUNK_SIZE rows
+    BACKGROUND_DELETE_MIN_NOTES: int = 5000
+    DELETE_CHUNK_SIZE: int = 1000
+
+    # Bulk import: largest NDJSON body POST /import accepts, after decompression
+    IMPORT_MAX_BYTES: int = 100 * 1024 * 1024
+
+    # Dashboard stats cache (0 disables caching)
+    STATS_CACHE_TTL_SECONDS: int = 0
+    STATS_CACHE_MAX_ENTRIES: int = 1024
+
+    # Background jobs: JOB_WORKERS threads per process run jobs from the jobs
+    # table (0 runs none here; jobs then wait for a process that does). Failed
+    # jobs are retried up to JOB_MAX_ATTEMPTS times, the delay doubling from
+    # JOB_RETRY_BASE_SECONDS up to JOB_RETRY_MAX_SECONDS. A job still running
+    # after JOB_LEASE_SECONDS is taken to have lost its worker and is rerun.
+    JOB_WORKERS: int = 2
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: float = 10.0
+    JOB_RETRY_MAX_SECONDS: float = 900.0
+    JOB_LEASE_SECONDS: int = 900
+    JOB_RETENTION_HOURS: int = 72
+    JOB_SHUTDOWN_TIMEOUT_SECONDS: float = 30.0
+
+    # Vector embeddings for semantic search. "hashed" works offline; "openai"
+    # needs OPENAI_API_KEY and a model that accepts a `dimensions` parameter.
+    EMBEDDING_PROVIDER: str = "hashed"
     OPENAI_API_KEY: Optional[str] = None
-    EMBEDDING_MODEL: str = "text-embedding-ada-002"
+    EMBEDDING_MODEL: str = "text-embedding-3-small"
+    # Notes embedded per batch (one embedder call and one transaction each)
+    EMBEDDING_BATCH_SIZE: int = 64
 
     class Config:
         env_file = ".env"
@@ -1,65 +1,285 @@
 # app/core/database.py
-from typing import Generator, AsyncGenerator
+import hashlib
+import threading
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Generator, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from fastapi import Request
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 from sqlmodel import SQLModel, create_engine, Session
+from starlette.concurrency import run_in_threadpool
 
+from .cache import recent_writers
 from .config import settings
+from .pool_metrics import PoolMetrics, instrumented_pool, pool_metrics
+from .replicas import Replica, ReplicaSet
 
-# Create sync engine for regular operations
-engine = create_engine(
-    settings.sync_database_url,
-    echo=settings.DATABASE_ECHO,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=5,
-    pool_recycle=300,
-)
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlmodel.ext.asyncio.session import AsyncSession
 
-# Create async engine for async operations (if needed)
-async_engine = create_async_engine(
-    settings.async_database_url,
-    echo=settings.DATABASE_ECHO,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=5,
-    pool_recycle=300,
+# Shared by all engines; each keeps its own pool
+pool_options = dict(
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
 
-# Create session makers
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-    class_=Session,
-)
+# Requests served from a read replica when one is configured
+READ_METHODS = {"GET", "HEAD"}
+
+# Engines are built on first use, so importing this module doesn't load a
+# database driver, and a process that never touches the async engine never
+# imports asyncpg.
+_engines: dict = {}
+_engines_lock = threading.Lock()
+
+_session_factory = sessionmaker(autocommit=False, autoflush=False, class_=Session)
+_async_session_factory = None
+
+
+def _metrics(name: str) -> PoolMetrics:
+    return pool_metrics.setdefault(name, PoolMetrics(name))
+
+
+# Applied to every SQLite connection: WAL lets readers run alongside the
+# writer, NORMAL sync is durable in WAL mode without an fsync per commit, and
+# the cache/mmap sizes keep a single-user database in memory.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY",
+    "cache_size": -64000,
+    "mmap_size": 268435456,
+}
+
+
+def is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _configure_sqlite(engine: Engine) -> None:
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        # Stop the driver from managing transactions itself, so that SQLAlchemy's
+        # BEGIN below and SAVEPOINTs for begin_nested() behave as on Postgres
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(connection):
+        # IMMEDIATE takes the write lock up front, waiting up to busy_timeout
+        # for it. A deferred transaction that reads and then writes fails at
+        # once with "database is locked" if another connection (e.g. a job
+        # worker) committed in between, because its snapshot is out of date.
+        # Read-only snapshot sessions stay deferred so they never block writers.
+        if connection.get_execution_options().get("sqlite_deferred"):
+            connection.exec_driver_sql("BEGIN")
+        else:
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def _sqlite_pool_options(name: str, url: str, pool_class) -> dict:
+    if url.split("?")[0].endswith(("://", ":memory:")):
+        # One shared connection, or every checkout would see a new empty database
+        return {"poolclass": StaticPool}
+    return {"poolclass": instrumented_pool(pool_class, _metrics(name)), **pool_options}
+
+
+def _build_engine(name: str, url: str) -> Engine:
+    if is_sqlite(url):
+        engine = create_engine(
+            url,
+            echo=settings.DATABASE_ECHO,
+            connect_args={"check_same_thread": False},
+            **_sqlite_pool_options(name, url, QueuePool),
+        )
+        _configure_sqlite(engine)
+        return engine
+    return create_engine(
+        url,
+        echo=settings.DATABASE_ECHO,
+        poolclass=instrumented_pool(QueuePool, _metrics(name)),
+        **pool_options,
+    )
+
+
+def _build_async_engine(name: str, url: str) -> "AsyncEngine":
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    if is_sqlite(url):
+        engine = create_async_engine(
+            url,
+            echo=settings.DATABASE_ECHO,
+            **_sqlite_pool_options(name, url, AsyncAdaptedQueuePool),
+        )
+        _configure_sqlite(engine.sync_engine)
+        return engine
+    return create_async_engine(
+        url,
+        echo=settings.DATABASE_ECHO,
+        poolclass=instrumented_pool(AsyncAdaptedQueuePool, _metrics(name)),
+        **pool_options,
+    )
+
+
+def _cached_engine(name: str, build: Callable, url: str):
+    engine = _engines.get(name)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(name)
+            if engine is None:
+                engine = _engines[name] = build(name, url)
+    return engine
+
+
+def get_engine() -> Engine:
+    """Return the sync engine for the primary, creating it on first call."""
+    return _cached_engine("sync", _build_engine, settings.sync_database_url)
+
+
+def get_async_engine() -> "AsyncEngine":
+    """Return the async engine for the primary, creating it on first call."""
+    return _cached_engine("async", _build_async_engine, settings.async_database_url)
+
 
-AsyncSessionLocal = async_sessionmaker(
-    async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
+def _async_sessions(engine: "AsyncEngine") -> "AsyncSession":
+    global _async_session_factory
+
+    if _async_session_factory is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        from sqlmodel.ext.asyncio.session import AsyncSession
+
+        _async_session_factory = async_sessionmaker(class_=AsyncSession, expire_on_commit=False)
+    return _async_session_factory(bind=engine)
+
+
+def new_session() -> Session:
+    """Open a session on the primary's sync engine."""
+    return _session_factory(bind=get_engine())
+
+
+def new_snapshot_session() -> Session:
+    """Open a read-only session on the primary whose queries all see one snapshot.
+
+    For long reads that span several queries, like exports. On Postgres the
+    transaction is REPEATABLE READ; a SQLite WAL reader already keeps the
+    snapshot of its first read.
+    """
+    engine = get_engine()
+    if engine.dialect.name == "sqlite":
+        return _session_factory(bind=engine.execution_options(sqlite_deferred=True))
+    return _session_factory(bind=engine.execution_options(isolation_level="REPEATABLE READ", postgresql_readonly=True))
+
+
+def new_async_session() -> "AsyncSession":
+    """Open a session on the primary's async engine."""
+    return _async_sessions(get_async_engine())
+
+
+read_replicas = ReplicaSet(
+    [settings.to_sync_url(url) for url in settings.READ_REPLICA_URLS],
+    engine_factory=_build_engine,
+    check_interval=settings.READ_REPLICA_CHECK_INTERVAL_SECONDS,
+    max_lag=settings.READ_REPLICA_MAX_LAG_SECONDS,
 )
 
 
+def _async_replica_engine(replica: Replica) -> "AsyncEngine":
+    return _cached_engine(f"replica-{replica.index}-async", _build_async_engine, settings.to_async_url(replica.url))
+
+
+def _client_key(request: Request) -> Optional[str]:
+    authorization = request.headers.get("Authorization")
+    if not authorization:
+        return None
+    return hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+
+
+def _reads_from_replica(request: Request) -> bool:
+    """GETs go to a replica, unless the same client wrote within READ_YOUR_WRITES_SECONDS."""
+    if not read_replicas or request.method not in READ_METHODS:
+        return False
+    key = _client_key(request)
+    return key is None or recent_writers.get(key) is None
+
+
+def _record_write(request: Request) -> None:
+    if request.method not in READ_METHODS:
+        key = _client_key(request)
+        if key is not None:
+            recent_writers.set(key, True)
+
+
+def _open_session(request: Request) -> Session:
+    if _reads_from_replica(request):
+        replica = read_replicas.pick()
+        if replica is not None:
+            session = _session_factory(bind=read_replicas.engine_for(replica))
+            try:
+                # Connect now, so an unreachable replica falls back to the
+                # primary instead of failing the request mid-way
+                session.connection()
+                return session
+            except SQLAlchemyError:
+                session.close()
+                read_replicas.mark_failed(replica)
+    return new_session()
+
+
+async def _open_async_session(request: Request) -> "AsyncSession":
+    if _reads_from_replica(request):
+        # Health checks use the sync engine, so keep them off the event loop
+        replica = await run_in_threadpool(read_replicas.pick)
+        if replica is not None:
+            session = _async_sessions(_async_replica_engine(replica))
+            try:
+                await session.connection()
+                return session
+            except (SQLAlchemyError, OSError):
+                await session.close()
+                read_replicas.mark_failed(replica)
+    return new_async_session()
+
+
 def create_db_and_tables():
-    """Create database tables. Use this in main.py startup event."""
-    SQLModel.metadata.create_all(engine)
+    """Create database tables directly from the models, bypassing migrations."""
+    SQLModel.metadata.create_all(get_engine())
 
 
-def get_session() -> Generator[Session, None, None]:
+def get_session(request: Request) -> Generator[Session, None, None]:
     """
     Dependency to get database session.
     Use this as a FastAPI dependency.
 
+    The session is the request's unit of work: repositories only flush, and
+    everything they staged is committed here once the endpoint returns, or
+    rolled back if it raises.
+
+    With READ_REPLICA_URLS set, GET requests read from a healthy replica.
+    Other methods, and GETs from a client that wrote within
+    READ_YOUR_WRITES_SECONDS, use the primary.
+
     Example usage:
     @app.get("/users/")
     def get_users(session: Session = Depends(get_session)):
         ...
     """
-    with SessionLocal() as session:
+    with _open_session(request) as session:
         try:
             yield session
+            session.commit()
+            _record_write(request)
         except Exception:
             session.rollback()
             raise
@@ -67,7 +287,7 @@ def get_session() -> Generator[Session, None, None]:
             session.close()
 
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_async_session(request: Request) -> AsyncGenerator["AsyncSession", None]:
     """
     Async dependency to get database session.
     Use this for async endpoints.
@@ -77,9 +297,10 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     async def get_users(session: AsyncSession = Depends(get_async_session)):
         ...
     """
-    async with AsyncSessionLocal() as session:
+    async with await _open_async_session(request) as session:
         try:
             yield session
+            await session.commit()
         except Exception:
             await session.rollback()
             raise
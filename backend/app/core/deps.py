@@ -1,23 +1,28 @@
 # app/api/deps.py
-from typing import Generator
+from typing import Generator, AsyncGenerator
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-import jwt  # <-- using PyJWT
 from jwt import PyJWTError  # Base class for all errors
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from uuid import UUID
 
-from app.core.database import get_session
-from app.core.config import settings
+from app.core.database import get_session, get_async_session
+from app.core.security import decode_token
 from app.data.repository import UserRepository, TopicRepository, TopicEdgeRepository, NoteRepository
 from app.data.repository.tag import TagRepository
+from app.data.repository.search import SearchRepository
+from app.data.repository.embedding import NoteEmbeddingRepository
+from app.data.repository.job import JobRepository
+from app.data.repository.data_import import ImportRepository
+from app.data.async_repository import AsyncUserRepository, AsyncTopicRepository, AsyncTopicEdgeRepository, AsyncNoteRepository, AsyncTagRepository
 from app.models.user import User
 
 # Security scheme
 security = HTTPBearer()
 
 
-def verify_token(req: Request):
+async def verify_token(req: Request):
     if "Authorization" not in req.headers:
         raise HTTPException(
             status_code=401,
@@ -31,7 +36,7 @@ def verify_token(req: Request):
             detail="Could not validate credentials.",
         )
     try:
-        decoded_token = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        decoded_token = decode_token(token)
         return decoded_token
     except PyJWTError:
         raise HTTPException(
@@ -39,9 +44,15 @@ def verify_token(req: Request):
             detail="Could not validate credentials.",
         )
 
-def get_db() -> Generator[Session, None, None]:
+def get_db(request: Request) -> Generator[Session, None, None]:
     """Database session dependency - alias for get_session for convenience."""
-    yield from get_session()
+    yield from get_session(request)
+
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Async database session dependency - alias for get_async_session for convenience."""
+    async for session in get_async_session(request):
+        yield session
 
 
 def get_current_user_id(
@@ -58,11 +69,7 @@ def get_current_user_id(
     )
 
     try:
-        payload = jwt.decode(
-            credentials.credentials,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-        )
+        payload = decode_token(credentials.credentials)
         user_id: str | None = payload.get("userId")
         if user_id is None:
             raise credentials_exception
@@ -111,4 +118,31 @@ def get_tag_repository(session: Session = Depends(get_db)):
     return TagRepository(session)
 
 def get_topic_edge_repository(session: Session = Depends(get_db)):
-    return TopicEdgeRepository(session)
\ No newline at end of file
+    return TopicEdgeRepository(session)
+
+def get_search_repository(session: Session = Depends(get_db)):
+    return SearchRepository(session)
+
+def get_embedding_repository(session: Session = Depends(get_db)):
+    return NoteEmbeddingRepository(session)
+
+def get_job_repository(session: Session = Depends(get_db)):
+    return JobRepository(session)
+
+def get_import_repository(session: Session = Depends(get_db)):
+    return ImportRepository(session)
+
+async def get_async_user_repository(session: AsyncSession = Depends(get_async_db)):
+    return AsyncUserRepository(session)
+
+async def get_async_topic_repository(session: AsyncSession = Depends(get_async_db)):
+    return AsyncTopicRepository(session)
+
+async def get_async_note_repository(session: AsyncSession = Depends(get_async_db)):
+    return AsyncNoteRepository(session)
+
+async def get_async_tag_repository(session: AsyncSession = Depends(get_async_db)):
+    return AsyncTagRepository(session)
+
+async def get_async_topic_edge_repository(session: AsyncSession = Depends(get_async_db)):
+    return AsyncTopicEdgeRepository(session)
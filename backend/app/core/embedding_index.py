@@ -0,0 +1,46 @@
+# app/core/embedding_index.py
+from typing import Optional
+
+from app.core.config import settings
+from app.core.database import new_session
+from app.core.embeddings import get_embedder, note_text
+from app.data.repository import NoteEmbeddingRepository
+
+
+class EmbeddingIndexer:
+    """Keeps note_embeddings in step with notes, a batch at a time.
+
+    Runs as an embed_notes job after a note is created or updated. Instead of
+    embedding the one note that changed, it embeds every stale note of that
+    user in batches of `batch_size`: one embedder call per batch, and the
+    database is only touched in short transactions before and after it.
+    Saves that arrive while a job is queued share that job.
+    """
+
+    def __init__(self, session_factory, batch_size: int):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+
+    def index_stale(self, user_id: Optional[str] = None) -> int:
+        """Embed stale notes (of one user, or everyone) until none are left"""
+        embedder = get_embedder()
+        total = 0
+        while True:
+            with self.session_factory() as session:
+                notes = NoteEmbeddingRepository(session).stale_notes(embedder.name, self.batch_size, user_id)
+            if not notes:
+                return total
+
+            vectors = embedder.embed([note_text(title, content) for _, title, content, _ in notes])
+            rows = [(note_id, updated_at, vector) for (note_id, _, _, updated_at), vector in zip(notes, vectors)]
+            # A note deleted mid-batch fails the whole batch; the job is retried
+            # and the note is no longer there to embed
+            with self.session_factory() as session:
+                NoteEmbeddingRepository(session).save_vectors(embedder.name, rows)
+                session.commit()
+            total += len(rows)
+            if len(notes) < self.batch_size:
+                return total
+
+
+embedding_indexer = EmbeddingIndexer(new_session, settings.EMBEDDING_BATCH_SIZE)
@@ -0,0 +1,146 @@
+# app/core/embeddings.py
+import hashlib
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import httpx
+import numpy as np
+
+from app.core.config import settings
+from app.models import EMBEDDING_DIMENSIONS
+
+_WORD = re.compile(r"\w+")
+
+# Words too common to say anything about a note; left out of the hashed embedding
+STOPWORDS = frozenset("""
+a about an and are as at be but by can do for from has have how i if in into is it its
+my no not of on or our so than that the their then there these this to was we were what
+when which who will with you your
+""".split())
+
+# Relative weight of each feature kind in the hashed embedding. Character
+# trigrams let "network" and "networks" (or a typo) land near each other,
+# without outweighing whole-word matches.
+WORD_WEIGHT = 1.0
+BIGRAM_WEIGHT = 1.0
+TRIGRAM_WEIGHT = 0.5
+
+
+def note_text(title: Optional[str], content: str) -> str:
+    """The text of a note that gets embedded"""
+    return f"{title}\n{content}" if title else content
+
+
+class Embedder(ABC):
+    """Turns texts into fixed-size, L2-normalised vectors.
+
+    `name` is stored with every vector. Vectors are only ever compared with
+    vectors from the same embedder, and changing it makes every note stale.
+    """
+
+    name: str
+    dimensions: int
+
+    @abstractmethod
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """One row per text, shape (len(texts), dimensions)"""
+
+
+def _normalise(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    # Texts with no words stay all-zero rather than dividing by zero
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+@lru_cache(maxsize=1 << 16)
+def _feature_hash(feature: str) -> int:
+    # Python's hash() is salted per process; vectors are stored, so this must be stable
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+
+
+class HashedNgramEmbedder(Embedder):
+    """Offline embedder using the hashing trick; needs no model download or network.
+
+    Words (minus stopwords), word bigrams and character trigrams are hashed
+    into `dimensions` signed buckets, counts are log-scaled and the vector is
+    normalised, so cosine similarity measures shared vocabulary. It captures
+    lexical overlap only, not synonyms.
+    """
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+        # Bump the version whenever the features change, so stored vectors are redone
+        self.name = f"hashed-ngrams-v1-{dimensions}"
+
+    @staticmethod
+    def _features(text: str) -> tuple[List[str], List[float]]:
+        words = [word for word in _WORD.findall(text.lower()) if word not in STOPWORDS]
+        features = list(words)
+        weights = [WORD_WEIGHT] * len(words)
+
+        bigrams = [f"{a} {b}" for a, b in zip(words, words[1:])]
+        features += bigrams
+        weights += [BIGRAM_WEIGHT] * len(bigrams)
+
+        for word in words:
+            padded = f"<{word}>"
+            trigrams = [padded[i:i + 3] for i in range(len(padded) - 2)]
+            features += trigrams
+            weights += [TRIGRAM_WEIGHT] * len(trigrams)
+        return features, weights
+
+    def _embed_one(self, text: str) -> np.ndarray:
+        features, weights = self._features(text)
+        if not features:
+            return np.zeros(self.dimensions)
+        hashes = np.fromiter((_feature_hash(f) for f in features), dtype=np.uint64, count=len(features))
+        # Low bits pick the bucket, the top bit the sign, so collisions cancel out on average
+        buckets = (hashes % np.uint64(self.dimensions)).astype(np.intp)
+        signs = np.where(hashes >> np.uint64(63), 1.0, -1.0)
+        counts = np.bincount(buckets, weights=signs * np.asarray(weights), minlength=self.dimensions)
+        return np.sign(counts) * np.log1p(np.abs(counts))
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        return _normalise(np.vstack([self._embed_one(text) for text in texts])).astype(np.float32)
+
+
+class OpenAIEmbedder(Embedder):
+    """Embeddings from the OpenAI API, truncated to `dimensions` by the API itself."""
+
+    url = "https://api.openai.com/v1/embeddings"
+
+    def __init__(self, api_key: str, model: str, dimensions: int, timeout: float = 30.0):
+        self.api_key = api_key
+        self.model = model
+        self.dimensions = dimensions
+        self.name = f"openai-{model}-{dimensions}"
+        self.timeout = timeout
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        response = httpx.post(
+            self.url,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={"model": self.model, "input": list(texts), "dimensions": self.dimensions},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        rows = sorted(response.json()["data"], key=lambda row: row["index"])
+        return _normalise(np.array([row["embedding"] for row in rows], dtype=np.float32))
+
+
+@lru_cache(maxsize=None)
+def get_embedder() -> Embedder:
+    """The embedder selected by EMBEDDING_PROVIDER, built on first use"""
+    if settings.EMBEDDING_PROVIDER == "hashed":
+        return HashedNgramEmbedder(EMBEDDING_DIMENSIONS)
+    if settings.EMBEDDING_PROVIDER == "openai":
+        if not settings.OPENAI_API_KEY:
+            raise ValueError("EMBEDDING_PROVIDER=openai needs OPENAI_API_KEY")
+        return OpenAIEmbedder(settings.OPENAI_API_KEY, settings.EMBEDDING_MODEL, EMBEDDING_DIMENSIONS)
+    raise ValueError(f"Unknown EMBEDDING_PROVIDER: {settings.EMBEDDING_PROVIDER!r}")
@@ -1,5 +1,7 @@
 from .request_exception import validation_exception_handler
+from .integrity_exception import integrity_error_handler
 
 __all__ = [
-    "validation_exception_handler"
-]
\ No newline at end of file
+    "validation_exception_handler",
+    "integrity_error_handler"
+]
@@ -0,0 +1,55 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from jwt import PyJWTError
+from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import invalidate_user
+from app.core.database import new_session
+from app.core.security import decode_token
+from app.data.dialects import is_foreign_key_violation
+from app.models import User
+
+
+def _caller_id(request: Request) -> Optional[str]:
+    token = request.headers.get("Authorization", "")[7:]
+    if not token:
+        return None
+    try:
+        return decode_token(token).get("userId")
+    except PyJWTError:
+        return None
+
+
+def _user_exists(user_id: str) -> bool:
+    with new_session() as session:
+        return session.get(User, UUID(user_id)) is not None
+
+
+def _error(status: int, message: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status,
+        content={
+            "success": False,
+            "message": message,
+            "errors": [],
+            "status": status
+        }
+    )
+
+
+async def integrity_error_handler(request: Request, exc: IntegrityError):
+    # A deleted account's principal stays cached for up to
+    # PRINCIPAL_CACHE_TTL_SECONDS in other processes, so its writes get past
+    # get_user and fail on the user_id foreign key instead
+    if not is_foreign_key_violation(exc):
+        raise exc
+
+    user_id = _caller_id(request)
+    if user_id is not None and not await run_in_threadpool(_user_exists, user_id):
+        invalidate_user(user_id)
+        return _error(401, "Unauthorized.")
+    return _error(409, "The request conflicted with a concurrent change.")
@@ -0,0 +1,53 @@
+# app/core/hashing.py
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import settings
+from app.util import hash_password, verify_password, get_hash_rounds
+
+
+class HashingPoolSaturated(Exception):
+    """Raised when too many hash operations are already queued."""
+
+
+class HashingPool:
+    """Runs bcrypt on a dedicated, bounded set of worker threads.
+
+    bcrypt releases the GIL, so a small thread pool gives real parallelism.
+    Callers await the result on the event loop, so a login waiting for bcrypt
+    holds no request threadpool slot. Callers beyond `max_pending` are
+    rejected immediately instead of queueing.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, rounds: int):
+        self.rounds = rounds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    async def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HashingPoolSaturated()
+        try:
+            return await asyncio.wrap_future(self._executor.submit(fn, *args))
+        finally:
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password, self.rounds)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return get_hash_rounds(hashed_password) != self.rounds
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+hashing_pool = HashingPool(
+    max_workers=settings.HASH_WORKERS,
+    max_pending=settings.HASH_MAX_PENDING,
+    rounds=settings.BCRYPT_ROUNDS,
+)
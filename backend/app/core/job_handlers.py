@@ -0,0 +1,26 @@
+# app/core/job_handlers.py
+# What each job kind runs, given the job's payload. A job can run more than
+# once (retries, or a worker that died mid-job), so handlers are idempotent.
+from app.core.chunked_delete import chunked_deleter
+from app.core.embedding_index import embedding_indexer
+from app.domain.use_case.user.delete_user import delete_user
+from app.models import JobKind
+
+
+def embed_notes(payload: dict) -> None:
+    embedding_indexer.index_stale(payload["user_id"])
+
+
+def delete_topic(payload: dict) -> None:
+    chunked_deleter.delete_topic(payload["topic_id"], payload["user_id"])
+
+
+def delete_account(payload: dict) -> None:
+    delete_user(payload["user_id"])
+
+
+JOB_HANDLERS = {
+    JobKind.EMBED_NOTES.value: embed_notes,
+    JobKind.DELETE_TOPIC.value: delete_topic,
+    JobKind.DELETE_USER.value: delete_account,
+}
@@ -0,0 +1,191 @@
+# app/core/jobs.py
+import os
+import random
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import new_session
+from app.data.repository import JobRepository
+
+JobHandler = Callable[[dict], None]
+
+# How often an idle worker fails abandoned jobs and purges old finished ones
+HOUSEKEEPING_INTERVAL_SECONDS = 60.0
+
+
+def utcnow() -> datetime:
+    """Naive UTC, the form job times are stored in"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class JobRunner:
+    """Runs jobs from the jobs table on a pool of worker threads.
+
+    Each worker claims one due job at a time in a short transaction (FOR
+    UPDATE SKIP LOCKED, so any number of workers and processes can share the
+    table), runs its handler with no transaction open, then records the
+    outcome. A failed job goes back in the queue with exponential backoff
+    until it runs out of attempts. A claimed job is leased for
+    `lease_seconds`; if its process dies the job is claimed again once the
+    lease runs out, so handlers must be safe to run twice. A worker that
+    outlives its lease can't record an outcome over the new claim.
+
+    Workers poll every `poll_interval` seconds and are woken early when a
+    transaction that enqueued a job commits in this process. `stop` lets
+    in-flight jobs finish; anything still running at the timeout is rerun
+    after its lease expires.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        concurrency: int,
+        poll_interval: float,
+        lease_seconds: float,
+        retry_base: float,
+        retry_max: float,
+        retention_hours: float,
+    ):
+        self.session_factory = session_factory
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease = timedelta(seconds=lease_seconds)
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.retention = timedelta(hours=retention_hours)
+        self.handlers: Dict[str, JobHandler] = {}
+        self._threads: List[threading.Thread] = []
+        self._stopping = threading.Event()
+        self._wakeup = threading.Condition()
+        self._housekeeping_lock = threading.Lock()
+        self._housekept_at = 0.0
+        self._name = f"{socket.gethostname()}:{os.getpid()}"
+
+    def start(self, handlers: Dict[str, JobHandler]) -> None:
+        self.handlers = dict(handlers)
+        self._stopping.clear()
+        for i in range(self.concurrency):
+            thread = threading.Thread(target=self._work, args=(f"{self._name}:{i}",), name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        if self._threads:
+            print(f"Started {len(self._threads)} job workers.")
+
+    def stop(self, timeout: float) -> None:
+        self._stopping.set()
+        self.wake()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+        still_running = sum(thread.is_alive() for thread in self._threads)
+        if still_running:
+            print(f"{still_running} job workers still busy at shutdown; their jobs will be retried.")
+        self._threads = []
+
+    def wake(self) -> None:
+        with self._wakeup:
+            self._wakeup.notify_all()
+
+    def _work(self, worker: str) -> None:
+        while not self._stopping.is_set():
+            if self.run_one(worker):
+                continue
+            self._housekeep()
+            with self._wakeup:
+                if not self._stopping.is_set():
+                    self._wakeup.wait(self.poll_interval)
+
+    def run_one(self, worker: str) -> bool:
+        """Claim and run one due job; False if there was none"""
+        now = utcnow()
+        try:
+            with self.session_factory() as session:
+                job = JobRepository(session).claim(worker, now, now - self.lease)
+                session.commit()
+        except SQLAlchemyError as exc:
+            print(f"Job queue unavailable: {exc.__class__.__name__}")
+            return False
+        if job is None:
+            return False
+
+        try:
+            handler = self.handlers.get(job.kind)
+            if handler is None:
+                # Maybe a newer deploy knows it; retried like any other failure
+                raise LookupError(f"No handler for job kind {job.kind!r}")
+            handler(job.payload)
+        except Exception as exc:
+            self._record_failure(worker, job, f"{exc.__class__.__name__}: {exc}"[:1000])
+        else:
+            self._record(job, lambda jobs: jobs.complete(job.id, worker, job.attempts, utcnow()))
+        return True
+
+    def _record_failure(self, worker: str, job, error: str) -> None:
+        if job.attempts >= job.max_attempts:
+            print(f"Job {job.id} ({job.kind}) failed for good after {job.attempts} attempts: {error}")
+            self._record(job, lambda jobs: jobs.fail(job.id, worker, job.attempts, error, utcnow()))
+            return
+        # Exponential backoff with jitter, so jobs that failed together don't all retry together
+        delay = min(self.retry_base * 2 ** (job.attempts - 1), self.retry_max) * random.uniform(0.5, 1.0)
+        print(f"Job {job.id} ({job.kind}) failed, attempt {job.attempts} of {job.max_attempts}; retrying in {delay:.0f}s: {error}")
+        self._record(job, lambda jobs: jobs.retry(job.id, worker, job.attempts, error, utcnow() + timedelta(seconds=delay)))
+
+    def _record(self, job, change: Callable[[JobRepository], bool]) -> None:
+        try:
+            with self.session_factory() as session:
+                recorded = change(JobRepository(session))
+                session.commit()
+        except SQLAlchemyError as exc:
+            # The lease runs out and the job is run again
+            print(f"Could not record job outcome: {exc.__class__.__name__}")
+            return
+        if not recorded:
+            print(f"Job {job.id} ({job.kind}) outlived its lease and was claimed again; outcome of attempt {job.attempts} dropped")
+
+    def _housekeep(self) -> None:
+        if time.monotonic() - self._housekept_at < HOUSEKEEPING_INTERVAL_SECONDS:
+            return
+        if not self._housekeeping_lock.acquire(blocking=False):
+            return
+        try:
+            self._housekept_at = time.monotonic()
+            now = utcnow()
+            with self.session_factory() as session:
+                jobs = JobRepository(session)
+                jobs.fail_abandoned(now - self.lease, now)
+                jobs.purge_finished(now - self.retention)
+                session.commit()
+        except SQLAlchemyError as exc:
+            print(f"Job housekeeping failed: {exc.__class__.__name__}")
+        finally:
+            self._housekeeping_lock.release()
+
+
+job_runner = JobRunner(
+    new_session,
+    concurrency=settings.JOB_WORKERS,
+    poll_interval=settings.JOB_POLL_INTERVAL_SECONDS,
+    lease_seconds=settings.JOB_LEASE_SECONDS,
+    retry_base=settings.JOB_RETRY_BASE_SECONDS,
+    retry_max=settings.JOB_RETRY_MAX_SECONDS,
+    retention_hours=settings.JOB_RETENTION_HOURS,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_workers(session: Session) -> None:
+    if session.info.pop("jobs_enqueued", False):
+        job_runner.wake()
+
+
+def enqueue(job_repository: JobRepository, kind, payload: dict, user_id: Optional[str] = None, dedupe_key: Optional[str] = None):
+    """Queue a job in the caller's transaction; it runs only if that transaction commits"""
+    return job_repository.enqueue(kind, payload, utcnow(), settings.JOB_MAX_ATTEMPTS, user_id=user_id, dedupe_key=dedupe_key)
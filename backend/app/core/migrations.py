@@ -0,0 +1,45 @@
+# app/core/migrations.py
+import os
+from typing import Set
+
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import ProgrammingError, OperationalError
+
+ALEMBIC_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "alembic")
+
+
+class SchemaOutOfDate(RuntimeError):
+    """Raised when the database is not at the Alembic head revision."""
+
+
+def code_heads() -> Set[str]:
+    """Head revision(s) of the migration scripts shipped with the code."""
+    from alembic.script import ScriptDirectory
+
+    return set(ScriptDirectory(ALEMBIC_DIR).get_heads())
+
+
+def database_heads(engine: Engine) -> Set[str]:
+    """Revision(s) recorded in the database; empty if it was never migrated."""
+    try:
+        with engine.connect() as connection:
+            return set(connection.execute(text("SELECT version_num FROM alembic_version")).scalars())
+    except (ProgrammingError, OperationalError) as exc:
+        if "alembic_version" not in str(exc):
+            raise
+        return set()
+
+
+def check_schema_is_current(engine: Engine) -> None:
+    """Fail fast if migrations are pending, instead of failing on the first query.
+
+    One single-row SELECT against the database, plus reading the migration
+    scripts from disk.
+    """
+    expected = code_heads()
+    current = database_heads(engine)
+    if current != expected:
+        raise SchemaOutOfDate(
+            f"Database is at revision {', '.join(sorted(current)) or '<none>'} but the code expects "
+            f"{', '.join(sorted(expected))}. Run `alembic upgrade head` from the backend directory."
+        )
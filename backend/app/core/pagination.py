@@ -0,0 +1,73 @@
+# app/core/pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import tuple_
+
+# Keyset position: the (timestamp, id) of the last row on the previous page
+Cursor = Tuple[datetime, UUID]
+
+# Search position: the (rank, id) of the last hit on the previous page
+RankCursor = Tuple[float, UUID]
+
+
+def _encode(payload: list) -> str:
+    data = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+
+def encode_cursor(timestamp: datetime, row_id: UUID) -> str:
+    return _encode([timestamp.isoformat(), str(row_id)])
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """Decode an opaque cursor. Raises ValueError if it is malformed."""
+    if not cursor:
+        return None
+    try:
+        timestamp, row_id = _decode(cursor)
+        return datetime.fromisoformat(timestamp), UUID(row_id)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def encode_rank_cursor(rank: float, row_id: UUID) -> str:
+    return _encode([rank, str(row_id)])
+
+
+def decode_rank_cursor(cursor: Optional[str]) -> Optional[RankCursor]:
+    """Decode an opaque search cursor. Raises ValueError if it is malformed."""
+    if not cursor:
+        return None
+    try:
+        rank, row_id = _decode(cursor)
+        return float(rank), UUID(row_id)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def keyset_page(statement, timestamp_column, id_column, after: Optional[Cursor], limit: int):
+    """Order a statement by (timestamp, id) and restrict it to one page.
+
+    One extra row is fetched so the caller can tell whether a next page exists.
+    """
+    if after is not None:
+        statement = statement.where(tuple_(timestamp_column, id_column) > tuple_(*after))
+    return statement.order_by(timestamp_column, id_column).limit(limit + 1)
+
+
+def split_page(rows: list, limit: int, timestamp_attr: str = "created_at") -> Tuple[list, Optional[str]]:
+    """Trim the look-ahead row and build the cursor for the next page."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, timestamp_attr), last.id)
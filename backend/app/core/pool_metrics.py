@@ -0,0 +1,107 @@
+# app/core/pool_metrics.py
+import bisect
+import threading
+import time
+from typing import Dict, Type
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool
+
+# Upper bounds (seconds) of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class PoolMetrics:
+    """Thread-safe checkout counters and wait time histogram for one engine's pool.
+
+    Wait time is measured around the pool's own checkout, so it covers both
+    queueing for a free connection and opening a new one.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool: Pool | None = None
+        self._lock = threading.Lock()
+        self._bucket_counts = [0] * (len(WAIT_BUCKETS) + 1)
+        self._wait_sum = 0.0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._max_wait = 0.0
+
+    def observe_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._bucket_counts[bisect.bisect_left(WAIT_BUCKETS, seconds)] += 1
+            self._wait_sum += seconds
+            self._checkouts += 1
+            self._max_wait = max(self._max_wait, seconds)
+
+    def observe_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self) -> dict:
+        """Return live pool gauges plus the accumulated checkout statistics."""
+        with self._lock:
+            cumulative = []
+            running = 0
+            for count in self._bucket_counts:
+                running += count
+                cumulative.append(running)
+            stats = {
+                "checkouts": self._checkouts,
+                "checkout_timeouts": self._timeouts,
+                "wait_seconds": {
+                    "sum": round(self._wait_sum, 6),
+                    "max": round(self._max_wait, 6),
+                    # Cumulative counts: checkouts that waited at most `le` seconds
+                    "buckets": [
+                        {"le": str(bound), "count": count}
+                        for bound, count in zip(WAIT_BUCKETS + ("+Inf",), cumulative)
+                    ],
+                },
+            }
+
+        pool = self.pool
+        if pool is not None and hasattr(pool, "checkedout"):
+            stats.update({
+                "pool_size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "timeout_seconds": pool.timeout(),
+            })
+        return stats
+
+
+def instrumented_pool(pool_class: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """Return a subclass of `pool_class` that reports checkouts to `metrics`.
+
+    Pools are re-created by class on dispose(), so the metrics are bound to the
+    class rather than passed to the constructor.
+    """
+
+    class InstrumentedPool(pool_class):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            metrics.pool = self
+
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except PoolTimeoutError:
+                metrics.observe_timeout()
+                raise
+            metrics.observe_wait(time.perf_counter() - started)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+    return InstrumentedPool
+
+
+# One collector per engine, keyed by the name reported on the metrics endpoint
+pool_metrics: Dict[str, PoolMetrics] = {
+    "sync": PoolMetrics("sync"),
+    "async": PoolMetrics("async"),
+}
@@ -0,0 +1,103 @@
+# app/core/replicas.py
+import itertools
+import threading
+import time
+from typing import Callable, List, Optional
+
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import SQLAlchemyError
+
+# Seconds since the replica last replayed a transaction, or 0 when it is
+# caught up (no WAL waiting to be replayed)
+PG_REPLICA_LAG = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class Replica:
+    """One read replica: its URL, lazily built engine and last health check result."""
+
+    def __init__(self, index: int, url: str):
+        self.index = index
+        self.url = url
+        self.engine: Optional[Engine] = None
+        self.healthy = True
+        self.checked_at = 0.0
+        self.lag_seconds: Optional[float] = None
+
+
+class ReplicaSet:
+    """Round-robin over the read replicas that passed their last health check.
+
+    Each replica is checked at most once per `check_interval` seconds, by the
+    request that happens to pick it once the interval has passed; other
+    requests keep using the last result meanwhile. A check connects, runs a
+    trivial query and, on Postgres, measures replay lag. `pick` returns None
+    when no replica is healthy, and callers fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        engine_factory: Callable[[str, str], Engine],
+        check_interval: float,
+        max_lag: float,
+    ):
+        self.replicas = [Replica(i, url) for i, url in enumerate(urls)]
+        self.engine_factory = engine_factory
+        self.check_interval = check_interval
+        self.max_lag = max_lag
+        self._order = itertools.cycle(range(len(self.replicas))) if self.replicas else None
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def engine_for(self, replica: Replica) -> Engine:
+        if replica.engine is None:
+            with self._lock:
+                if replica.engine is None:
+                    replica.engine = self.engine_factory(f"replica-{replica.index}", replica.url)
+        return replica.engine
+
+    def pick(self) -> Optional[Replica]:
+        """Return the next healthy replica, or None if there is none."""
+        for _ in range(len(self.replicas)):
+            with self._lock:
+                replica = self.replicas[next(self._order)]
+            if self._is_healthy(replica):
+                return replica
+        return None
+
+    def mark_failed(self, replica: Replica) -> None:
+        """Take a replica out of rotation until its next health check."""
+        replica.healthy = False
+        replica.checked_at = time.monotonic()
+
+    def _is_healthy(self, replica: Replica) -> bool:
+        if time.monotonic() - replica.checked_at < self.check_interval:
+            return replica.healthy
+        # Claim the check so concurrent requests don't all probe the same replica
+        replica.checked_at = time.monotonic()
+        replica.healthy = self._check(replica)
+        return replica.healthy
+
+    def _check(self, replica: Replica) -> bool:
+        engine = self.engine_for(replica)
+        try:
+            with engine.connect() as connection:
+                if engine.dialect.name == "postgresql":
+                    replica.lag_seconds = float(connection.execute(PG_REPLICA_LAG).scalar() or 0)
+                    return replica.lag_seconds <= self.max_lag
+                connection.execute(text("SELECT 1"))
+                return True
+        except SQLAlchemyError as exc:
+            print(f"Read replica {replica.index} failed its health check: {exc.__class__.__name__}")
+            return False
+
+    def status(self) -> list:
+        return [
+            {"replica": r.index, "healthy": r.healthy, "lag_seconds": r.lag_seconds}
+            for r in self.replicas
+        ]
@@ -1,9 +1,32 @@
+import hashlib
+import time
+
 import jwt
 from datetime import datetime, timedelta
+from app.core.cache import token_cache
 from app.core.config import settings
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
\ No newline at end of file
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def decode_token(token: str) -> dict:
+    """Decode a JWT, reusing previously decoded claims while they are unexpired.
+
+    Raises PyJWTError for invalid tokens.
+    """
+    key = _token_key(token)
+    claims = token_cache.get(key)
+    if claims is not None and claims.get("exp", 0) > time.time():
+        return claims
+
+    claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    token_cache.set(key, claims)
+    return claims
@@ -0,0 +1,7 @@
+from .user import AsyncUserRepository
+from .topic import AsyncTopicRepository
+from .topic_edge import AsyncTopicEdgeRepository
+from .note import AsyncNoteRepository
+from .tag import AsyncTagRepository
+
+__all__ = ["AsyncUserRepository", "AsyncTopicRepository", "AsyncTopicEdgeRepository", "AsyncNoteRepository", "AsyncTagRepository"]
@@ -0,0 +1,64 @@
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlmodel import select
+
+from app.core.pagination import Cursor, keyset_page, split_page
+from app.data.repository.note import NoteRepository
+from app.models import Note, NoteTag, NoteTagMap, NoteReadWithTags
+
+
+class AsyncNoteRepository:
+    def __init__(self, session):
+        self.session = session
+
+    async def read_note_by_id(self, note_id: str, user_id: str) -> Note | None:
+        note: Note = (await self.session.exec(select(Note).where(Note.id == note_id, Note.user_id == user_id))).first()
+        return note
+
+    async def get_note_tags(self, note_id: UUID) -> List[NoteTag]:
+        """Get all tags associated with a note"""
+        tags = (await self.session.exec(
+            select(NoteTag)
+            .join(NoteTagMap, NoteTag.id == NoteTagMap.tag_id)
+            .where(NoteTagMap.note_id == note_id)
+        )).all()
+
+        return list(tags)
+
+    async def get_tags_for_notes(self, note_ids: List[UUID]) -> Dict[UUID, List[NoteTag]]:
+        """Get the tags of several notes with a single query, keyed by note id"""
+        tags_by_note: Dict[UUID, List[NoteTag]] = {note_id: [] for note_id in note_ids}
+        if not note_ids:
+            return tags_by_note
+
+        rows = (await self.session.exec(
+            select(NoteTagMap.note_id, NoteTag)
+            .join(NoteTag, NoteTag.id == NoteTagMap.tag_id)
+            .where(NoteTagMap.note_id.in_(note_ids))
+        )).all()
+
+        for note_id, tag in rows:
+            tags_by_note[note_id].append(tag)
+
+        return tags_by_note
+
+    async def read_note_with_tags(self, note_id: str, user_id: str) -> NoteReadWithTags | None:
+        """Read a note and include its associated tags"""
+        note = await self.read_note_by_id(note_id, user_id)
+        if note is None:
+            return None
+
+        tags = await self.get_note_tags(note.id)
+        return NoteRepository.to_note_read_with_tags(note, tags)
+
+    async def read_notes_with_tags_page(self, topic_id: str, user_id: str, limit: int, after: Optional[Cursor] = None) -> Tuple[List[NoteReadWithTags], Optional[str]]:
+        """Read one page of a topic's notes, oldest first, with their tags"""
+        statement = keyset_page(
+            select(Note).where(Note.user_id == user_id, Note.topic_id == topic_id),
+            Note.created_at, Note.id, after, limit
+        )
+        notes, next_cursor = split_page(list((await self.session.exec(statement)).all()), limit)
+
+        tags_by_note = await self.get_tags_for_notes([note.id for note in notes])
+        return [NoteRepository.to_note_read_with_tags(note, tags_by_note[note.id]) for note in notes], next_cursor
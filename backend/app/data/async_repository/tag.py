@@ -0,0 +1,29 @@
+from uuid import UUID
+from typing import List, Optional, Tuple
+
+from sqlmodel import select
+
+from app.core.pagination import Cursor, keyset_page, split_page
+from app.models import NoteTag
+
+
+class AsyncTagRepository:
+    def __init__(self, session):
+        self.session = session
+
+    async def get_tag_by_id(self, tag_id: str, user_id: str) -> Optional[NoteTag]:
+        tag_uuid = UUID(tag_id)
+        user_uuid = UUID(user_id)
+        tag: NoteTag = (await self.session.exec(
+            select(NoteTag).where(
+                NoteTag.id == tag_uuid,
+                NoteTag.user_id == user_uuid
+            )
+        )).first()
+        return tag
+
+    async def get_tags_page(self, user_id: str, limit: int, after: Optional[Cursor] = None) -> Tuple[List[NoteTag], Optional[str]]:
+        user_uuid = UUID(user_id)
+        statement = keyset_page(select(NoteTag).where(NoteTag.user_id == user_uuid), NoteTag.created_at, NoteTag.id, after, limit)
+        tags = (await self.session.exec(statement)).all()
+        return split_page(list(tags), limit)
@@ -0,0 +1,27 @@
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import defer
+from sqlmodel import select
+from app.core.pagination import Cursor, keyset_page, split_page
+from app.models import Topic
+
+class AsyncTopicRepository:
+    def __init__(self, session):
+        self.session = session
+
+    async def get_topic_by_id(self, topic_id: str, user_id: str) -> Topic | None:
+        topic: Topic = (await self.session.exec(select(Topic).where(Topic.id == topic_id, Topic.user_id == user_id))).first()
+        return topic
+
+    async def get_all_topics(self, user_id: str, include_description: bool = True) -> List[Topic] | None:
+        statement = select(Topic).where(Topic.user_id == user_id)
+        if not include_description:
+            # Leave the description column out of the SELECT entirely
+            statement = statement.options(defer(Topic.description, raiseload=True))
+        topics: List[Topic] = (await self.session.exec(statement)).all()
+        return topics
+
+    async def get_topics_page(self, user_id: str, limit: int, after: Optional[Cursor] = None) -> Tuple[List[Topic], Optional[str]]:
+        statement = keyset_page(select(Topic).where(Topic.user_id == user_id), Topic.created_at, Topic.id, after, limit)
+        topics: List[Topic] = (await self.session.exec(statement)).all()
+        return split_page(topics, limit)
@@ -0,0 +1,22 @@
+from typing import List
+
+from sqlmodel import select
+from app.models import TopicEdge, Topic
+
+class AsyncTopicEdgeRepository:
+    def __init__(self, session):
+        self.session = session
+
+    async def get_edges_by_source(self, source_topic_id: str) -> List[TopicEdge]:
+        edges: List[TopicEdge] = (await self.session.exec(
+            select(TopicEdge).where(TopicEdge.source == source_topic_id)
+        )).all()
+        return edges
+
+    async def get_edges_for_user(self, user_id: str) -> List[TopicEdge]:
+        edges: List[TopicEdge] = (await self.session.exec(
+            select(TopicEdge)
+            .join(Topic, TopicEdge.source == Topic.id)
+            .where(Topic.user_id == user_id)
+        )).all()
+        return edges
@@ -0,0 +1,54 @@
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlmodel import select
+
+from app.models import User, Topic, TopicEdge, Note, NoteTag, TopicNoteCount
+
+
+class AsyncUserRepository:
+    def __init__(self, session):
+        self.session = session
+
+    async def get_user_by_id(self, user_id: str) -> User | None:
+        user_uuid = UUID(user_id)
+        user: User = (await self.session.exec(select(User).where(User.id == user_uuid))).first()
+        return user
+
+    async def get_stats_counts(self, user_id: str) -> dict:
+        """Count the user's topics, notes, tags and edges in a single statement"""
+        user_uuid = UUID(user_id)
+        topics_count = select(func.count(Topic.id)).where(Topic.user_id == user_uuid).scalar_subquery()
+        notes_count = select(func.count(Note.id)).where(Note.user_id == user_uuid).scalar_subquery()
+        tags_count = select(func.count(NoteTag.id)).where(NoteTag.user_id == user_uuid).scalar_subquery()
+        edges_count = (
+            select(func.count(TopicEdge.id))
+            .join(Topic, TopicEdge.source == Topic.id)
+            .where(Topic.user_id == user_uuid)
+            .scalar_subquery()
+        )
+
+        row = (await self.session.exec(select(topics_count, notes_count, tags_count, edges_count))).one()
+        return {
+            "topics_count": row[0],
+            "notes_count": row[1],
+            "tags_count": row[2],
+            "edges_count": row[3],
+        }
+
+    async def get_topic_note_counts(self, user_id: str) -> List[TopicNoteCount]:
+        """Note count per topic, newest topics first"""
+        user_uuid = UUID(user_id)
+        rows = (await self.session.exec(
+            select(Topic.id, Topic.title, Topic.created_at, func.count(Note.id))
+            .outerjoin(Note, Note.topic_id == Topic.id)
+            .where(Topic.user_id == user_uuid)
+            .group_by(Topic.id, Topic.title, Topic.created_at)
+            .order_by(Topic.created_at.desc())
+        )).all()
+
+        return [
+            TopicNoteCount(id=topic_id, title=title, created_at=created_at, note_count=note_count)
+            for topic_id, title, created_at, note_count in rows
+        ]
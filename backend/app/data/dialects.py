@@ -0,0 +1,72 @@
+import io
+import json
+from typing import List
+
+from sqlalchemy import JSON
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.sql.dml import Insert
+
+from app.models.types import StringList
+
+
+def insert_ignoring_conflicts(dialect_name: str, model, index_elements: List[str], index_where=None) -> Insert:
+    """INSERT ... ON CONFLICT (index_elements) DO NOTHING, on Postgres or SQLite
+
+    `index_where` names the predicate of a partial unique index.
+    """
+    insert = sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+    return insert(model).on_conflict_do_nothing(index_elements=index_elements, index_where=index_where)
+
+
+def insert_or_update(dialect_name: str, model, index_elements: List[str], update_columns: List[str]) -> Insert:
+    """INSERT ... ON CONFLICT (index_elements) DO UPDATE SET update_columns, on Postgres or SQLite"""
+    insert = (sqlite.insert if dialect_name == "sqlite" else postgresql.insert)(model)
+    return insert.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={name: insert.excluded[name] for name in update_columns},
+    )
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """Whether the error is a foreign key violation rather than a uniqueness or check failure"""
+    # psycopg2 sets pgcode, asyncpg sqlstate; SQLite only says so in the message
+    code = getattr(error.orig, "pgcode", None) or getattr(error.orig, "sqlstate", None)
+    if code is not None:
+        return code == "23503"
+    return "FOREIGN KEY constraint failed" in str(error.orig)
+
+
+def _copy_array(values: list) -> str:
+    items = ("NULL" if value is None else '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"' for value in values)
+    return "{" + ",".join(items) + "}"
+
+
+def _copy_field(value, column) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(column.type, StringList):
+        text = _copy_array(value)
+    elif isinstance(column.type, JSON):
+        text = json.dumps(value)
+    else:
+        text = str(value)
+    return text.replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+
+
+def copy_rows(connection, table, columns: List[str], rows: List[dict]) -> None:
+    """COPY rows into a Postgres table over the connection's psycopg2 cursor, in its transaction"""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_field(row[name], table.c[name]) for name in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    column_list = ", ".join(f'"{name}"' for name in columns)
+    statement = f'COPY "{table.name}" ({column_list}) FROM STDIN'
+    with connection.connection.driver_connection.cursor() as cursor:
+        try:
+            cursor.copy_expert(statement, buffer)
+        except connection.dialect.loaded_dbapi.IntegrityError as error:
+            # Raised straight from the driver; wrap it like SQLAlchemy's own executes do
+            raise IntegrityError(statement, None, error) from error
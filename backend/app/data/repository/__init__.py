@@ -3,5 +3,10 @@ from .topic import TopicRepository
 from .topic_edge import TopicEdgeRepository
 from .note import NoteRepository
 from .tag import TagRepository
+from .search import SearchRepository
+from .embedding import NoteEmbeddingRepository
+from .job import JobRepository
+from .export import ExportRepository
+from .data_import import ImportRepository
 
-__all__ = ["UserRepository", "TopicRepository", "TopicEdgeRepository", "NoteRepository", "TagRepository"]
\ No newline at end of file
+__all__ = ["UserRepository", "TopicRepository", "TopicEdgeRepository", "NoteRepository", "TagRepository", "SearchRepository", "NoteEmbeddingRepository", "JobRepository", "ExportRepository", "ImportRepository"]
\ No newline at end of file
@@ -0,0 +1,72 @@
+from collections import defaultdict
+from typing import Iterable, List, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import insert, tuple_
+from sqlmodel import select
+
+from app.data.dialects import copy_rows
+from app.models import NoteTag, NoteTagMap, Topic, TopicEdge
+
+# Rows per COPY or multi-row INSERT, and ids per IN (...) lookup
+IMPORT_CHUNK_SIZE = 5000
+
+
+def _chunks(items: list, size: int = IMPORT_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class ImportRepository:
+    def __init__(self, session):
+        self.session = session
+
+    def savepoint(self):
+        """A nested transaction; leaving it with an exception undoes only what was written inside"""
+        return self.session.begin_nested()
+
+    def _lookup(self, statement_for, values: Iterable) -> list:
+        found = []
+        for chunk in _chunks(list(values)):
+            found.extend(self.session.exec(statement_for(chunk)).all())
+        return found
+
+    def existing_topic_titles(self, user_id: str, titles: Iterable[str]) -> Set[str]:
+        """Which of the titles the user's topics already use"""
+        return set(self._lookup(lambda chunk: select(Topic.title).where(Topic.user_id == user_id, Topic.title.in_(chunk)), titles))
+
+    def existing_tag_names(self, user_id: str, names: Iterable[str]) -> Set[str]:
+        """Which of the names the user's tags already use"""
+        return set(self._lookup(lambda chunk: select(NoteTag.name).where(NoteTag.user_id == user_id, NoteTag.name.in_(chunk)), names))
+
+    def owned_ids(self, model, user_id: str, ids: Iterable[UUID]) -> Set[UUID]:
+        """Which of the ids are rows of `model` (Topic, NoteTag or Note) owned by the user"""
+        return set(self._lookup(lambda chunk: select(model.id).where(model.user_id == user_id, model.id.in_(chunk)), ids))
+
+    def insert_rows(self, model, rows: List[dict]) -> None:
+        """Bulk insert rows of a table; COPY on Postgres, multi-row INSERTs elsewhere
+
+        Rows may leave out columns that have server defaults, like timestamps.
+        """
+        table = model.__table__
+        connection = self.session.connection()
+        by_columns = defaultdict(list)
+        for row in rows:
+            by_columns[tuple(row)].append(row)
+
+        for columns, group in by_columns.items():
+            for chunk in _chunks(group):
+                if connection.dialect.driver == "psycopg2":
+                    copy_rows(connection, table, list(columns), chunk)
+                else:
+                    connection.execute(insert(table), chunk)
+
+    def existing_edges(self, pairs: Iterable[Tuple[UUID, UUID]]) -> Set[Tuple[UUID, UUID]]:
+        """Which of the (source, target) pairs already have an edge"""
+        rows = self._lookup(lambda chunk: select(TopicEdge.source, TopicEdge.target).where(tuple_(TopicEdge.source, TopicEdge.target).in_(chunk)), pairs)
+        return {(row.source, row.target) for row in rows}
+
+    def existing_note_tags(self, pairs: Iterable[Tuple[UUID, UUID]]) -> Set[Tuple[UUID, UUID]]:
+        """Which of the (note_id, tag_id) pairs are already linked"""
+        rows = self._lookup(lambda chunk: select(NoteTagMap.note_id, NoteTagMap.tag_id).where(tuple_(NoteTagMap.note_id, NoteTagMap.tag_id).in_(chunk)), pairs)
+        return {(row.note_id, row.tag_id) for row in rows}
@@ -0,0 +1,130 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import or_, text
+from sqlmodel import select
+
+from app.data.dialects import insert_or_update
+from app.models import Note, NoteEmbedding, SimilarNote
+
+# Database URL -> whether its pgvector supports hnsw.iterative_scan (0.8+)
+_iterative_scan: Dict[str, bool] = {}
+
+
+class NoteEmbeddingRepository:
+    def __init__(self, session):
+        self.session = session
+
+    def read_note_vector(self, note_id: str, user_id: str, model: str):
+        """The note's title, content and current vector (None if missing or stale), or None if no such note"""
+        statement = (
+            select(Note.title, Note.content, NoteEmbedding.embedding)
+            .outerjoin(NoteEmbedding, (NoteEmbedding.note_id == Note.id) & self._is_fresh(model))
+            .where(Note.id == note_id, Note.user_id == user_id)
+        )
+        return self.session.exec(statement).first()
+
+    def nearest(self, user_id: str, model: str, vector: np.ndarray, limit: int, exclude_note_id: Optional[str] = None) -> List[SimilarNote]:
+        """The user's notes closest to `vector` by cosine similarity, best first"""
+        if not vector.any():
+            return []
+        if self.session.get_bind().dialect.name == "postgresql":
+            return self._nearest_postgres(user_id, model, vector, limit, exclude_note_id)
+        return self._nearest_numpy(user_id, model, vector, limit, exclude_note_id)
+
+    def _nearest_postgres(self, user_id, model, vector, limit, exclude_note_id) -> List[SimilarNote]:
+        distance = NoteEmbedding.embedding.cosine_distance(vector)
+        candidates = (
+            select(NoteEmbedding.note_id, distance.label("distance"))
+            .join(Note, NoteEmbedding.note_id == Note.id)
+            .where(Note.user_id == user_id, NoteEmbedding.model == model)
+        )
+        if exclude_note_id is not None:
+            candidates = candidates.where(Note.id != exclude_note_id)
+
+        # The HNSW index holds every user's vectors and the user filter runs on
+        # what the scan returns. pgvector 0.8+ can keep scanning until enough
+        # rows pass it; older versions stop after hnsw.ef_search rows, mostly
+        # other users' notes.
+        if self._has_iterative_scan():
+            self.session.exec(text("SET LOCAL hnsw.iterative_scan = relaxed_order"))
+            # ORDER BY distance LIMIT k is what lets Postgres walk the index
+            nearest = self._similar_notes(candidates.order_by(distance).limit(limit).subquery("nearest"))
+            # The scan can still give up (hnsw.max_scan_tuples) before finding
+            # `limit` rows; the exact scan below settles those cases
+            if len(nearest) == limit:
+                return nearest
+
+        # Exact: materialised so the planner can't order through the index
+        return self._similar_notes(candidates.cte("scored").prefix_with("MATERIALIZED"), limit)
+
+    def _similar_notes(self, scored, limit: Optional[int] = None) -> List[SimilarNote]:
+        # Also re-sorts the relaxed order an iterative index scan returns
+        statement = select(Note, scored.c.distance).join(scored, scored.c.note_id == Note.id).order_by(scored.c.distance)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return [
+            SimilarNote(**note.model_dump(), score=1.0 - distance)
+            for note, distance in self.session.exec(statement)
+        ]
+
+    def _has_iterative_scan(self) -> bool:
+        url = str(self.session.get_bind().url)
+        if url not in _iterative_scan:
+            version = self.session.exec(text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")).first()
+            _iterative_scan[url] = version is not None and tuple(int(part) for part in version[0].split(".")[:2]) >= (0, 8)
+        return _iterative_scan[url]
+
+    def _nearest_numpy(self, user_id, model, vector, limit, exclude_note_id) -> List[SimilarNote]:
+        """Exact scan for databases without pgvector (SQLite)"""
+        statement = (
+            select(NoteEmbedding.note_id, NoteEmbedding.embedding)
+            .join(Note, NoteEmbedding.note_id == Note.id)
+            .where(Note.user_id == user_id, NoteEmbedding.model == model)
+        )
+        if exclude_note_id is not None:
+            statement = statement.where(Note.id != exclude_note_id)
+        rows = self.session.exec(statement).all()
+        if not rows:
+            return []
+
+        # Stored vectors are normalised, so the dot product is the cosine similarity
+        scores = np.vstack([embedding for _, embedding in rows]) @ vector
+        top = np.argsort(-scores, kind="stable")[:limit]
+        ids = [rows[i].note_id for i in top]
+        notes = {note.id: note for note in self.session.exec(select(Note).where(Note.id.in_(ids)))}
+        return [SimilarNote(**notes[rows[i].note_id].model_dump(), score=float(scores[i])) for i in top]
+
+    def stale_notes(self, model: str, limit: int, user_id: Optional[str] = None) -> List[Tuple[UUID, Optional[str], str, datetime]]:
+        """Up to `limit` notes with no vector from `model`, or one older than the note"""
+        statement = (
+            select(Note.id, Note.title, Note.content, Note.updated_at)
+            .outerjoin(NoteEmbedding, NoteEmbedding.note_id == Note.id)
+            .where(or_(NoteEmbedding.note_id.is_(None), ~self._is_fresh(model)))
+            .limit(limit)
+        )
+        if user_id is not None:
+            statement = statement.where(Note.user_id == user_id)
+        return self.session.exec(statement).all()
+
+    def save_vectors(self, model: str, rows: Sequence[Tuple[UUID, datetime, np.ndarray]]) -> int:
+        """Insert or replace the vectors of (note_id, note_updated_at, vector) rows"""
+        if not rows:
+            return 0
+        statement = insert_or_update(
+            self.session.get_bind().dialect.name,
+            NoteEmbedding,
+            index_elements=["note_id"],
+            update_columns=["model", "embedding", "note_updated_at", "embedded_at"],
+        )
+        params = [
+            {"note_id": note_id, "model": model, "embedding": vector, "note_updated_at": note_updated_at}
+            for note_id, note_updated_at, vector in rows
+        ]
+        return self.session.connection().execute(statement, params).rowcount
+
+    @staticmethod
+    def _is_fresh(model: str):
+        return (NoteEmbedding.model == model) & (NoteEmbedding.note_updated_at >= Note.updated_at)
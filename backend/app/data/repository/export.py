@@ -0,0 +1,53 @@
+from typing import Iterator
+
+from sqlmodel import select
+
+from app.models import Note, NoteTag, NoteTagMap, Topic, TopicEdge
+
+# Rows fetched per round trip; the server-side cursor keeps the rest on the server
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportRepository:
+    def __init__(self, session):
+        self.session = session
+
+    def _stream(self, statement):
+        return self.session.exec(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+    def iter_records(self, user_id: str) -> Iterator[dict]:
+        """Every topic, edge, tag, note and tag link of the user, in an order where references come first"""
+        # Each query streams in the order of an existing index, so none of them sorts
+        topics = select(
+            Topic.id, Topic.title, Topic.description, Topic.node_type, Topic.position, Topic.created_at, Topic.updated_at,
+        ).where(Topic.user_id == user_id).order_by(Topic.created_at, Topic.id)
+        for row in self._stream(topics):
+            yield {"type": "topic", **row._mapping}
+
+        edges = (
+            select(TopicEdge.id, TopicEdge.source, TopicEdge.target, TopicEdge.relation_type, TopicEdge.edge_metadata)
+            .join(Topic, Topic.id == TopicEdge.source)
+            .where(Topic.user_id == user_id)
+        )
+        for row in self._stream(edges):
+            yield {"type": "edge", **row._mapping}
+
+        tags = select(
+            NoteTag.id, NoteTag.name, NoteTag.color, NoteTag.created_at,
+        ).where(NoteTag.user_id == user_id).order_by(NoteTag.created_at, NoteTag.id)
+        for row in self._stream(tags):
+            yield {"type": "tag", **row._mapping}
+
+        notes = select(
+            Note.id, Note.topic_id, Note.title, Note.content, Note.urls, Note.created_at, Note.updated_at,
+        ).where(Note.user_id == user_id).order_by(Note.topic_id, Note.created_at, Note.id)
+        for row in self._stream(notes):
+            yield {"type": "note", **row._mapping}
+
+        note_tags = (
+            select(NoteTagMap.note_id, NoteTagMap.tag_id)
+            .join(NoteTag, NoteTag.id == NoteTagMap.tag_id)
+            .where(NoteTag.user_id == user_id)
+        )
+        for row in self._stream(note_tags):
+            yield {"type": "note_tag", **row._mapping}
@@ -0,0 +1,103 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import delete, or_, text, update
+from sqlmodel import select
+
+from app.data.dialects import insert_ignoring_conflicts
+from app.models import Job, JobKind, JobStatus
+from app.util.ids import new_id
+
+QUEUED = JobStatus.QUEUED.value
+RUNNING = JobStatus.RUNNING.value
+FINISHED = (JobStatus.SUCCEEDED.value, JobStatus.FAILED.value)
+
+
+class JobRepository:
+    def __init__(self, session):
+        self.session = session
+
+    def enqueue(self, kind: JobKind, payload: dict, now: datetime, max_attempts: int, user_id: Optional[str] = None, dedupe_key: Optional[str] = None) -> UUID:
+        """Add a job to the current transaction; with a dedupe_key, reuse a queued job with the same key"""
+        statement = (
+            insert_ignoring_conflicts(
+                self.session.get_bind().dialect.name, Job, ["dedupe_key"],
+                # Literal, not a bound parameter, so Postgres can match it to the partial index
+                index_where=text(f"status = '{QUEUED}'"),
+            )
+            .values(
+                id=new_id(), kind=kind.value, payload=payload, user_id=user_id, dedupe_key=dedupe_key,
+                status=QUEUED, attempts=0, max_attempts=max_attempts, run_after=now, created_at=now,
+            )
+            .returning(Job.id)
+        )
+        job_id = self.session.exec(statement).scalar()
+        if job_id is None:
+            job_id = self.session.exec(select(Job.id).where(Job.dedupe_key == dedupe_key, Job.status == QUEUED)).first()
+        # Read by app.core.jobs to wake the workers once this transaction commits
+        self.session.info["jobs_enqueued"] = True
+        return job_id
+
+    def claim(self, worker: str, now: datetime, lease_expired_before: datetime):
+        """Mark the next due job as running and return it, or None if there is none"""
+        candidate = self.session.exec(
+            select(Job.id, Job.status, Job.attempts)
+            .where(or_(
+                (Job.status == QUEUED) & (Job.run_after <= now),
+                (Job.status == RUNNING) & (Job.locked_at < lease_expired_before) & (Job.attempts < Job.max_attempts),
+            ))
+            .order_by(Job.run_after)
+            .limit(1)
+            # Concurrent workers skip rows another one is claiming instead of waiting on them
+            .with_for_update(skip_locked=True)
+        ).first()
+        if candidate is None:
+            return None
+
+        # Guarded on the values just read, for databases without row locks (SQLite)
+        statement = (
+            update(Job)
+            .where(Job.id == candidate.id, Job.status == candidate.status, Job.attempts == candidate.attempts)
+            .values(status=RUNNING, attempts=Job.attempts + 1, locked_at=now, locked_by=worker)
+            .returning(Job.id, Job.kind, Job.payload, Job.attempts, Job.max_attempts)
+        )
+        return self.session.exec(statement).first()
+
+    def _update_claimed(self, job_id: UUID, worker: str, attempts: int, **values) -> bool:
+        # Only while the claim is still this worker's: once its lease ran out
+        # and the job was claimed again, the outcome belongs to the new run
+        statement = (
+            update(Job)
+            .where(Job.id == job_id, Job.locked_by == worker, Job.attempts == attempts)
+            .values(locked_at=None, locked_by=None, **values)
+        )
+        return self.session.exec(statement).rowcount > 0
+
+    def complete(self, job_id: UUID, worker: str, attempts: int, now: datetime) -> bool:
+        """Mark the claimed job succeeded; False if the claim was lost"""
+        return self._update_claimed(job_id, worker, attempts, status=JobStatus.SUCCEEDED.value, finished_at=now, last_error=None)
+
+    def retry(self, job_id: UUID, worker: str, attempts: int, error: str, run_after: datetime) -> bool:
+        """Put the claimed job back in the queue; False if the claim was lost"""
+        return self._update_claimed(job_id, worker, attempts, status=QUEUED, run_after=run_after, last_error=error)
+
+    def fail(self, job_id: UUID, worker: str, attempts: int, error: str, now: datetime) -> bool:
+        """Mark the claimed job failed for good; False if the claim was lost"""
+        return self._update_claimed(job_id, worker, attempts, status=JobStatus.FAILED.value, finished_at=now, last_error=error)
+
+    def fail_abandoned(self, lease_expired_before: datetime, now: datetime) -> int:
+        """Fail running jobs whose lease ran out on their last attempt"""
+        statement = (
+            update(Job)
+            .where(Job.status == RUNNING, Job.locked_at < lease_expired_before, Job.attempts >= Job.max_attempts)
+            .values(status=JobStatus.FAILED.value, finished_at=now, locked_at=None, locked_by=None, last_error="Worker lost (lease expired)")
+        )
+        return self.session.exec(statement).rowcount
+
+    def purge_finished(self, finished_before: datetime) -> int:
+        statement = delete(Job).where(Job.status.in_(FINISHED), Job.finished_at < finished_before)
+        return self.session.exec(statement).rowcount
+
+    def read_job(self, job_id: str, user_id: str) -> Job | None:
+        return self.session.exec(select(Job).where(Job.id == job_id, Job.user_id == user_id)).first()
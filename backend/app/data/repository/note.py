@@ -1,8 +1,11 @@
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import delete, func
 from sqlmodel import select
 
+from app.core.pagination import Cursor, keyset_page, split_page
+from app.data.dialects import insert_ignoring_conflicts
 from app.models import Note, NoteTag, NoteTagMap, NoteReadWithTags, NoteTagRead
 
 
@@ -12,8 +15,7 @@ class NoteRepository:
 
     def create_note(self, note: Note) -> Note:
         self.session.add(note)
-        self.session.commit()
-        self.session.refresh(note)
+        self.session.flush()
         return note
 
     def read_all_notes(self, topic_id: str, user_id: str) -> List[Note] | None:
@@ -25,50 +27,43 @@ class NoteRepository:
         return note
 
     def update_note(self, note: Note) -> Note | None:
+        note.updated_at = func.now()
         self.session.add(note)
-        self.session.commit()
-        self.session.refresh(note)
+        self.session.flush()
         return note
 
     def delete_note(self, note_id: str, user_id: str) -> bool:
-        note: Note = self.session.exec(select(Note).where(Note.id == note_id, Note.user_id == user_id)).first()
-        if note is None:
-            return False
-        self.session.delete(note)
-        self.session.commit()
-        return True
+        statement = delete(Note).where(Note.id == note_id, Note.user_id == user_id).returning(Note.id)
+        return self.session.exec(statement).first() is not None
 
     def validate_tags_belong_to_user(self, tag_ids: List[UUID], user_id: str) -> bool:
         """Validate that all provided tag IDs exist and belong to the user"""
         if not tag_ids:
             return True
-        
-        user_uuid = UUID(user_id)
-        existing_tags = self.session.exec(
-            select(NoteTag).where(
-                NoteTag.id.in_(tag_ids),
-                NoteTag.user_id == user_uuid
-            )
-        ).all()
-        
-        return len(existing_tags) == len(tag_ids)
+
+        wanted = set(tag_ids)
+        owned = self.session.exec(
+            select(func.count()).select_from(NoteTag).where(NoteTag.id.in_(wanted), NoteTag.user_id == user_id)
+        ).one()
+        return owned == len(wanted)
 
     def set_note_tags(self, note_id: UUID, tag_ids: List[UUID]) -> None:
-        """Set tags for a note (clears existing tags and sets new ones)"""
-        # Clear existing tag associations
-        existing_associations = self.session.exec(
-            select(NoteTagMap).where(NoteTagMap.note_id == note_id)
-        ).all()
-        
-        for association in existing_associations:
-            self.session.delete(association)
-        
-        # Add new tag associations
-        for tag_id in tag_ids:
-            association = NoteTagMap(note_id=note_id, tag_id=tag_id)
-            self.session.add(association)
-        
-        self.session.commit()
+        """Set tags for a note, only deleting and inserting the links that changed"""
+        wanted = set(tag_ids)
+        current = set(self.session.exec(select(NoteTagMap.tag_id).where(NoteTagMap.note_id == note_id)).all())
+
+        removed = current - wanted
+        if removed:
+            self.session.exec(
+                delete(NoteTagMap).where(NoteTagMap.note_id == note_id, NoteTagMap.tag_id.in_(removed))
+            )
+
+        added = wanted - current
+        if added:
+            statement = insert_ignoring_conflicts(
+                self.session.get_bind().dialect.name, NoteTagMap, ["note_id", "tag_id"]
+            ).values([{"note_id": note_id, "tag_id": tag_id} for tag_id in added])
+            self.session.exec(statement)
 
     def get_note_tags(self, note_id: UUID) -> List[NoteTag]:
         """Get all tags associated with a note"""
@@ -80,6 +75,23 @@ class NoteRepository:
         
         return list(tags)
 
+    def get_tags_for_notes(self, note_ids: List[UUID]) -> Dict[UUID, List[NoteTag]]:
+        """Get the tags of several notes with a single query, keyed by note id"""
+        tags_by_note: Dict[UUID, List[NoteTag]] = {note_id: [] for note_id in note_ids}
+        if not note_ids:
+            return tags_by_note
+
+        rows = self.session.exec(
+            select(NoteTagMap.note_id, NoteTag)
+            .join(NoteTag, NoteTag.id == NoteTagMap.tag_id)
+            .where(NoteTagMap.note_id.in_(note_ids))
+        ).all()
+
+        for note_id, tag in rows:
+            tags_by_note[note_id].append(tag)
+
+        return tags_by_note
+
     def read_note_with_tags(self, note_id: str, user_id: str) -> NoteReadWithTags | None:
         """Read a note and include its associated tags"""
         note = self.read_note_by_id(note_id, user_id)
@@ -87,9 +99,30 @@ class NoteRepository:
             return None
         
         tags = self.get_note_tags(note.id)
-        tag_reads = [NoteTagRead(**tag.model_dump()) for tag in tags]
+        return self.to_note_read_with_tags(note, tags)
+
+    def read_all_notes_with_tags(self, topic_id: str, user_id: str) -> List[NoteReadWithTags]:
+        """Read all notes for a topic and include their associated tags"""
+        notes = self.read_all_notes(topic_id, user_id)
+        if not notes:
+            return []
         
-        # Create NoteReadWithTags explicitly
+        tags_by_note = self.get_tags_for_notes([note.id for note in notes])
+        return [self.to_note_read_with_tags(note, tags_by_note[note.id]) for note in notes]
+
+    def read_notes_with_tags_page(self, topic_id: str, user_id: str, limit: int, after: Optional[Cursor] = None) -> Tuple[List[NoteReadWithTags], Optional[str]]:
+        """Read one page of a topic's notes, oldest first, with their tags"""
+        statement = keyset_page(
+            select(Note).where(Note.user_id == user_id, Note.topic_id == topic_id),
+            Note.created_at, Note.id, after, limit
+        )
+        notes, next_cursor = split_page(list(self.session.exec(statement).all()), limit)
+
+        tags_by_note = self.get_tags_for_notes([note.id for note in notes])
+        return [self.to_note_read_with_tags(note, tags_by_note[note.id]) for note in notes], next_cursor
+
+    @staticmethod
+    def to_note_read_with_tags(note: Note, tags: List[NoteTag]) -> NoteReadWithTags:
         return NoteReadWithTags(
             id=note.id,
             topic_id=note.topic_id,
@@ -98,30 +131,5 @@ class NoteRepository:
             urls=note.urls,
             created_at=note.created_at,
             updated_at=note.updated_at,
-            tags=tag_reads
+            tags=[NoteTagRead(**tag.model_dump()) for tag in tags]
         )
-
-    def read_all_notes_with_tags(self, topic_id: str, user_id: str) -> List[NoteReadWithTags]:
-        """Read all notes for a topic and include their associated tags"""
-        notes = self.read_all_notes(topic_id, user_id)
-        if not notes:
-            return []
-        
-        result = []
-        for note in notes:
-            tags = self.get_note_tags(note.id)
-            tag_reads = [NoteTagRead(**tag.model_dump()) for tag in tags]
-            
-            note_with_tags = NoteReadWithTags(
-                id=note.id,
-                topic_id=note.topic_id,
-                title=note.title,
-                content=note.content,
-                urls=note.urls,
-                created_at=note.created_at,
-                updated_at=note.updated_at,
-                tags=tag_reads
-            )
-            result.append(note_with_tags)
-        
-        return result
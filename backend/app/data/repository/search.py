@@ -0,0 +1,150 @@
+import html
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Float, cast, func, literal, literal_column, or_, tuple_, union_all
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
+from sqlmodel import select
+
+from app.core.pagination import RankCursor, encode_rank_cursor
+from app.models import Note, SearchHit, Topic
+
+# Must match the text search configuration of the generated search_vector
+# columns (migration b4f1d8a2c6e3)
+SEARCH_CONFIG = "english"
+
+# ts_headline markers; the snippet is HTML-escaped after they are placed and
+# they are then swapped for <mark> tags, so note content can't inject markup
+_START, _STOP = "\x02", "\x03"
+HEADLINE_OPTIONS = f"StartSel={_START}, StopSel={_STOP}, MaxWords=35, MinWords=15, MaxFragments=2, FragmentDelimiter=\" … \""
+
+# Characters of context kept on each side of a match by the SQLite fallback
+SNIPPET_CONTEXT = 80
+
+
+def _to_html(snippet: str) -> str:
+    return html.escape(snippet).replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+
+class SearchRepository:
+    def __init__(self, session):
+        self.session = session
+
+    def search(self, user_id: str, query: str, limit: int, after: Optional[RankCursor] = None) -> Tuple[List[SearchHit], Optional[str]]:
+        """Search the user's notes and topics, best match first"""
+        if self.session.get_bind().dialect.name == "postgresql":
+            hits = self._search_postgres(user_id, query, limit, after)
+        else:
+            hits = self._search_substring(user_id, query, limit, after)
+
+        if len(hits) <= limit:
+            return hits, None
+        hits = hits[:limit]
+        return hits, encode_rank_cursor(hits[-1].rank, hits[-1].id)
+
+    def _search_postgres(self, user_id: str, query: str, limit: int, after: Optional[RankCursor]) -> List[SearchHit]:
+        config = cast(literal(SEARCH_CONFIG), REGCONFIG)
+        tsquery = func.websearch_to_tsquery(config, query)
+        note_vector = literal_column("notes.search_vector", TSVECTOR)
+        topic_vector = literal_column("topics.search_vector", TSVECTOR)
+
+        # Matching and ranking only touch the GIN-indexed vectors; the page is
+        # cut before any text is read back for highlighting
+        matches = union_all(
+            select(
+                literal("note").label("kind"),
+                Note.id.label("id"),
+                Note.topic_id.label("topic_id"),
+                cast(func.ts_rank(note_vector, tsquery), Float).label("rank"),
+            ).where(Note.user_id == user_id, note_vector.op("@@")(tsquery)),
+            select(
+                literal("topic"),
+                Topic.id,
+                Topic.id,
+                cast(func.ts_rank(topic_vector, tsquery), Float),
+            ).where(Topic.user_id == user_id, topic_vector.op("@@")(tsquery)),
+        ).subquery("matches")
+
+        page = select(*matches.c)
+        if after is not None:
+            page = page.where(tuple_(matches.c.rank, matches.c.id) < tuple_(*after))
+        page = page.order_by(matches.c.rank.desc(), matches.c.id.desc()).limit(limit + 1).subquery("page")
+
+        body = func.coalesce(Note.content, Topic.description, Topic.title, "")
+        statement = (
+            select(
+                page.c.kind,
+                page.c.id,
+                page.c.topic_id,
+                page.c.rank,
+                func.coalesce(Note.title, Topic.title).label("title"),
+                func.coalesce(Note.created_at, Topic.created_at).label("created_at"),
+                func.ts_headline(config, body, tsquery, HEADLINE_OPTIONS).label("snippet"),
+            )
+            .select_from(page)
+            .outerjoin(Note, Note.id == page.c.id)
+            .outerjoin(Topic, Topic.id == page.c.id)
+            .order_by(page.c.rank.desc(), page.c.id.desc())
+        )
+        return [
+            SearchHit(**{**row._mapping, "snippet": _to_html(row.snippet)})
+            for row in self.session.exec(statement)
+        ]
+
+    def _search_substring(self, user_id: str, query: str, limit: int, after: Optional[RankCursor]) -> List[SearchHit]:
+        """Case-insensitive substring match for databases without full text search (SQLite)
+
+        Every hit ranks 0, so pages are ordered by id alone.
+        """
+        needle = query.lower()
+        matches = union_all(
+            select(
+                literal("note").label("kind"),
+                Note.id.label("id"),
+                Note.topic_id.label("topic_id"),
+                Note.title.label("title"),
+                Note.content.label("body"),
+                Note.created_at.label("created_at"),
+            ).where(Note.user_id == user_id, or_(
+                func.lower(Note.title).contains(needle, autoescape=True),
+                func.lower(Note.content).contains(needle, autoescape=True),
+            )),
+            select(
+                literal("topic"),
+                Topic.id,
+                Topic.id,
+                Topic.title,
+                func.coalesce(Topic.description, Topic.title),
+                Topic.created_at,
+            ).where(Topic.user_id == user_id, or_(
+                func.lower(Topic.title).contains(needle, autoescape=True),
+                func.lower(Topic.description).contains(needle, autoescape=True),
+            )),
+        ).subquery("matches")
+
+        statement = select(*matches.c)
+        if after is not None:
+            statement = statement.where(matches.c.id < after[1])
+        statement = statement.order_by(matches.c.id.desc()).limit(limit + 1)
+
+        return [
+            SearchHit(
+                kind=row.kind,
+                id=row.id,
+                topic_id=row.topic_id,
+                title=row.title,
+                snippet=self._substring_snippet(row.body or "", query),
+                rank=0.0,
+                created_at=row.created_at,
+            )
+            for row in self.session.exec(statement)
+        ]
+
+    @staticmethod
+    def _substring_snippet(text: str, query: str) -> str:
+        match = re.search(re.escape(query), text, re.IGNORECASE)
+        if match is None:
+            return _to_html(text[:2 * SNIPPET_CONTEXT])
+        start = max(match.start() - SNIPPET_CONTEXT, 0)
+        end = match.end() + SNIPPET_CONTEXT
+        return _to_html(text[start:match.start()] + _START + match.group(0) + _STOP + text[match.end():end])
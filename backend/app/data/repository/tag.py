@@ -1,8 +1,10 @@
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from sqlalchemy import delete
 from sqlmodel import select
 
+from app.core.pagination import Cursor, keyset_page, split_page
 from app.models import NoteTag, NoteTagCreate, NoteTagUpdate
 
 
@@ -11,9 +13,8 @@ class TagRepository:
         self.session = session
 
     def create_tag(self, tag: NoteTag) -> NoteTag:
-        self.session.add(tag)
-        self.session.commit()
-        self.session.refresh(tag)
+        with self.session.begin_nested():
+            self.session.add(tag)
         return tag
 
     def get_tag_by_id(self, tag_id: str, user_id: str) -> Optional[NoteTag]:
@@ -44,13 +45,17 @@ class TagRepository:
         ).all()
         return list(tags)
 
+    def get_tags_page(self, user_id: str, limit: int, after: Optional[Cursor] = None) -> Tuple[List[NoteTag], Optional[str]]:
+        user_uuid = UUID(user_id)
+        statement = keyset_page(select(NoteTag).where(NoteTag.user_id == user_uuid), NoteTag.created_at, NoteTag.id, after, limit)
+        tags = self.session.exec(statement).all()
+        return split_page(list(tags), limit)
+
     def update_tag(self, tag: NoteTag) -> NoteTag:
         self.session.add(tag)
-        self.session.commit()
-        self.session.refresh(tag)
+        self.session.flush()
         return tag
 
-    def delete_tag(self, tag: NoteTag) -> bool:
-        self.session.delete(tag)
-        self.session.commit()
-        return True
\ No newline at end of file
+    def delete_tag(self, tag_id: str, user_id: str) -> bool:
+        statement = delete(NoteTag).where(NoteTag.id == UUID(tag_id), NoteTag.user_id == UUID(user_id)).returning(NoteTag.id)
+        return self.session.exec(statement).first() is not None
\ No newline at end of file
@@ -1,10 +1,15 @@
-from typing import List
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
 
+from sqlalchemy import JSON, Uuid, bindparam, column, delete, func, update, values
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import defer
 from sqlmodel import select
 from app.core.domain import Success, Error
+from app.core.pagination import Cursor, keyset_page, split_page
+from app.data.dialects import is_foreign_key_violation
 from app.domain.models import TopicError
-from app.models import Topic
+from app.models import Note, Topic
 
 class TopicRepository:
     def __init__(self, session):
@@ -12,10 +17,12 @@ class TopicRepository:
 
     def create_topic(self, topic: Topic) -> Success[Topic] | Error[TopicError]:
         try:
-            self.session.add(topic)
-            self.session.commit()
-            self.session.refresh(topic)
-        except IntegrityError:
+            # Savepoint, so a duplicate title doesn't abort the request's transaction
+            with self.session.begin_nested():
+                self.session.add(topic)
+        except IntegrityError as error:
+            if is_foreign_key_violation(error):
+                raise  # The user is gone; see integrity_error_handler
             return Error(TopicError.ALREADY_EXISTS)
 
         return Success(topic)
@@ -24,20 +31,62 @@ class TopicRepository:
         topic: Topic = self.session.exec(select(Topic).where(Topic.id == topic_id, Topic.user_id == user_id)).first()
         return topic
 
-    def get_all_topics(self, user_id: str) -> List[Topic] | None:
-        topics: List[Topic] = self.session.exec(select(Topic).where(Topic.user_id == user_id)).all()
+    def get_all_topics(self, user_id: str, include_description: bool = True) -> List[Topic] | None:
+        statement = select(Topic).where(Topic.user_id == user_id)
+        if not include_description:
+            # Leave the description column out of the SELECT entirely
+            statement = statement.options(defer(Topic.description, raiseload=True))
+        topics: List[Topic] = self.session.exec(statement).all()
         return topics
 
+    def get_topics_page(self, user_id: str, limit: int, after: Optional[Cursor] = None) -> Tuple[List[Topic], Optional[str]]:
+        statement = keyset_page(select(Topic).where(Topic.user_id == user_id), Topic.created_at, Topic.id, after, limit)
+        topics: List[Topic] = self.session.exec(statement).all()
+        return split_page(topics, limit)
+
     def update_topic(self, topic: Topic) -> Topic | None:
+        # Stamped by the database, even when only related rows changed
+        topic.updated_at = func.now()
         self.session.add(topic)
-        self.session.commit()
-        self.session.refresh(topic)
+        self.session.flush()
         return topic
 
+    def update_positions(self, user_id: str, positions: Dict[UUID, dict]) -> int:
+        if not positions:
+            return 0
+        if self.session.get_bind().dialect.name != "postgresql":
+            # SQLite can't alias VALUES columns; one executemany UPDATE instead
+            statement = (
+                update(Topic.__table__)
+                .where(Topic.id == bindparam("topic_id"), Topic.user_id == user_id)
+                .values(position=bindparam("new_position"))
+            )
+            params = [{"topic_id": topic_id, "new_position": position} for topic_id, position in positions.items()]
+            return self.session.connection().execute(statement, params).rowcount
+
+        # UPDATE topics ... FROM (VALUES (id, position), ...) in a single statement
+        rows = values(column("id", Uuid), column("position", JSON), name="new_positions").data(list(positions.items()))
+        statement = (
+            update(Topic)
+            .where(Topic.id == rows.c.id, Topic.user_id == user_id)
+            .values(position=rows.c.position)
+            .execution_options(synchronize_session=False)
+        )
+        result = self.session.exec(statement)
+        self.session.flush()
+        return result.rowcount
+
+    def has_at_least_notes(self, topic_id: str, user_id: str, threshold: int) -> bool:
+        """Whether the topic has ``threshold`` or more notes, without counting all of them"""
+        statement = (
+            select(Note.id)
+            .where(Note.topic_id == topic_id, Note.user_id == user_id)
+            .offset(max(threshold - 1, 0))
+            .limit(1)
+        )
+        return self.session.exec(statement).first() is not None
+
     def delete_topic(self, topic_id: str, user_id: str) -> bool:
-        topic: Topic = self.session.exec(select(Topic).where(Topic.id == topic_id, Topic.user_id == user_id)).first()
-        if topic is None:
-            return False
-        self.session.delete(topic)
-        self.session.commit()
-        return True
\ No newline at end of file
+        # Notes, edges and tag links go with it through the ON DELETE CASCADE foreign keys
+        statement = delete(Topic).where(Topic.id == topic_id, Topic.user_id == user_id).returning(Topic.id)
+        return self.session.exec(statement).first() is not None
\ No newline at end of file
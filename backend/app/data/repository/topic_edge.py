@@ -1,9 +1,10 @@
-from typing import List
+from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import delete
 from sqlmodel import select
 from app.core.domain import Success, Error
+from app.data.dialects import insert_ignoring_conflicts
 from app.domain.models import TopicEdgeError
 from app.models import TopicEdge, Topic
 
@@ -11,35 +12,6 @@ class TopicEdgeRepository:
     def __init__(self, session):
         self.session = session
 
-    def create_edge(self, edge: TopicEdge) -> Success[TopicEdge] | Error[TopicEdgeError]:
-        try:
-            source_topic = self.session.exec(select(Topic).where(Topic.id == edge.source)).first()
-            target_topic = self.session.exec(select(Topic).where(Topic.id == edge.target)).first()
-
-            if not source_topic or not target_topic:
-                return Error(TopicEdgeError.INVALID_EDGE)
-
-            if edge.source == edge.target:
-                return Error(TopicEdgeError.INVALID_EDGE)
-
-            existing_edge = self.session.exec(
-                select(TopicEdge).where(
-                    TopicEdge.source == edge.source,
-                    TopicEdge.target == edge.target
-                )
-            ).first()
-
-            if existing_edge:
-                return Error(TopicEdgeError.ALREADY_EXISTS)
-
-            self.session.add(edge)
-            self.session.commit()
-            self.session.refresh(edge)
-        except IntegrityError:
-            return Error(TopicEdgeError.ALREADY_EXISTS)
-
-        return Success(edge)
-
     def get_edge_by_id(self, edge_id: str) -> TopicEdge | None:
         edge: TopicEdge = self.session.exec(select(TopicEdge).where(TopicEdge.id == edge_id)).first()
         return edge
@@ -74,87 +46,96 @@ class TopicEdgeRepository:
 
     def update_edge(self, edge: TopicEdge) -> TopicEdge | None:
         self.session.add(edge)
-        self.session.commit()
-        self.session.refresh(edge)
+        self.session.flush()
         return edge
 
     def delete_edge(self, edge_id: str) -> bool:
-        edge: TopicEdge = self.session.exec(select(TopicEdge).where(TopicEdge.id == edge_id)).first()
-        if edge is None:
-            return False
-        self.session.delete(edge)
-        self.session.commit()
-        return True
+        statement = delete(TopicEdge).where(TopicEdge.id == edge_id).returning(TopicEdge.id)
+        return self.session.exec(statement).first() is not None
 
     def delete_edges_for_topic(self, topic_id: str) -> bool:
-        edges = self.session.exec(
-            select(TopicEdge).where(
+        self.session.exec(
+            delete(TopicEdge).where(
                 (TopicEdge.source == topic_id) | (TopicEdge.target == topic_id)
             )
-        ).all()
-
-        for edge in edges:
-            self.session.delete(edge)
-
-        self.session.commit()
+        )
         return True
 
     def delete_outgoing_edges_for_topic(self, topic_id: str) -> bool:
-        edges = self.session.exec(
-            select(TopicEdge).where(TopicEdge.source == topic_id)
-        ).all()
-
-        for edge in edges:
-            self.session.delete(edge)
-
-        self.session.commit()
+        self.session.exec(delete(TopicEdge).where(TopicEdge.source == topic_id))
         return True
 
-    def delete_edge_by_source_target(self, source_id: str, target_id: str) -> bool:
-        edge = self.session.exec(
-            select(TopicEdge).where(
-                (TopicEdge.source == source_id) & (TopicEdge.target == target_id)
+    def delete_edge_by_source_target(self, source_id: str, target_id: str, user_id: str) -> bool:
+        statement = (
+            delete(TopicEdge)
+            .where(
+                TopicEdge.source == source_id,
+                TopicEdge.target == target_id,
+                TopicEdge.source.in_(select(Topic.id).where(Topic.user_id == user_id)),
             )
-        ).first()
-
-        if edge:
-            self.session.delete(edge)
-            self.session.commit()
-            return True
-        return False
-
-    def create_multiple_edges(self, edges: List[TopicEdge]) -> Success[List[TopicEdge]] | Error[TopicEdgeError]:
-        try:
-            created_edges = []
-            for edge in edges:
-                source_topic = self.session.exec(select(Topic).where(Topic.id == edge.source)).first()
-                target_topic = self.session.exec(select(Topic).where(Topic.id == edge.target)).first()
-
-                if not source_topic or not target_topic:
-                    return Error(TopicEdgeError.INVALID_EDGE)
-
-                if edge.source == edge.target:
-                    return Error(TopicEdgeError.INVALID_EDGE)
-
-                existing_edge = self.session.exec(
-                    select(TopicEdge).where(
-                        TopicEdge.source == edge.source,
-                        TopicEdge.target == edge.target
-                    )
-                ).first()
-
-                if existing_edge:
-                    continue
-
+            .returning(TopicEdge.id)
+        )
+        return self.session.exec(statement).first() is not None
+
+    def create_edges(self, user_id: str, edges: List[TopicEdge], skip_invalid: bool = False) -> Success[List[TopicEdge]] | Error[TopicEdgeError]:
+        """Insert edges between the user's topics in one statement, returning only the new ones"""
+        result = self._insert_edges(user_id, edges, skip_invalid)
+        if isinstance(result, Success):
+            self.session.flush()
+        return result
+
+    def sync_outgoing_edges(self, user_id: str, source_id: UUID, targets: Dict[UUID, Optional[str]]) -> None:
+        """Make the topic's outgoing edges match ``targets`` (target id -> relation type) in one transaction"""
+        current = {
+            edge.target: edge
+            for edge in self.session.exec(select(TopicEdge).where(TopicEdge.source == source_id)).all()
+        }
+
+        stale = [edge.id for target, edge in current.items() if target not in targets]
+        if stale:
+            self.session.exec(delete(TopicEdge).where(TopicEdge.id.in_(stale)))
+
+        for target, relation_type in targets.items():
+            edge = current.get(target)
+            if edge is not None and edge.relation_type != relation_type:
+                edge.relation_type = relation_type
                 self.session.add(edge)
-                created_edges.append(edge)
-
-            self.session.commit()
-
-            for edge in created_edges:
-                self.session.refresh(edge)
-
-        except IntegrityError:
-            return Error(TopicEdgeError.ALREADY_EXISTS)
 
-        return Success(created_edges)
\ No newline at end of file
+        new_edges = [
+            TopicEdge(source=source_id, target=target, relation_type=relation_type)
+            for target, relation_type in targets.items()
+            if target not in current
+        ]
+        self._insert_edges(user_id, new_edges, skip_invalid=True)
+        self.session.flush()
+
+    def _insert_edges(self, user_id: str, edges: List[TopicEdge], skip_invalid: bool) -> Success[List[TopicEdge]] | Error[TopicEdgeError]:
+        endpoints = {edge.source for edge in edges} | {edge.target for edge in edges}
+        owned = set(self.session.exec(
+            select(Topic.id).where(Topic.id.in_(endpoints), Topic.user_id == user_id)
+        ).all()) if endpoints else set()
+
+        rows = {}
+        for edge in edges:
+            if edge.source == edge.target or edge.source not in owned or edge.target not in owned:
+                if skip_invalid:
+                    continue
+                return Error(TopicEdgeError.INVALID_EDGE)
+            rows.setdefault((edge.source, edge.target), {
+                "id": edge.id,
+                "source": edge.source,
+                "target": edge.target,
+                "relation_type": edge.relation_type,
+                "edge_metadata": edge.edge_metadata,
+            })
+
+        if not rows:
+            return Success([])
+
+        statement = (
+            insert_ignoring_conflicts(self.session.get_bind().dialect.name, TopicEdge, ["source", "target"])
+            .values(list(rows.values()))
+            .returning(*TopicEdge.__table__.columns)
+        )
+        created = [TopicEdge(**row._mapping) for row in self.session.exec(statement)]
+        return Success(created)
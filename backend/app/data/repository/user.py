@@ -1,8 +1,10 @@
+from typing import List
 from uuid import UUID
 
+from sqlalchemy import func
 from sqlmodel import select
 
-from app.models import User
+from app.models import User, Topic, TopicEdge, Note, NoteTag, TopicNoteCount
 
 
 class UserRepository:
@@ -10,9 +12,13 @@ class UserRepository:
         self.session = session
 
     def create_user(self, user: User):
+        with self.session.begin_nested():
+            self.session.add(user)
+        return user
+
+    def update_user(self, user: User) -> User:
         self.session.add(user)
-        self.session.commit()
-        self.session.refresh(user)
+        self.session.flush()
         return user
 
     def get_user_by_email(self, email: str) -> User | None:
@@ -22,4 +28,41 @@ class UserRepository:
     def get_user_by_id(self, user_id: str) -> User | None:
         user_uuid = UUID(user_id)
         user: User = self.session.exec(select(User).where(User.id == user_uuid)).first()
-        return user
\ No newline at end of file
+        return user
+
+    def get_stats_counts(self, user_id: str) -> dict:
+        """Count the user's topics, notes, tags and edges in a single statement"""
+        user_uuid = UUID(user_id)
+        topics_count = select(func.count(Topic.id)).where(Topic.user_id == user_uuid).scalar_subquery()
+        notes_count = select(func.count(Note.id)).where(Note.user_id == user_uuid).scalar_subquery()
+        tags_count = select(func.count(NoteTag.id)).where(NoteTag.user_id == user_uuid).scalar_subquery()
+        edges_count = (
+            select(func.count(TopicEdge.id))
+            .join(Topic, TopicEdge.source == Topic.id)
+            .where(Topic.user_id == user_uuid)
+            .scalar_subquery()
+        )
+
+        row = self.session.exec(select(topics_count, notes_count, tags_count, edges_count)).one()
+        return {
+            "topics_count": row[0],
+            "notes_count": row[1],
+            "tags_count": row[2],
+            "edges_count": row[3],
+        }
+
+    def get_topic_note_counts(self, user_id: str) -> List[TopicNoteCount]:
+        """Note count per topic, newest topics first"""
+        user_uuid = UUID(user_id)
+        rows = self.session.exec(
+            select(Topic.id, Topic.title, Topic.created_at, func.count(Note.id))
+            .outerjoin(Note, Note.topic_id == Topic.id)
+            .where(Topic.user_id == user_uuid)
+            .group_by(Topic.id, Topic.title, Topic.created_at)
+            .order_by(Topic.created_at.desc())
+        ).all()
+
+        return [
+            TopicNoteCount(id=topic_id, title=title, created_at=created_at, note_count=note_count)
+            for topic_id, title, created_at, note_count in rows
+        ]
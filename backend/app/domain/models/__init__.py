@@ -2,5 +2,7 @@ from .topic_errors import TopicError
 from .topic_edge_errors import TopicEdgeError
 from .user_errors import UserError
 from .tag_errors import TagError
+from .search_errors import SearchError
+from .job_errors import JobError
 
-__all__ = ["TopicError", "TopicEdgeError", "UserError", "TagError"]
\ No newline at end of file
+__all__ = ["TopicError", "TopicEdgeError", "UserError", "TagError", "SearchError", "JobError"]
\ No newline at end of file
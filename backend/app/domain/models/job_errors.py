@@ -0,0 +1,5 @@
+from enum import Enum, auto
+
+
+class JobError(Enum):
+    NOT_FOUND = auto()
@@ -6,3 +6,4 @@ class NoteError(Enum):
     ALREADY_EXISTS = auto()
     EMPTY = auto()
     INVALID_TAGS = auto()
+    INVALID_CURSOR = auto()
@@ -0,0 +1,6 @@
+from enum import Enum, auto
+
+
+class SearchError(Enum):
+    EMPTY_QUERY = auto()
+    INVALID_CURSOR = auto()
@@ -4,4 +4,5 @@ from enum import Enum, auto
 class TagError(Enum):
     NOT_FOUND = auto()
     ALREADY_EXISTS = auto()
-    EMPTY = auto()
\ No newline at end of file
+    EMPTY = auto()
+    INVALID_CURSOR = auto()
@@ -6,3 +6,4 @@ class TopicError(Enum):
     UNAUTHORIZED = auto()
     ALREADY_EXISTS = auto()
     EMPTY = auto()
+    INVALID_CURSOR = auto()
@@ -6,3 +6,6 @@ class UserError(Enum):
     UNAUTHORIZED = auto()
     ALREADY_EXISTS = auto()
     INVALID_CREDENTIALS = auto()
+    SERVICE_BUSY = auto()
+    UNSUPPORTED_COMPRESSION = auto()
+    IMPORT_CONFLICT = auto()
@@ -1,16 +1,29 @@
+from starlette.concurrency import run_in_threadpool
+
 from app.core.domain import Error, Success
+from app.core.hashing import hashing_pool, HashingPoolSaturated
 from app.data.repository import UserRepository
 from app.domain.models import UserError
 from app.models import UserLogin, User
-from app.util import verify_password
 
 
-def login_user(user_login: UserLogin, user_repository: UserRepository) -> Success[User] | Error[UserError]:
-    user = user_repository.get_user_by_email(user_login.email)
+async def login_user(user_login: UserLogin, user_repository: UserRepository) -> Success[User] | Error[UserError]:
+    user = await run_in_threadpool(user_repository.get_user_by_email, user_login.email)
     if user is None:
         return Error(UserError.INVALID_CREDENTIALS)
 
-    if not verify_password(user_login.password, user.hashed_password):
-        return Error(UserError.INVALID_CREDENTIALS)
+    try:
+        if not await hashing_pool.verify(user_login.password, user.hashed_password):
+            return Error(UserError.INVALID_CREDENTIALS)
+    except HashingPoolSaturated:
+        return Error(UserError.SERVICE_BUSY)
+
+    # Upgrade the stored hash when the configured bcrypt cost has changed
+    if hashing_pool.needs_rehash(user.hashed_password):
+        try:
+            user.hashed_password = await hashing_pool.hash(user_login.password)
+            await run_in_threadpool(user_repository.update_user, user)
+        except HashingPoolSaturated:
+            pass  # Retry on a later login
 
-    return Success(user)
\ No newline at end of file
+    return Success(user)
@@ -0,0 +1,3 @@
+from .read_job_by_id import read_job_by_id
+
+__all__ = ["read_job_by_id"]
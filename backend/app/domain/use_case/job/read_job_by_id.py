@@ -0,0 +1,11 @@
+from app.core.domain import Error, Success
+from app.data.repository import JobRepository
+from app.domain.models import JobError
+from app.models import JobRead
+
+
+def read_job_by_id(job_id: str, user_id: str, job_repository: JobRepository) -> Success[JobRead] | Error[JobError]:
+    job = job_repository.read_job(job_id, user_id)
+    if job is None:
+        return Error(JobError.NOT_FOUND)
+    return Success(JobRead.model_validate(job))
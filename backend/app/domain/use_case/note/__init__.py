@@ -1,7 +1,8 @@
 from .create_new_note import create_new_note
-from .read_all_notes import read_all_notes_by_topic_id
-from .read_note_by_id import read_note_by_id
+from .read_all_notes import read_all_notes_by_topic_id, read_all_notes_by_topic_id_async
+from .read_note_by_id import read_note_by_id, read_note_by_id_async
 from .update_note_by_id import update_note_by_id
 from .delete_note_by_id import delete_note_by_id
+from .read_similar_notes import read_similar_notes
 
-__all__ = ["create_new_note", "read_all_notes_by_topic_id", "read_note_by_id", "update_note_by_id", "delete_note_by_id"]
+__all__ = ["create_new_note", "read_all_notes_by_topic_id", "read_note_by_id", "update_note_by_id", "delete_note_by_id", "read_all_notes_by_topic_id_async", "read_note_by_id_async", "read_similar_notes"]
@@ -1,4 +1,4 @@
-from datetime import datetime
+from uuid import UUID
 
 from app.core.domain import Error, Success
 from app.data.repository import NoteRepository
@@ -18,9 +18,7 @@ def create_new_note(note: NoteCreate, user_id: str, note_repository: NoteReposit
     # Create note
     db_note = Note(
         **note_data,
-        user_id=user_id,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        user_id=UUID(user_id),
     )
     created_note = note_repository.create_note(db_note)
     
@@ -1,13 +1,32 @@
-from typing import List
+from typing import Optional
 
 from app.core.domain import Error, Success
+from app.core.pagination import decode_cursor
+from app.data.async_repository import AsyncNoteRepository
 from app.data.repository import NoteRepository
 from app.domain.models.note_errors import NoteError
-from app.models import NoteReadWithTags
+from app.models import NoteReadWithTags, Page
 
 
-def read_all_notes_by_topic_id(topic_id: str, user_id: str, note_repository: NoteRepository) -> Success[List[NoteReadWithTags]] | Error[NoteError]:
-    notes_with_tags = note_repository.read_all_notes_with_tags(topic_id, user_id)
-    if not notes_with_tags:
+def read_all_notes_by_topic_id(topic_id: str, user_id: str, note_repository: NoteRepository, limit: int, cursor: Optional[str] = None) -> Success[Page[NoteReadWithTags]] | Error[NoteError]:
+    try:
+        after = decode_cursor(cursor)
+    except ValueError:
+        return Error(NoteError.INVALID_CURSOR)
+
+    notes_with_tags, next_cursor = note_repository.read_notes_with_tags_page(topic_id, user_id, limit, after)
+    if after is None and not notes_with_tags:
+        return Error(NoteError.NOT_FOUND)
+    return Success(Page[NoteReadWithTags](items=notes_with_tags, next_cursor=next_cursor))
+
+
+async def read_all_notes_by_topic_id_async(topic_id: str, user_id: str, note_repository: AsyncNoteRepository, limit: int, cursor: Optional[str] = None) -> Success[Page[NoteReadWithTags]] | Error[NoteError]:
+    try:
+        after = decode_cursor(cursor)
+    except ValueError:
+        return Error(NoteError.INVALID_CURSOR)
+
+    notes_with_tags, next_cursor = await note_repository.read_notes_with_tags_page(topic_id, user_id, limit, after)
+    if after is None and not notes_with_tags:
         return Error(NoteError.NOT_FOUND)
-    return Success(notes_with_tags)
\ No newline at end of file
+    return Success(Page[NoteReadWithTags](items=notes_with_tags, next_cursor=next_cursor))
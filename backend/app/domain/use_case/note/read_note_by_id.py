@@ -1,4 +1,5 @@
 from app.core.domain import Error, Success
+from app.data.async_repository import AsyncNoteRepository
 from app.data.repository import NoteRepository
 from app.domain.models.note_errors import NoteError
 from app.models import NoteReadWithTags
@@ -8,4 +9,11 @@ def read_note_by_id(note_id: str, user_id: str, note_repository: NoteRepository)
     note_with_tags = note_repository.read_note_with_tags(note_id, user_id)
     if note_with_tags is None:
         return Error(NoteError.NOT_FOUND)
-    return Success(note_with_tags)
\ No newline at end of file
+    return Success(note_with_tags)
+
+
+async def read_note_by_id_async(note_id: str, user_id: str, note_repository: AsyncNoteRepository) -> Success[NoteReadWithTags] | Error[NoteError]:
+    note_with_tags = await note_repository.read_note_with_tags(note_id, user_id)
+    if note_with_tags is None:
+        return Error(NoteError.NOT_FOUND)
+    return Success(note_with_tags)
@@ -0,0 +1,22 @@
+from typing import List
+
+import numpy as np
+
+from app.core.domain import Error, Success
+from app.core.embeddings import Embedder, note_text
+from app.data.repository import NoteEmbeddingRepository
+from app.domain.models.note_errors import NoteError
+from app.models import SimilarNote
+
+
+def read_similar_notes(note_id: str, user_id: str, embedding_repository: NoteEmbeddingRepository, embedder: Embedder, limit: int) -> Success[List[SimilarNote]] | Error[NoteError]:
+    row = embedding_repository.read_note_vector(note_id, user_id, embedder.name)
+    if row is None:
+        return Error(NoteError.NOT_FOUND)
+
+    title, content, vector = row
+    if vector is None:
+        # Not embedded yet (or edited since); embed it now rather than fail
+        vector = embedder.embed([note_text(title, content)])[0]
+    neighbours = embedding_repository.nearest(user_id, embedder.name, np.asarray(vector), limit, exclude_note_id=note_id)
+    return Success(neighbours)
@@ -1,5 +1,3 @@
-from datetime import datetime
-
 from app.core.domain import Error, Success
 from app.data.repository import NoteRepository
 from app.domain.models.note_errors import NoteError
@@ -22,7 +20,6 @@ def update_note_by_id(note_id: str, user_id: str, note_update: NoteUpdate, note_
     # Update note fields
     existing_note.title = note_update.title if note_update.title is not None else existing_note.title
     existing_note.content = note_update.content if note_update.content is not None else existing_note.content
-    existing_note.updated_at = datetime.now()
     existing_note.urls = note_update.urls if note_update.urls is not None else existing_note.urls
 
     updated_note = note_repository.update_note(existing_note)
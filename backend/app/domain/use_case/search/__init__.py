@@ -0,0 +1,4 @@
+from .search_notes_and_topics import search_notes_and_topics
+from .semantic_search import semantic_search
+
+__all__ = ["search_notes_and_topics", "semantic_search"]
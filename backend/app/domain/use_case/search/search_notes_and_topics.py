@@ -0,0 +1,21 @@
+from typing import Optional
+
+from app.core.domain import Success, Error
+from app.core.pagination import decode_rank_cursor
+from app.data.repository.search import SearchRepository
+from app.domain.models import SearchError
+from app.models import Page, SearchHit
+
+
+def search_notes_and_topics(user_id: str, query: str, search_repository: SearchRepository, limit: int, cursor: Optional[str] = None) -> Success[Page[SearchHit]] | Error[SearchError]:
+    query = query.strip()
+    if not query:
+        return Error(SearchError.EMPTY_QUERY)
+
+    try:
+        after = decode_rank_cursor(cursor)
+    except ValueError:
+        return Error(SearchError.INVALID_CURSOR)
+
+    hits, next_cursor = search_repository.search(user_id, query, limit, after)
+    return Success(Page[SearchHit](items=hits, next_cursor=next_cursor))
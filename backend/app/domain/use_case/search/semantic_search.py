@@ -0,0 +1,16 @@
+from typing import List
+
+from app.core.domain import Success, Error
+from app.core.embeddings import Embedder
+from app.data.repository import NoteEmbeddingRepository
+from app.domain.models import SearchError
+from app.models import SimilarNote
+
+
+def semantic_search(user_id: str, query: str, embedding_repository: NoteEmbeddingRepository, embedder: Embedder, limit: int) -> Success[List[SimilarNote]] | Error[SearchError]:
+    query = query.strip()
+    if not query:
+        return Error(SearchError.EMPTY_QUERY)
+
+    vector = embedder.embed([query])[0]
+    return Success(embedding_repository.nearest(user_id, embedder.name, vector, limit))
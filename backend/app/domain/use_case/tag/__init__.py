@@ -1,7 +1,7 @@
 from .create_tag import create_tag
-from .read_all_tags import read_all_tags_by_user
-from .read_tag_by_id import read_tag_by_id
+from .read_all_tags import read_all_tags_by_user, read_all_tags_by_user_async
+from .read_tag_by_id import read_tag_by_id, read_tag_by_id_async
 from .update_tag_by_id import update_tag_by_id
 from .delete_tag_by_id import delete_tag_by_id
 
-__all__ = ["create_tag", "read_all_tags_by_user", "read_tag_by_id", "update_tag_by_id", "delete_tag_by_id"]
\ No newline at end of file
+__all__ = ["create_tag", "read_all_tags_by_user", "read_tag_by_id", "update_tag_by_id", "delete_tag_by_id", "read_all_tags_by_user_async", "read_tag_by_id_async"]
\ No newline at end of file
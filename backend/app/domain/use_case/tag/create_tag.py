@@ -1,6 +1,9 @@
+from uuid import UUID
+
 from sqlalchemy.exc import IntegrityError
 
 from app.core.domain import Success, Error
+from app.data.dialects import is_foreign_key_violation
 from app.data.repository.tag import TagRepository
 from app.domain.models.tag_errors import TagError
 from app.models import NoteTag, NoteTagCreate
@@ -12,8 +15,10 @@ def create_tag(tag: NoteTagCreate, user_id: str, tag_repository: TagRepository)
         return Error(TagError.ALREADY_EXISTS)
     
     try:
-        db_tag = NoteTag(**tag.model_dump(), user_id=user_id)
+        db_tag = NoteTag(**tag.model_dump(), user_id=UUID(user_id))
         created_tag = tag_repository.create_tag(db_tag)
         return Success(created_tag)
-    except IntegrityError:
+    except IntegrityError as error:
+        if is_foreign_key_violation(error):
+            raise  # The user is gone; see integrity_error_handler
         return Error(TagError.ALREADY_EXISTS)
\ No newline at end of file
@@ -4,9 +4,6 @@ from app.domain.models.tag_errors import TagError
 
 
 def delete_tag_by_id(tag_id: str, user_id: str, tag_repository: TagRepository) -> Success[bool] | Error[TagError]:
-    tag = tag_repository.get_tag_by_id(tag_id, user_id)
-    if tag is None:
+    if not tag_repository.delete_tag(tag_id, user_id):
         return Error(TagError.NOT_FOUND)
-    
-    result = tag_repository.delete_tag(tag)
-    return Success(result)
\ No newline at end of file
+    return Success(True)
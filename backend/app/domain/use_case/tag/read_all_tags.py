@@ -1,13 +1,32 @@
-from typing import List
+from typing import Optional
 
 from app.core.domain import Success, Error
+from app.core.pagination import decode_cursor
+from app.data.async_repository import AsyncTagRepository
 from app.data.repository.tag import TagRepository
 from app.domain.models.tag_errors import TagError
-from app.models import NoteTag
+from app.models import NoteTag, Page
 
 
-def read_all_tags_by_user(user_id: str, tag_repository: TagRepository) -> Success[List[NoteTag]] | Error[TagError]:
-    tags = tag_repository.get_all_tags_by_user(user_id)
-    if not tags:
+def read_all_tags_by_user(user_id: str, tag_repository: TagRepository, limit: int, cursor: Optional[str] = None) -> Success[Page[NoteTag]] | Error[TagError]:
+    try:
+        after = decode_cursor(cursor)
+    except ValueError:
+        return Error(TagError.INVALID_CURSOR)
+
+    tags, next_cursor = tag_repository.get_tags_page(user_id, limit, after)
+    if after is None and not tags:
+        return Error(TagError.EMPTY)
+    return Success(Page[NoteTag](items=tags, next_cursor=next_cursor))
+
+
+async def read_all_tags_by_user_async(user_id: str, tag_repository: AsyncTagRepository, limit: int, cursor: Optional[str] = None) -> Success[Page[NoteTag]] | Error[TagError]:
+    try:
+        after = decode_cursor(cursor)
+    except ValueError:
+        return Error(TagError.INVALID_CURSOR)
+
+    tags, next_cursor = await tag_repository.get_tags_page(user_id, limit, after)
+    if after is None and not tags:
         return Error(TagError.EMPTY)
-    return Success(tags)
\ No newline at end of file
+    return Success(Page[NoteTag](items=tags, next_cursor=next_cursor))
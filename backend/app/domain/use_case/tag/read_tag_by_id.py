@@ -1,4 +1,5 @@
 from app.core.domain import Success, Error
+from app.data.async_repository import AsyncTagRepository
 from app.data.repository.tag import TagRepository
 from app.domain.models.tag_errors import TagError
 from app.models import NoteTag
@@ -8,4 +9,11 @@ def read_tag_by_id(tag_id: str, user_id: str, tag_repository: TagRepository) ->
     tag = tag_repository.get_tag_by_id(tag_id, user_id)
     if tag is None:
         return Error(TagError.NOT_FOUND)
-    return Success(tag)
\ No newline at end of file
+    return Success(tag)
+
+
+async def read_tag_by_id_async(tag_id: str, user_id: str, tag_repository: AsyncTagRepository) -> Success[NoteTag] | Error[TagError]:
+    tag = await tag_repository.get_tag_by_id(tag_id, user_id)
+    if tag is None:
+        return Error(TagError.NOT_FOUND)
+    return Success(tag)
@@ -1,13 +1,20 @@
 from .create_topic import create_topic
-from .read_all_topics import read_all_topics
-from .read_topic_by_id import read_topic_by_id
+from .read_all_topics import read_all_topics, read_all_topics_async
+from .read_topic_by_id import read_topic_by_id, read_topic_by_id_async
 from .update_topic_by_id import update_topic_by_id
+from .update_topic_positions import update_topic_positions
 from .delete_topic_by_id import delete_topic_by_id
+from .read_topic_graph import read_topic_graph, read_topic_graph_async
 
 __all__ = [
     "create_topic",
     "read_all_topics",
     "read_topic_by_id",
     "update_topic_by_id",
-    "delete_topic_by_id"
+    "update_topic_positions",
+    "delete_topic_by_id",
+    "read_topic_graph",
+    "read_all_topics_async",
+    "read_topic_by_id_async",
+    "read_topic_graph_async"
 ]
\ No newline at end of file
@@ -1,6 +1,6 @@
 from app.data.repository import TopicRepository, TopicEdgeRepository
 from app.models import TopicCreate, User, Topic, TopicEdge
-from app.core.domain import Success, Error
+from app.core.domain import Error
 from app.domain.models import TopicError
 from uuid import UUID
 
@@ -21,19 +21,15 @@ def create_topic(topic: TopicCreate, user: User, topic_repository: TopicReposito
 
     if topic.related_topics:
         relation_types = topic.relation_types or []
-        created_edges = []
-
-        for i, target_topic_id in enumerate(topic.related_topics):
-            relation_type = relation_types[i] if i < len(relation_types) else None
-
-            edge = TopicEdge(
+        edges = [
+            TopicEdge(
                 source=created_topic.id,
                 target=UUID(str(target_topic_id)),
-                relation_type=relation_type
+                relation_type=relation_types[i] if i < len(relation_types) else None
             )
+            for i, target_topic_id in enumerate(topic.related_topics)
+        ]
 
-            edge_result = topic_edge_repository.create_edge(edge)
-            if isinstance(edge_result, Success):
-                created_edges.append(edge_result.data)
+        topic_edge_repository.create_edges(str(user.id), edges, skip_invalid=True)
 
     return topic_result
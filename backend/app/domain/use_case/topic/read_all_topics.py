@@ -1,17 +1,36 @@
-from typing import List
+from typing import List, Optional
 
 from app.core.domain import Success, Error
+from app.core.pagination import decode_cursor
+from app.data.async_repository import AsyncTopicRepository
 from app.data.repository import TopicRepository
 from app.domain.models import TopicError
-from app.models import User, TopicRead
+from app.models import User, TopicRead, Topic, Page
 
 
-def read_all_topics(user: User, topic_repository: TopicRepository) -> Success[List[TopicRead]] | Error[TopicError]:
-    topics = topic_repository.get_all_topics(str(user.id))
-    if len(topics) == 0:
+def read_all_topics(user: User, topic_repository: TopicRepository, limit: int, cursor: Optional[str] = None) -> Success[Page[TopicRead]] | Error[TopicError]:
+    try:
+        after = decode_cursor(cursor)
+    except ValueError:
+        return Error(TopicError.INVALID_CURSOR)
+
+    topics, next_cursor = topic_repository.get_topics_page(str(user.id), limit, after)
+    return _to_page(topics, next_cursor, after is None)
+
+
+async def read_all_topics_async(user: User, topic_repository: AsyncTopicRepository, limit: int, cursor: Optional[str] = None) -> Success[Page[TopicRead]] | Error[TopicError]:
+    try:
+        after = decode_cursor(cursor)
+    except ValueError:
+        return Error(TopicError.INVALID_CURSOR)
+
+    topics, next_cursor = await topic_repository.get_topics_page(str(user.id), limit, after)
+    return _to_page(topics, next_cursor, after is None)
+
+
+def _to_page(topics: List[Topic], next_cursor: Optional[str], first_page: bool) -> Success[Page[TopicRead]] | Error[TopicError]:
+    if first_page and len(topics) == 0:
         return Error(TopicError.EMPTY)
 
-    topic_read_list = []
-    for topic in topics:
-        topic_read_list.append(TopicRead(**topic.model_dump()))
-    return Success(topic_read_list)
\ No newline at end of file
+    topic_read_list = [TopicRead(**topic.model_dump()) for topic in topics]
+    return Success(Page[TopicRead](items=topic_read_list, next_cursor=next_cursor))
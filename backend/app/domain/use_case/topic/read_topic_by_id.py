@@ -1,4 +1,5 @@
 from app.core.domain import Success, Error
+from app.data.async_repository import AsyncTopicRepository
 from app.data.repository import TopicRepository
 from app.domain.models import TopicError
 from app.models import TopicRead
@@ -11,4 +12,12 @@ def read_topic_by_id(user_id: str, topic_id: str, topic_repository: TopicReposit
 
     topic_read = TopicRead(**topic.model_dump())
 
-    return Success(topic_read)
\ No newline at end of file
+    return Success(topic_read)
+
+
+async def read_topic_by_id_async(user_id: str, topic_id: str, topic_repository: AsyncTopicRepository) -> Success[TopicRead] | Error[TopicError]:
+    topic = await topic_repository.get_topic_by_id(topic_id, user_id)
+    if topic is None:
+        return Error(TopicError.NOT_FOUND)
+
+    return Success(TopicRead(**topic.model_dump()))
@@ -0,0 +1,50 @@
+from typing import List
+
+from app.core.domain import Success
+from app.data.async_repository import AsyncTopicRepository, AsyncTopicEdgeRepository
+from app.data.repository import TopicRepository, TopicEdgeRepository
+from app.models import User, Topic, TopicEdge, TopicRead, TopicEdgeRead, TopicGraphRead
+
+
+def read_topic_graph(user: User, topic_repository: TopicRepository, topic_edge_repository: TopicEdgeRepository, include_description: bool = True) -> Success[TopicGraphRead]:
+    user_id = str(user.id)
+    topics = topic_repository.get_all_topics(user_id, include_description=include_description)
+    edges = topic_edge_repository.get_edges_for_user(user_id)
+
+    return Success(_build_graph(topics, edges, include_description))
+
+
+async def read_topic_graph_async(user: User, topic_repository: AsyncTopicRepository, topic_edge_repository: AsyncTopicEdgeRepository, include_description: bool = True) -> Success[TopicGraphRead]:
+    user_id = str(user.id)
+    topics = await topic_repository.get_all_topics(user_id, include_description=include_description)
+    edges = await topic_edge_repository.get_edges_for_user(user_id)
+
+    return Success(_build_graph(topics, edges, include_description))
+
+
+def _build_graph(topics: List[Topic], edges: List[TopicEdge], include_description: bool) -> TopicGraphRead:
+    topic_read_list = [
+        TopicRead(
+            id=topic.id,
+            title=topic.title,
+            description=topic.description if include_description else None,
+            node_type=topic.node_type,
+            position=topic.position,
+            user_id=topic.user_id,
+            created_at=topic.created_at,
+            updated_at=topic.updated_at,
+        )
+        for topic in topics
+    ]
+    edge_read_list = [
+        TopicEdgeRead(
+            id=edge.id,
+            source=edge.source,
+            target=edge.target,
+            relation_type=edge.relation_type,
+            edge_metadata=edge.edge_metadata,
+        )
+        for edge in edges
+    ]
+
+    return TopicGraphRead(topics=topic_read_list, edges=edge_read_list)
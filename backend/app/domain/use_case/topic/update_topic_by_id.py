@@ -1,10 +1,10 @@
-from datetime import datetime
+from typing import Dict, Optional
 from uuid import UUID
 
 from app.core.domain import Success, Error
 from app.data.repository import TopicRepository, TopicEdgeRepository
 from app.domain.models import TopicError
-from app.models import TopicUpdate, TopicRead, Topic, TopicEdge
+from app.models import TopicUpdate, TopicRead, Topic
 
 
 def update_topic_by_id(topic_id: str, user_id: str, topic: TopicUpdate, topic_repository: TopicRepository, topic_edge_repository: TopicEdgeRepository = None) -> Success[TopicRead] | Error[TopicError]:
@@ -14,7 +14,6 @@ def update_topic_by_id(topic_id: str, user_id: str, topic: TopicUpdate, topic_re
 
     existing_topic.title = topic.title or existing_topic.title
     existing_topic.description = topic.description or existing_topic.description
-    existing_topic.updated_at = datetime.now()
     existing_topic.node_type = topic.node_type or existing_topic.node_type
     if topic.position is not None:
         existing_topic.position = topic.position
@@ -22,21 +21,13 @@ def update_topic_by_id(topic_id: str, user_id: str, topic: TopicUpdate, topic_re
     updated_topic: Topic = topic_repository.update_topic(existing_topic)
 
     if topic.related_topics is not None and topic_edge_repository is not None:
-        topic_edge_repository.delete_outgoing_edges_for_topic(topic_id)
+        relation_types = topic.relation_types or []
+        targets: Dict[UUID, Optional[str]] = {}
+        for i, target_topic_id in enumerate(topic.related_topics):
+            # The first occurrence of a target decides its relation type
+            targets.setdefault(UUID(str(target_topic_id)), relation_types[i] if i < len(relation_types) else None)
 
-        if topic.related_topics:
-            relation_types = topic.relation_types or []
-
-            for i, target_topic_id in enumerate(topic.related_topics):
-                relation_type = relation_types[i] if i < len(relation_types) else None
-
-                edge = TopicEdge(
-                    source=UUID(topic_id),
-                    target=UUID(str(target_topic_id)),
-                    relation_type=relation_type
-                )
-
-                topic_edge_repository.create_edge(edge)
+        topic_edge_repository.sync_outgoing_edges(user_id, updated_topic.id, targets)
 
     return Success(TopicRead(
         id=updated_topic.id,
@@ -0,0 +1,18 @@
+from typing import Dict, List
+from uuid import UUID
+
+from app.core.domain import Success, Error
+from app.data.repository import TopicRepository
+from app.domain.models import TopicError
+from app.models import TopicPositionUpdate
+
+
+def update_topic_positions(user_id: str, positions: List[TopicPositionUpdate], topic_repository: TopicRepository) -> Success[int] | Error[TopicError]:
+    # Last write wins when the same topic appears more than once
+    by_id: Dict[UUID, dict] = {item.id: item.position.model_dump() for item in positions}
+
+    updated = topic_repository.update_positions(user_id, by_id)
+    if by_id and updated == 0:
+        return Error(TopicError.NOT_FOUND)
+
+    return Success(updated)
@@ -0,0 +1,18 @@
+from uuid import UUID
+
+from app.core.cache import invalidate_user, stats_cache
+from app.core.chunked_delete import ChunkedDeleter, chunked_deleter
+from app.core.domain import Error, Success
+from app.domain.models import UserError
+
+
+def delete_user(user_id: str, deleter: ChunkedDeleter = chunked_deleter) -> Success[bool] | Error[UserError]:
+    deleted = deleter.delete_user(user_id)
+
+    # Stop serving the cached principal so outstanding tokens are rejected
+    invalidate_user(user_id)
+    stats_cache.invalidate(UUID(user_id))
+
+    if not deleted:
+        return Error(UserError.NOT_FOUND)
+    return Success(True)
@@ -0,0 +1,59 @@
+import json
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Iterator
+from uuid import UUID
+
+from app.core.domain import Error, Success
+from app.data.repository import ExportRepository
+from app.domain.models import UserError
+from app.util.compression import compressor, zstd_available
+
+EXPORT_FORMAT_VERSION = 1
+
+# Encoded lines are gathered into chunks of about this size before being
+# compressed and sent, instead of one network write per row
+CHUNK_BYTES = 64 * 1024
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Cannot export {type(value).__name__}")
+
+
+def _line(record: dict) -> bytes:
+    return json.dumps(record, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+
+
+def _stream(user_id: str, session_factory, compression: str) -> Iterator[bytes]:
+    packer = compressor(compression)
+    counts = Counter()
+    chunk = bytearray(_line({
+        "type": "export",
+        "version": EXPORT_FORMAT_VERSION,
+        "exported_at": datetime.now(timezone.utc),
+    }))
+
+    with session_factory() as session:
+        for record in ExportRepository(session).iter_records(user_id):
+            counts[record["type"]] += 1
+            chunk += _line(record)
+            if len(chunk) >= CHUNK_BYTES:
+                compressed = packer.compress(bytes(chunk))
+                chunk.clear()
+                if compressed:
+                    yield compressed
+
+    # The status line has long been sent by now, so a failure midway can only
+    # cut the stream short; a missing "end" record is how readers notice
+    chunk += _line({"type": "end", "counts": dict(counts)})
+    yield packer.compress(bytes(chunk)) + packer.flush()
+
+
+def export_user_data(user_id: str, session_factory, compression: str = "none") -> Success[Iterator[bytes]] | Error[UserError]:
+    if compression == "zstd" and not zstd_available():
+        return Error(UserError.UNSUPPORTED_COMPRESSION)
+    return Success(_stream(user_id, session_factory, compression))
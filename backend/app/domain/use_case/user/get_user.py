@@ -1,4 +1,6 @@
+from app.core.cache import user_cache
 from app.core.domain import Error, Success
+from app.data.async_repository import AsyncUserRepository
 from app.data.repository import UserRepository
 from app.domain.models import UserError
 from app.models import User
@@ -6,8 +8,38 @@ from app.models import User
 
 def get_user(decoded_token : dict, user_repository: UserRepository) -> Success[User] | Error[UserError]:
     user_id = decoded_token.get("userId")
+    cached_user = user_cache.get(user_id)
+    if cached_user is not None:
+        return Success(cached_user)
+
     user = user_repository.get_user_by_id(user_id)
     if user is None:
         return Error(UserError.NOT_FOUND)
 
-    return Success(user)
\ No newline at end of file
+    _cache_user(user_id, user)
+    return Success(user)
+
+
+async def get_user_async(decoded_token : dict, user_repository: AsyncUserRepository) -> Success[User] | Error[UserError]:
+    user_id = decoded_token.get("userId")
+    cached_user = user_cache.get(user_id)
+    if cached_user is not None:
+        return Success(cached_user)
+
+    user = await user_repository.get_user_by_id(user_id)
+    if user is None:
+        return Error(UserError.NOT_FOUND)
+
+    _cache_user(user_id, user)
+    return Success(user)
+
+
+def _cache_user(user_id: str, user: User) -> None:
+    # Cache a detached copy without the password hash; routes only need identity fields
+    user_cache.set(user_id, User(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        hashed_password="",
+        created_at=user.created_at,
+    ))
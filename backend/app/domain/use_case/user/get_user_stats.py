@@ -0,0 +1,32 @@
+from app.core.cache import stats_cache
+from app.core.domain import Success
+from app.data.async_repository import AsyncUserRepository
+from app.data.repository import UserRepository
+from app.models import User, UserStatsRead
+
+
+def get_user_stats(user: User, user_repository: UserRepository, recent_limit: int = 3) -> Success[UserStatsRead]:
+    stats: UserStatsRead | None = stats_cache.get(user.id)
+    if stats is None:
+        counts = user_repository.get_stats_counts(str(user.id))
+        topic_note_counts = user_repository.get_topic_note_counts(str(user.id))
+        stats = UserStatsRead(**counts, topic_note_counts=topic_note_counts)
+        stats_cache.set(user.id, stats)
+
+    return Success(_with_recent_topics(stats, recent_limit))
+
+
+async def get_user_stats_async(user: User, user_repository: AsyncUserRepository, recent_limit: int = 3) -> Success[UserStatsRead]:
+    stats: UserStatsRead | None = stats_cache.get(user.id)
+    if stats is None:
+        counts = await user_repository.get_stats_counts(str(user.id))
+        topic_note_counts = await user_repository.get_topic_note_counts(str(user.id))
+        stats = UserStatsRead(**counts, topic_note_counts=topic_note_counts)
+        stats_cache.set(user.id, stats)
+
+    return Success(_with_recent_topics(stats, recent_limit))
+
+
+def _with_recent_topics(stats: UserStatsRead, recent_limit: int) -> UserStatsRead:
+    # topic_note_counts is ordered newest first
+    return stats.model_copy(update={"recent_topics": stats.topic_note_counts[:recent_limit]})
@@ -0,0 +1,286 @@
+import json
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+
+from app.core.domain import Error, Success
+from app.data.dialects import is_foreign_key_violation
+from app.data.repository import ImportRepository
+from app.domain.models import UserError
+from app.domain.use_case.user.export_user_data import EXPORT_FORMAT_VERSION
+from app.models import (
+    ImportEdge, ImportNote, ImportNoteTag, ImportResult, ImportRowError, ImportTag, ImportTopic,
+    Note, NoteTag, NoteTagMap, Topic, TopicEdge,
+)
+from app.util.ids import new_id
+
+RECORD_MODELS = {
+    "topic": ImportTopic,
+    "edge": ImportEdge,
+    "tag": ImportTag,
+    "note": ImportNote,
+    "note_tag": ImportNoteTag,
+}
+
+# Rejected lines listed in the result; the rest are only counted
+MAX_REPORTED_ERRORS = 1000
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[datetime]:
+    # Timestamps are stored as naive UTC
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _with_timestamps(row: dict, record) -> dict:
+    # Left out when not given, so the column default fills them in
+    for name in ("created_at", "updated_at"):
+        value = _timestamp(getattr(record, name, None))
+        if value is not None:
+            row[name] = value
+    return row
+
+
+def _as_uuid(reference) -> Optional[UUID]:
+    try:
+        return UUID(str(reference))
+    except ValueError:
+        return None
+
+
+class _Import:
+    """One import: parse every line, resolve references, then write what is valid"""
+
+    def __init__(self, user_id: str, import_repository: ImportRepository):
+        self.user_id = user_id
+        self.repository = import_repository
+        self.records: Dict[str, list] = {kind: [] for kind in RECORD_MODELS}
+        self.errors: List[ImportRowError] = []
+        self.error_count = 0
+        # Temporary id -> new id, per record type
+        self.ids: Dict[str, Dict[str, UUID]] = {"topic": {}, "tag": {}, "note": {}}
+        # UUID references to rows the user already has, per record type
+        self.owned: Dict[str, set] = {"topic": set(), "tag": set(), "note": set()}
+        self.rejected: Dict[str, set] = {"topic": set(), "tag": set(), "note": set()}
+        self.rows: Dict[str, list] = {kind: [] for kind in RECORD_MODELS}
+        # Edges and tag links between existing rows that are already there
+        self.skipped: Dict[str, int] = {"edge": 0, "note_tag": 0}
+
+    def reject(self, line: int, kind: Optional[str], message: str, temp_id=None) -> None:
+        """Skip a line; records referring to its temporary id are then skipped too"""
+        if temp_id is not None and str(temp_id) not in self.ids[kind]:
+            self.rejected[kind].add(str(temp_id))
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ImportRowError(line=line, type=kind, message=message))
+
+    def parse(self, lines: Iterable[bytes]) -> None:
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                self.reject(line_number, None, "Not valid JSON.")
+                continue
+            kind = record.get("type") if isinstance(record, dict) else None
+            if not isinstance(kind, str):
+                self.reject(line_number, None, "Not a record: expected an object with a \"type\".")
+                continue
+
+            if kind == "export":
+                if record.get("version") != EXPORT_FORMAT_VERSION:
+                    self.reject(line_number, kind, f"Unsupported export version {record.get('version')!r}.")
+                continue
+            if kind == "end":
+                continue
+            if kind not in RECORD_MODELS:
+                self.reject(line_number, kind, "Unknown record type.")
+                continue
+
+            try:
+                self.records[kind].append((line_number, RECORD_MODELS[kind].model_validate(record)))
+            except ValidationError as error:
+                problem = error.errors()[0]
+                field = ".".join(str(part) for part in problem["loc"])
+                self.reject(line_number, kind, f"{field}: {problem['msg']}")
+
+    def _claim_temp_id(self, kind: str, line: int, temp_id) -> Optional[UUID]:
+        key = str(temp_id)
+        if key in self.ids[kind]:
+            self.reject(line, kind, f"Duplicate {kind} id {key!r}.")
+            return None
+        self.ids[kind][key] = new_id()
+        return self.ids[kind][key]
+
+    def _resolve(self, kind: str, reference) -> Optional[UUID]:
+        key = str(reference)
+        if key in self.ids[kind]:
+            return self.ids[kind][key]
+        if key in self.rejected[kind]:
+            return None
+        existing = _as_uuid(reference)
+        return existing if existing in self.owned[kind] else None
+
+    def _load_owned(self) -> None:
+        """Look up, in one pass per type, references that aren't temporary ids of this file"""
+        wanted = {"topic": set(), "tag": set(), "note": set()}
+
+        def want(kind, reference):
+            if str(reference) not in self.ids[kind] and str(reference) not in self.rejected[kind]:
+                existing = _as_uuid(reference)
+                if existing is not None:
+                    wanted[kind].add(existing)
+
+        for _, edge in self.records["edge"]:
+            want("topic", edge.source)
+            want("topic", edge.target)
+        for _, note in self.records["note"]:
+            want("topic", note.topic_id)
+            for tag_id in note.tag_ids or []:
+                want("tag", tag_id)
+        for _, link in self.records["note_tag"]:
+            want("note", link.note_id)
+            want("tag", link.tag_id)
+
+        models = {"topic": Topic, "tag": NoteTag, "note": Note}
+        for kind, ids in wanted.items():
+            if ids:
+                self.owned[kind] = self.repository.owned_ids(models[kind], self.user_id, ids)
+
+    def resolve(self) -> None:
+        # Topics and tags, whose titles and names are unique per user
+        taken_titles = self.repository.existing_topic_titles(self.user_id, {topic.title for _, topic in self.records["topic"]})
+        for line, topic in self.records["topic"]:
+            if topic.title in taken_titles:
+                self.reject(line, "topic", f"A topic titled {topic.title!r} already exists.", topic.id)
+                continue
+            topic_id = self._claim_temp_id("topic", line, topic.id)
+            if topic_id is None:
+                continue
+            taken_titles.add(topic.title)
+            self.rows["topic"].append(_with_timestamps({
+                "id": topic_id, "user_id": UUID(self.user_id), "title": topic.title,
+                "description": topic.description, "node_type": topic.node_type, "position": topic.position,
+            }, topic))
+
+        taken_names = self.repository.existing_tag_names(self.user_id, {tag.name for _, tag in self.records["tag"]})
+        for line, tag in self.records["tag"]:
+            if tag.name in taken_names:
+                self.reject(line, "tag", f"A tag named {tag.name!r} already exists.", tag.id)
+                continue
+            tag_id = self._claim_temp_id("tag", line, tag.id)
+            if tag_id is None:
+                continue
+            taken_names.add(tag.name)
+            self.rows["tag"].append(_with_timestamps({
+                "id": tag_id, "user_id": UUID(self.user_id), "name": tag.name, "color": tag.color,
+            }, tag))
+
+        # Notes claim their ids before any reference is resolved, so that
+        # note_tag records can point at notes anywhere in the file
+        notes = []
+        for line, note in self.records["note"]:
+            note_id = new_id() if note.id is None else self._claim_temp_id("note", line, note.id)
+            if note_id is not None:
+                notes.append((line, note, note_id))
+
+        self._load_owned()
+
+        seen_edges = set()
+        for line, edge in self.records["edge"]:
+            source, target = self._resolve("topic", edge.source), self._resolve("topic", edge.target)
+            if source is None or target is None:
+                missing = edge.source if source is None else edge.target
+                self.reject(line, "edge", f"Unknown topic {str(missing)!r}.")
+            elif source == target:
+                self.reject(line, "edge", "An edge can't connect a topic to itself.")
+            elif (source, target) in seen_edges:
+                self.reject(line, "edge", "Duplicate edge.")
+            else:
+                seen_edges.add((source, target))
+                self.rows["edge"].append({
+                    "id": new_id(), "source": source, "target": target,
+                    "relation_type": edge.relation_type, "edge_metadata": edge.edge_metadata,
+                })
+
+        links = set()
+        for line, note, note_id in notes:
+            topic_id = self._resolve("topic", note.topic_id)
+            tag_ids = [self._resolve("tag", tag_id) for tag_id in note.tag_ids or []]
+            if topic_id is None or None in tag_ids:
+                if note.id is not None:
+                    del self.ids["note"][str(note.id)]
+                if topic_id is None:
+                    self.reject(line, "note", f"Unknown topic {str(note.topic_id)!r}.", note.id)
+                else:
+                    self.reject(line, "note", f"Unknown tag {str(note.tag_ids[tag_ids.index(None)])!r}.", note.id)
+            else:
+                links.update((note_id, tag_id) for tag_id in tag_ids)
+                self.rows["note"].append(_with_timestamps({
+                    "id": note_id, "user_id": UUID(self.user_id), "topic_id": topic_id,
+                    "title": note.title, "content": note.content, "urls": note.urls,
+                }, note))
+
+        for line, link in self.records["note_tag"]:
+            note_id, tag_id = self._resolve("note", link.note_id), self._resolve("tag", link.tag_id)
+            if note_id is None:
+                self.reject(line, "note_tag", f"Unknown note {str(link.note_id)!r}.")
+            elif tag_id is None:
+                self.reject(line, "note_tag", f"Unknown tag {str(link.tag_id)!r}.")
+            else:
+                links.add((note_id, tag_id))
+        self.rows["note_tag"] = [{"note_id": note_id, "tag_id": tag_id} for note_id, tag_id in links]
+
+        self._skip_existing()
+
+    def _skip_existing(self) -> None:
+        """Drop edges and tag links that already exist; only those between existing rows can"""
+        topics, notes = self.owned["topic"], self.owned["note"]
+        edges = [(row["source"], row["target"]) for row in self.rows["edge"] if row["source"] in topics and row["target"] in topics]
+        existing = self.repository.existing_edges(edges) if edges else set()
+        if existing:
+            self.rows["edge"] = [row for row in self.rows["edge"] if (row["source"], row["target"]) not in existing]
+            self.skipped["edge"] = len(existing)
+
+        links = [(row["note_id"], row["tag_id"]) for row in self.rows["note_tag"] if row["note_id"] in notes]
+        existing = self.repository.existing_note_tags(links) if links else set()
+        if existing:
+            self.rows["note_tag"] = [row for row in self.rows["note_tag"] if (row["note_id"], row["tag_id"]) not in existing]
+            self.skipped["note_tag"] = len(existing)
+
+    def write(self) -> None:
+        # Referenced rows first, so every foreign key already points somewhere
+        self.repository.insert_rows(Topic, self.rows["topic"])
+        self.repository.insert_rows(NoteTag, self.rows["tag"])
+        self.repository.insert_rows(TopicEdge, self.rows["edge"])
+        self.repository.insert_rows(Note, self.rows["note"])
+        self.repository.insert_rows(NoteTagMap, self.rows["note_tag"])
+
+
+def import_user_data(user_id: str, lines: Iterable[bytes], import_repository: ImportRepository, dry_run: bool = False) -> Success[ImportResult] | Error[UserError]:
+    """Import NDJSON records into the user's account
+
+    Invalid lines, and lines referring to them, are skipped and reported;
+    everything else is written together, or with `dry_run` only checked.
+    """
+    run = _Import(user_id, import_repository)
+    run.parse(lines)
+    run.resolve()
+
+    created = {kind: len(rows) for kind, rows in run.rows.items()}
+    if not dry_run:
+        try:
+            # Savepoint, so a conflict with a concurrent write leaves nothing half-imported
+            with import_repository.savepoint():
+                run.write()
+        except IntegrityError as error:
+            if is_foreign_key_violation(error):
+                raise  # The user or a referenced row is gone; see integrity_error_handler
+            return Error(UserError.IMPORT_CONFLICT)
+
+    return Success(ImportResult(dry_run=dry_run, created=created, skipped=run.skipped, error_count=run.error_count, errors=sorted(run.errors, key=lambda error: error.line)))
@@ -2,5 +2,7 @@ from .user_api_response import UserApiResponse
 from .topic_api_response import TopicApiResponse
 from .note_api_response import NoteApiResponse
 from .tag_api_response import TagApiResponse
+from .search_api_response import SearchApiResponse
+from .job_api_response import JobApiResponse
 
-__all__ = ["UserApiResponse", "TopicApiResponse", "NoteApiResponse", "TagApiResponse"]
\ No newline at end of file
+__all__ = ["UserApiResponse", "TopicApiResponse", "NoteApiResponse", "TagApiResponse", "SearchApiResponse", "JobApiResponse"]
\ No newline at end of file
@@ -1,5 +1,5 @@
 # app/models/__init__.py
-from .user import User, UserCreate, UserRead, UserUpdate, UserLogin, UserLoginResponse
+from .user import User, UserCreate, UserRead, UserUpdate, UserLogin, UserLoginResponse, TopicNoteCount, UserStatsRead
 from .topic import (
     Topic,
     TopicEdge,
@@ -7,13 +7,20 @@ from .topic import (
     TopicRead,
     TopicReadWithEdges,
     TopicUpdate,
+    TopicPositionUpdate,
     TopicEdgeCreate,
     TopicEdgeRead,
     TopicEdgeUpdate,
+    TopicGraphRead,
     Position
 )
 from .note import Note, NoteCreate, NoteRead, NoteReadWithTags, NoteUpdate
 from .tag import NoteTag, NoteTagMap, NoteTagCreate, NoteTagRead, NoteTagUpdate
+from .page import Page
+from .search import SearchHit
+from .embedding import NoteEmbedding, SimilarNote, SemanticSearchRequest, EMBEDDING_DIMENSIONS
+from .job import Job, JobKind, JobStatus, JobRead
+from .data_import import ImportTopic, ImportEdge, ImportTag, ImportNote, ImportNoteTag, ImportRowError, ImportResult
 
 __all__ = [
     # User models
@@ -23,6 +30,8 @@ __all__ = [
     "UserUpdate",
     "UserLogin",
     "UserLoginResponse",
+    "TopicNoteCount",
+    "UserStatsRead",
 
     # Topic models
     "Topic",
@@ -31,9 +40,11 @@ __all__ = [
     "TopicRead",
     "TopicReadWithEdges",
     "TopicUpdate",
+    "TopicPositionUpdate",
     "TopicEdgeCreate",
     "TopicEdgeRead",
     "TopicEdgeUpdate",
+    "TopicGraphRead",
     "Position",
 
     # Note models
@@ -49,4 +60,31 @@ __all__ = [
     "NoteTagCreate",
     "NoteTagRead",
     "NoteTagUpdate",
+
+    # Pagination
+    "Page",
+
+    # Search
+    "SearchHit",
+
+    # Embeddings
+    "NoteEmbedding",
+    "SimilarNote",
+    "SemanticSearchRequest",
+    "EMBEDDING_DIMENSIONS",
+
+    # Background jobs
+    "Job",
+    "JobKind",
+    "JobStatus",
+    "JobRead",
+
+    # Bulk import
+    "ImportTopic",
+    "ImportEdge",
+    "ImportTag",
+    "ImportNote",
+    "ImportNoteTag",
+    "ImportRowError",
+    "ImportResult",
 ]
\ No newline at end of file
@@ -0,0 +1,66 @@
+# app/models/data_import.py
+# Records accepted by POST /import, one JSON object per line. Records refer
+# to each other by client-chosen temporary ids; a reference that isn't one
+# of them may be the UUID of a row the user already has. The export format of
+# GET /user/export is accepted as is.
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+
+from sqlmodel import Field, SQLModel
+
+# Temporary ids may be strings or integers; 1 and "1" name the same record
+TempId = Union[int, str]
+
+
+class ImportTopic(SQLModel):
+    id: TempId
+    title: str = Field(min_length=1, max_length=255)
+    description: Optional[str] = None
+    node_type: Optional[str] = Field(default=None, max_length=20)
+    position: Optional[dict] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ImportEdge(SQLModel):
+    source: TempId
+    target: TempId
+    relation_type: Optional[str] = Field(default=None, max_length=50)
+    edge_metadata: Optional[Dict[str, Any]] = None
+
+
+class ImportTag(SQLModel):
+    id: TempId
+    name: str = Field(min_length=1, max_length=50)
+    color: Optional[str] = Field(default=None, max_length=20)
+    created_at: Optional[datetime] = None
+
+
+class ImportNote(SQLModel):
+    id: Optional[TempId] = None  # Only needed by note_tag records
+    topic_id: TempId
+    title: Optional[str] = Field(default=None, max_length=255)
+    content: str
+    urls: Optional[List[str]] = None
+    tag_ids: Optional[List[TempId]] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ImportNoteTag(SQLModel):
+    note_id: TempId
+    tag_id: TempId
+
+
+class ImportRowError(SQLModel):
+    line: int
+    type: Optional[str] = None
+    message: str
+
+
+class ImportResult(SQLModel):
+    dry_run: bool
+    created: Dict[str, int]  # Rows written per record type
+    skipped: Dict[str, int]  # Edges and tag links left alone because they already exist
+    error_count: int  # Rejected lines; only the first few are listed in errors
+    errors: List[ImportRowError] = []
@@ -0,0 +1,35 @@
+# app/models/embedding.py
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import func
+from sqlmodel import Column, Field, SQLModel
+
+from .note import NoteRead
+from .types import GUID
+
+# Width of the stored vectors. The column and its HNSW index are created with
+# this size (migration c5e2a9f7b3d1), so changing it needs a new migration.
+EMBEDDING_DIMENSIONS = 256
+
+
+class NoteEmbedding(SQLModel, table=True):
+    __tablename__ = "note_embeddings"
+
+    note_id: UUID = Field(sa_type=GUID, foreign_key="notes.id", primary_key=True, ondelete="CASCADE")
+    model: str = Field(max_length=100)  # Embedder that produced the vector
+    embedding: List[float] = Field(sa_column=Column(Vector(EMBEDDING_DIMENSIONS), nullable=False))
+    # The note's updated_at when it was embedded; a newer one means the vector is stale
+    note_updated_at: datetime
+    embedded_at: datetime = Field(default=None, nullable=False, sa_column_kwargs={"server_default": func.now()})
+
+
+class SimilarNote(NoteRead):
+    score: float  # Cosine similarity to the query, 1 is identical
+
+
+class SemanticSearchRequest(SQLModel):
+    query: str = Field(max_length=1000)
+    limit: int = Field(default=10, ge=1, le=100)
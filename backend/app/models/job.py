@@ -0,0 +1,72 @@
+# app/models/job.py
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import JSON, Text, text
+from sqlmodel import Column, Field, Index, SQLModel
+
+from app.util.ids import new_id
+from .types import GUID
+
+
+class JobKind(str, Enum):
+    EMBED_NOTES = "embed_notes"
+    DELETE_TOPIC = "delete_topic"
+    DELETE_USER = "delete_user"
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class Job(SQLModel, table=True):
+    """A unit of deferred work, claimed and run by app.core.jobs.JobRunner.
+
+    Times are naive UTC set by the application, never the database clock, so
+    run_after and the lease compare correctly whatever the server time zone.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Dequeue: queued jobs that are due, and running jobs whose lease ran out
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+        # At most one queued job per dedupe key; a job that is already running
+        # doesn't count, so work that arrives meanwhile still gets picked up
+        Index(
+            "ux_jobs_dedupe_key_queued", "dedupe_key", unique=True,
+            postgresql_where=text("status = 'queued'"), sqlite_where=text("status = 'queued'"),
+        ),
+    )
+
+    id: UUID = Field(sa_type=GUID, default_factory=new_id, primary_key=True)
+    kind: str = Field(max_length=50)
+    payload: dict = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    # No foreign key: an account deletion job outlives its user
+    user_id: Optional[UUID] = Field(default=None, sa_type=GUID, index=True)
+    dedupe_key: Optional[str] = Field(default=None, max_length=200)
+    status: str = Field(default=JobStatus.QUEUED.value, max_length=20)
+    attempts: int = 0
+    max_attempts: int
+    run_after: datetime
+    locked_at: Optional[datetime] = None
+    locked_by: Optional[str] = Field(default=None, max_length=100)
+    last_error: Optional[str] = Field(default=None, sa_column=Column(Text))
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+
+class JobRead(SQLModel):
+    id: UUID
+    kind: str
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    last_error: Optional[str] = None
+    created_at: datetime
+    run_after: datetime
+    finished_at: Optional[datetime] = None
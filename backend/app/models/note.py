@@ -1,10 +1,12 @@
 # app/models/note.py
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from uuid import UUID, uuid4
-from sqlmodel import SQLModel, Field, Relationship, Column
-from sqlalchemy import ARRAY, String
+from uuid import UUID
+from sqlmodel import SQLModel, Field, Relationship, Column, Index
+from sqlalchemy import func
 
+from app.util.ids import new_id
+from .types import GUID, StringList
 from .tag import NoteTagMap
 if TYPE_CHECKING:
     from .user import User
@@ -17,24 +19,31 @@ else:
 class NoteBase(SQLModel):
     title: Optional[str] = Field(default=None, max_length=255)
     content: str
-    urls: Optional[List[str]] = Field(default=None, sa_column=Column(ARRAY(String)))
+    urls: Optional[List[str]] = Field(default=None, sa_column=Column(StringList))
 
 
 class Note(NoteBase, table=True):
     __tablename__ = "notes"
+    # Read server-generated timestamps back with RETURNING instead of a refresh
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Keyset pagination over a topic's notes
+        Index("ix_notes_user_id_topic_id_created_at_id", "user_id", "topic_id", "created_at", "id"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    topic_id: UUID = Field(foreign_key="topics.id", index=True, ondelete="CASCADE")
-    user_id: UUID = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    id: UUID = Field(sa_type=GUID, default_factory=new_id, primary_key=True)
+    topic_id: UUID = Field(sa_type=GUID, foreign_key="topics.id", index=True, ondelete="CASCADE")
+    user_id: UUID = Field(sa_type=GUID, foreign_key="users.id", index=True, ondelete="CASCADE")
+    created_at: datetime = Field(default=None, nullable=False, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(default=None, nullable=False, sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()})
 
     # Relationships
     topic: "Topic" = Relationship(back_populates="notes")
     user: "User" = Relationship(back_populates="notes")
     tags: List["NoteTag"] = Relationship(
         back_populates="notes",
-        link_model=NoteTagMap
+        link_model=NoteTagMap,
+        sa_relationship_kwargs={"passive_deletes": True},
     )
 
 
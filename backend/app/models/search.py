@@ -0,0 +1,16 @@
+# app/models/search.py
+from datetime import datetime
+from typing import Literal, Optional
+from uuid import UUID
+
+from sqlmodel import SQLModel
+
+
+class SearchHit(SQLModel):
+    kind: Literal["note", "topic"]
+    id: UUID
+    topic_id: UUID  # The note's topic, or the topic itself
+    title: Optional[str] = None
+    snippet: str  # HTML-escaped text, matched terms wrapped in <mark></mark>
+    rank: float
+    created_at: datetime
@@ -1,8 +1,11 @@
 # app/models/tag.py
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from uuid import UUID, uuid4
-from sqlmodel import SQLModel, Field, Relationship
+from uuid import UUID
+from sqlalchemy import func
+from sqlmodel import SQLModel, Field, Relationship, Index
+from app.util.ids import new_id
+from .types import GUID
 
 if TYPE_CHECKING:
     from .user import User
@@ -16,22 +19,34 @@ class NoteTagBase(SQLModel):
 
 class NoteTagMap(SQLModel, table=True):
     __tablename__ = "note_tag_map"
+    __table_args__ = (
+        # The primary key leads with note_id, so tag-side lookups need their own index
+        Index("ix_note_tag_map_tag_id_note_id", "tag_id", "note_id"),
+    )
 
-    note_id: UUID = Field(foreign_key="notes.id", primary_key=True, ondelete="CASCADE")
-    tag_id: UUID = Field(foreign_key="note_tags.id", primary_key=True, ondelete="CASCADE")
+    note_id: UUID = Field(sa_type=GUID, foreign_key="notes.id", primary_key=True, ondelete="CASCADE")
+    tag_id: UUID = Field(sa_type=GUID, foreign_key="note_tags.id", primary_key=True, ondelete="CASCADE")
 
 class NoteTag(NoteTagBase, table=True):
     __tablename__ = "note_tags"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Keyset pagination over a user's tags
+        Index("ix_note_tags_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Tag lookup by name within a user
+        Index("ix_note_tags_user_id_name", "user_id", "name"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    user_id: UUID = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
-    created_at: datetime = Field(default_factory=datetime.now)
+    id: UUID = Field(sa_type=GUID, default_factory=new_id, primary_key=True)
+    user_id: UUID = Field(sa_type=GUID, foreign_key="users.id", index=True, ondelete="CASCADE")
+    created_at: datetime = Field(default=None, nullable=False, sa_column_kwargs={"server_default": func.now()})
 
     # Relationships
     user: "User" = Relationship(back_populates="note_tags")
     notes: List["Note"] = Relationship(
         back_populates="tags",
-        link_model=NoteTagMap
+        link_model=NoteTagMap,
+        sa_relationship_kwargs={"passive_deletes": True},
     )
 
 
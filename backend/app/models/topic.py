@@ -1,10 +1,13 @@
 # app/models/topic.py
 from datetime import datetime
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import BaseModel
-from sqlmodel import SQLModel, Field, Relationship, Column, JSON, UniqueConstraint
+from sqlalchemy import func
+from sqlmodel import SQLModel, Field, Relationship, Column, JSON, UniqueConstraint, Index
+from app.util.ids import new_id
+from .types import GUID
 
 if TYPE_CHECKING:
     from .user import User
@@ -28,17 +31,25 @@ class TopicBase(SQLModel):
 
 class Topic(TopicBase, table=True):
     __tablename__ = "topics"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    user_id: UUID = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    id: UUID = Field(sa_type=GUID, default_factory=new_id, primary_key=True)
+    user_id: UUID = Field(sa_type=GUID, foreign_key="users.id", index=True, ondelete="CASCADE")
+    created_at: datetime = Field(default=None, nullable=False, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(default=None, nullable=False, sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()})
 
-    __table_args__ = (UniqueConstraint("title", "user_id", name="uq_user_topic_title"),)
+    __table_args__ = (
+        UniqueConstraint("title", "user_id", name="uq_user_topic_title"),
+        # Keyset pagination over a user's topics
+        Index("ix_topics_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
 
     # Relationships
     user: "User" = Relationship(back_populates="topics")
-    notes: List["Note"] = Relationship(back_populates="topic")
+    notes: List["Note"] = Relationship(
+        back_populates="topic",
+        sa_relationship_kwargs={"passive_deletes": True},
+    )
 
     # Edge relationships
     outgoing_edges: List["TopicEdge"] = Relationship(
@@ -65,9 +76,13 @@ class TopicEdgeBase(SQLModel):
 class TopicEdge(TopicEdgeBase, table=True):
     __tablename__ = "topic_edges"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    source: UUID = Field(foreign_key="topics.id", index=True, ondelete="CASCADE")
-    target: UUID = Field(foreign_key="topics.id", index=True, ondelete="CASCADE")
+    id: UUID = Field(sa_type=GUID, default_factory=new_id, primary_key=True)
+    source: UUID = Field(sa_type=GUID, foreign_key="topics.id", index=True, ondelete="CASCADE")
+    target: UUID = Field(sa_type=GUID, foreign_key="topics.id", index=True, ondelete="CASCADE")
+
+    __table_args__ = (
+        UniqueConstraint("source", "target", name="uq_topic_edges_source_target"),
+    )
 
     # Relationships
     source_topic: Topic = Relationship(
@@ -107,6 +122,11 @@ class TopicUpdate(SQLModel):
     relation_types: Optional[List[str]] = None
 
 
+class TopicPositionUpdate(SQLModel):
+    id: UUID
+    position: Position
+
+
 class TopicEdgeCreate(TopicEdgeBase):
     source: UUID
     target: UUID
@@ -120,4 +140,9 @@ class TopicEdgeRead(TopicEdgeBase):
 
 class TopicEdgeUpdate(SQLModel):
     relation_type: Optional[str] = None
-    edge_metadata: Optional[Dict[str, Any]] = None
\ No newline at end of file
+    edge_metadata: Optional[Dict[str, Any]] = None
+
+
+class TopicGraphRead(SQLModel):
+    topics: List[TopicRead] = []
+    edges: List[TopicEdgeRead] = []
\ No newline at end of file
@@ -0,0 +1,46 @@
+# app/models/types.py
+# Column types that work on both PostgreSQL and SQLite. Postgres keeps its
+# native types, so the migrations and the existing schema are unchanged.
+from uuid import UUID
+
+from sqlalchemy import ARRAY, JSON, String, Uuid
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import now
+from sqlalchemy.types import TypeDecorator
+
+
+class GUID(TypeDecorator):
+    """UUID column that also accepts UUID strings as parameters.
+
+    Repositories compare ids taken straight from tokens and paths, which are
+    strings. Postgres parses those itself; SQLite stores UUIDs as text and
+    needs a real uuid.UUID to format.
+    """
+
+    impl = Uuid
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if isinstance(value, str):
+            return UUID(value)
+        return value
+
+
+class StringList(TypeDecorator):
+    """A list of strings: ARRAY(String) on Postgres, a JSON array elsewhere."""
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(String))
+        return dialect.type_descriptor(JSON())
+
+
+@compiles(now, "sqlite")
+def _sqlite_now(element, compiler, **kw):
+    # CURRENT_TIMESTAMP has whole-second precision and a different text format
+    # from the one SQLAlchemy binds datetimes in, which breaks keyset cursor
+    # comparisons. Produce the same "YYYY-MM-DD HH:MM:SS.ffffff" format instead.
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
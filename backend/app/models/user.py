@@ -1,10 +1,13 @@
 # app/models/user.py
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
+from sqlalchemy import func
 from sqlmodel import SQLModel, Field, Relationship
 from pydantic import field_validator
 import re
+from app.util.ids import new_id
+from .types import GUID
 
 if TYPE_CHECKING:
     from .topic import Topic
@@ -44,15 +47,16 @@ class UserBase(SQLModel):
 
 class User(UserBase, table=True):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(sa_type=GUID, default_factory=new_id, primary_key=True)
     hashed_password: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default=None, nullable=False, sa_column_kwargs={"server_default": func.now()})
 
     # Relationships
-    topics: List["Topic"] = Relationship(back_populates="user")
-    notes: List["Note"] = Relationship(back_populates="user")
-    note_tags: List["NoteTag"] = Relationship(back_populates="user")
+    topics: List["Topic"] = Relationship(back_populates="user", sa_relationship_kwargs={"passive_deletes": True})
+    notes: List["Note"] = Relationship(back_populates="user", sa_relationship_kwargs={"passive_deletes": True})
+    note_tags: List["NoteTag"] = Relationship(back_populates="user", sa_relationship_kwargs={"passive_deletes": True})
 
 
 class UserCreate(UserBase):
@@ -97,4 +101,20 @@ class UserLoginResponse(UserRead):
 class UserUpdate(SQLModel):
     username: Optional[str] = None
     email: Optional[str] = None
-    password: Optional[str] = None
\ No newline at end of file
+    password: Optional[str] = None
+
+
+class TopicNoteCount(SQLModel):
+    id: UUID
+    title: str
+    created_at: datetime
+    note_count: int
+
+
+class UserStatsRead(SQLModel):
+    topics_count: int
+    notes_count: int
+    tags_count: int
+    edges_count: int
+    recent_topics: List[TopicNoteCount] = []
+    topic_note_counts: List[TopicNoteCount] = []
@@ -1 +1,3 @@
-from .hash_pass import verify_password, hash_password
\ No newline at end of file
+from .hash_pass import verify_password, hash_password, get_hash_rounds
+from .ttl_cache import TTLCache
+from .ids import new_id, uuid7
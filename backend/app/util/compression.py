@@ -0,0 +1,109 @@
+# app/util/compression.py
+# Incremental compressors for streamed responses: feed chunks in, get
+# compressed bytes out as soon as there are some, flush once at the end.
+# Uploaded bodies go the other way through BoundedDecompressor.
+import io
+import zlib
+
+# Media type and file extension per supported compression
+FORMATS = {
+    "none": ("application/x-ndjson", ""),
+    "gzip": ("application/gzip", ".gz"),
+    "zstd": ("application/zstd", ".zst"),
+}
+
+
+class _Identity:
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def zstd_available() -> bool:
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def compressor(name: str):
+    """A compressor for `name` ("none", "gzip" or "zstd"); zstd needs `pip install zstandard`"""
+    if name == "gzip":
+        # wbits 31: a gzip header and trailer around the deflate stream
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+    if name == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).compressobj()
+    return _Identity()
+
+
+def decompression_errors() -> tuple:
+    """The exceptions BoundedDecompressor raises on corrupt input"""
+    if not zstd_available():
+        return (zlib.error,)
+    import zstandard
+
+    return (zlib.error, zstandard.ZstdError)
+
+
+class TooLarge(Exception):
+    """The decompressed data grew past the allowed size"""
+
+
+class BoundedDecompressor:
+    """Decompresses an upload chunk by chunk, never producing more than max_bytes in total
+
+    Output is capped as it is produced rather than checked afterwards, so a
+    small compressed chunk can't expand to gigabytes first. Raises TooLarge
+    once the limit is passed, and zlib.error or zstandard.ZstdError on
+    corrupt input.
+    """
+
+    def __init__(self, name: str, max_bytes: int):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.size = 0
+        if name == "gzip":
+            self._inflate = zlib.decompressobj(31)
+        # zstd has no incremental decoder with an output limit, so the
+        # compressed bytes are kept and read back through a bounded reader
+        self._compressed = bytearray()
+
+    def _count(self, data: bytes) -> bytes:
+        self.size += len(data)
+        if self.size > self.max_bytes:
+            raise TooLarge()
+        return data
+
+    def decompress(self, chunk: bytes) -> bytes:
+        if self.name == "gzip":
+            output = bytearray()
+            while chunk and not self._inflate.eof:
+                output += self._count(self._inflate.decompress(chunk, self.max_bytes - self.size + 1))
+                chunk = self._inflate.unconsumed_tail
+            return bytes(output)
+        if self.name == "zstd":
+            # Decompressed in flush(), up to the limit
+            self._compressed += chunk
+            if len(self._compressed) > self.max_bytes:
+                raise TooLarge()
+            return b""
+        return self._count(chunk)
+
+    def flush(self) -> bytes:
+        if self.name != "zstd":
+            return b""
+        import zstandard
+
+        output = bytearray()
+        with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(bytes(self._compressed))) as reader:
+            while True:
+                piece = reader.read(min(1024 * 1024, self.max_bytes - self.size + 1))
+                if not piece:
+                    break
+                output += self._count(piece)
+        return bytes(output)
@@ -5,9 +5,15 @@ def verify_password(plain_password: str, hashed_password: str):
     hashed_password_byte_enc = hashed_password.encode('utf-8')
     return bcrypt.checkpw(password=password_byte_enc, hashed_password=hashed_password_byte_enc)
 
-def hash_password(password: str):
+def hash_password(password: str, rounds: int = 12):
     pwd_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds)
     hashed = bcrypt.hashpw(password=pwd_bytes, salt=salt)
-    print(hashed)
     return hashed.decode('utf-8')
+
+def get_hash_rounds(hashed_password: str) -> int | None:
+    """Read the cost factor from a modular-crypt bcrypt hash ($2b$<cost>$...)."""
+    parts = hashed_password.split('$')
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
@@ -0,0 +1,27 @@
+# app/util/ids.py
+import os
+import time
+from uuid import UUID, uuid4
+
+
+def uuid7() -> UUID:
+    """Time-ordered UUID (RFC 9562, version 7).
+
+    The first 48 bits are the Unix time in milliseconds and the remaining 74
+    are random, so ids generated later sort after earlier ones and new rows
+    land at the right-hand edge of the primary key index.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return UUID(int=value)
+
+
+def new_id() -> UUID:
+    """Primary key factory for new rows, chosen by the ID_UUID_VERSION setting."""
+    from app.core.config import settings
+
+    if settings.ID_UUID_VERSION == 7:
+        return uuid7()
+    return uuid4()
@@ -1,26 +1,44 @@
 # app/main.py
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.exc import IntegrityError
 from fastapi.responses import FileResponse
 from contextlib import asynccontextmanager
+import asyncio
+import hmac
 import os
 
-from app.core import validation_exception_handler
+from app.core import validation_exception_handler, integrity_error_handler
 from app.core.config import settings
-from app.core.database import create_db_and_tables
-from app.api.v1 import user_router, auth_router, topic_router, note_router, tag_router
+from app.core.database import create_db_and_tables, get_engine, is_sqlite
+from app.core.migrations import check_schema_is_current
+from app.core.hashing import hashing_pool
+from app.core.job_handlers import JOB_HANDLERS
+from app.core.jobs import job_runner
+from app.core.pool_metrics import pool_metrics
+from app.api.v1 import user_router, auth_router, topic_router, note_router, tag_router, search_router, job_router, import_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events."""
-    # Startup
-    print("Creating database tables...")
-    create_db_and_tables()
-    print("Database tables created successfully!")
+    # Startup. Tables are created by `alembic upgrade head`; outside production
+    # check that it has been run. Production deploys migrate before starting,
+    # so the check (and the early database connection) is skipped there.
+    # The migrations are Postgres-only, so an embedded SQLite database is
+    # created straight from the models instead.
+    if is_sqlite(settings.sync_database_url):
+        create_db_and_tables()
+        print("SQLite database ready.")
+    elif settings.ENVIRONMENT != "production":
+        check_schema_is_current(get_engine())
+        print("Database schema is up to date.")
+    job_runner.start(JOB_HANDLERS)
     yield
-    # Shutdown (add cleanup if needed)
+    # Shutdown: let in-flight jobs finish; unfinished ones are retried later
+    await asyncio.to_thread(job_runner.stop, settings.JOB_SHUTDOWN_TIMEOUT_SECONDS)
+    hashing_pool.shutdown()
 
 
 app = FastAPI(
@@ -32,6 +50,7 @@ app = FastAPI(
 )
 
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
+app.add_exception_handler(IntegrityError, integrity_error_handler)
 
 # Set up CORS
 app.add_middleware(
@@ -48,6 +67,17 @@ app.include_router(auth_router, prefix=settings.API_V1_STR)
 app.include_router(topic_router, prefix=settings.API_V1_STR)
 app.include_router(note_router, prefix=settings.API_V1_STR)
 app.include_router(tag_router, prefix=settings.API_V1_STR)
+app.include_router(search_router, prefix=settings.API_V1_STR)
+app.include_router(job_router, prefix=settings.API_V1_STR)
+app.include_router(import_router, prefix=settings.API_V1_STR)
+
+if settings.POOL_METRICS_ENABLED:
+    @app.get("/internal/pool-metrics", include_in_schema=False)
+    async def read_pool_metrics(x_metrics_token: str = Header(default="")):
+        """Live connection pool gauges and checkout wait statistics, per engine."""
+        if settings.POOL_METRICS_TOKEN and not hmac.compare_digest(x_metrics_token, settings.POOL_METRICS_TOKEN):
+            raise HTTPException(status_code=401, detail="Could not validate credentials.")
+        return {name: metrics.snapshot() for name, metrics in list(pool_metrics.items())}
 
 # Serve static files (frontend build)
 static_dir = os.path.join(os.path.dirname(__file__), "..", "frontend", "dist")
@@ -0,0 +1,125 @@
+"""Compare uuid4 and uuid7 primary keys for note-shaped inserts on PostgreSQL.
+
+For each UUID version a scratch copy of the ``notes`` layout (primary key plus
+the keyset pagination index) is filled with ``--rows`` rows in COPY batches.
+The script reports insert throughput, WAL generated and the resulting index
+sizes, then drops the scratch tables.
+
+Usage (from the backend directory, against a disposable database):
+
+    python -m scripts.bench_uuid_keys --rows 3000000
+"""
+import argparse
+import io
+import time
+import uuid
+from typing import Callable, Dict
+
+from sqlalchemy import create_engine
+
+from app.core.config import settings
+from app.util.ids import uuid7
+
+ID_FACTORIES: Dict[str, Callable[[], uuid.UUID]] = {
+    "uuid4": uuid.uuid4,
+    "uuid7": uuid7,
+}
+
+
+def _create_table(cursor, table: str) -> None:
+    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+    cursor.execute(
+        f"""
+        CREATE TABLE {table} (
+            id UUID PRIMARY KEY,
+            topic_id UUID NOT NULL,
+            user_id UUID NOT NULL,
+            title VARCHAR(255),
+            content TEXT NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT now()
+        )
+        """
+    )
+    cursor.execute(f"CREATE INDEX {table}_keyset ON {table} (user_id, topic_id, created_at, id)")
+
+
+def _batch(new_id: Callable[[], uuid.UUID], size: int, user_id: uuid.UUID, topic_id: uuid.UUID) -> io.StringIO:
+    buffer = io.StringIO()
+    for _ in range(size):
+        buffer.write(f"{new_id()}\t{topic_id}\t{user_id}\tbenchmark\tlorem ipsum dolor sit amet\n")
+    buffer.seek(0)
+    return buffer
+
+
+def run(connection, name: str, rows: int, batch_size: int, topics: int) -> dict:
+    table = f"bench_notes_{name}"
+    new_id = ID_FACTORIES[name]
+    user_id = uuid.uuid4()
+    topic_ids = [uuid.uuid4() for _ in range(topics)]
+
+    with connection.cursor() as cursor:
+        _create_table(cursor, table)
+        connection.commit()
+
+        cursor.execute("SELECT pg_current_wal_lsn()")
+        wal_start = cursor.fetchone()[0]
+
+        elapsed = 0.0
+        inserted = 0
+        while inserted < rows:
+            size = min(batch_size, rows - inserted)
+            buffer = _batch(new_id, size, user_id, topic_ids[(inserted // batch_size) % topics])
+            started = time.perf_counter()
+            cursor.copy_expert(f"COPY {table} (id, topic_id, user_id, title, content) FROM STDIN", buffer)
+            connection.commit()
+            elapsed += time.perf_counter() - started
+            inserted += size
+
+        cursor.execute("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), %s)", (wal_start,))
+        wal_bytes = int(cursor.fetchone()[0])
+        cursor.execute(
+            "SELECT pg_relation_size(%s), pg_relation_size(%s), pg_relation_size(%s)",
+            (f"{table}_pkey", f"{table}_keyset", table),
+        )
+        pkey_bytes, keyset_bytes, heap_bytes = cursor.fetchone()
+        cursor.execute(f"DROP TABLE {table}")
+        connection.commit()
+
+    return {
+        "name": name,
+        "rows_per_second": rows / elapsed if elapsed else 0.0,
+        "seconds": elapsed,
+        "wal_mb": wal_bytes / 2**20,
+        "pkey_mb": pkey_bytes / 2**20,
+        "keyset_mb": keyset_bytes / 2**20,
+        "heap_mb": heap_bytes / 2**20,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--topics", type=int, default=100, help="Spread rows over this many topic ids")
+    parser.add_argument("--database-url", default=settings.sync_database_url)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    connection = engine.raw_connection()
+    try:
+        results = [run(connection, name, args.rows, args.batch_size, args.topics) for name in ID_FACTORIES]
+    finally:
+        connection.close()
+        engine.dispose()
+
+    print(f"{args.rows:,} rows, batches of {args.batch_size:,}")
+    print(f"{'ids':<6} {'rows/s':>10} {'seconds':>9} {'WAL MB':>9} {'pkey MB':>9} {'keyset MB':>10} {'heap MB':>9}")
+    for r in results:
+        print(
+            f"{r['name']:<6} {r['rows_per_second']:>10,.0f} {r['seconds']:>9.1f} {r['wal_mb']:>9.1f} "
+            f"{r['pkey_mb']:>9.1f} {r['keyset_mb']:>10.1f} {r['heap_mb']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
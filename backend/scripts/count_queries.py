@@ -0,0 +1,114 @@
+"""Fail if listing a topic's notes costs more statements as the topic grows.
+
+Seeds two topics, one with N tagged notes and one with 10N, lists each through
+the note repository while counting the statements it emits, and exits non-zero
+if the counts differ: tags must be loaded for the whole listing at once, not
+note by note. Runs on a throwaway in-memory SQLite database by default (the
+embedded mode), so it needs no server.
+
+Usage (from the backend directory):
+
+    python -m scripts.count_queries
+    python -m scripts.count_queries --notes 50 --database-url postgresql://...
+
+Against a real database everything is rolled back at the end.
+"""
+import argparse
+import sys
+from typing import Callable, List, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlmodel import Session, SQLModel
+
+from app.data.repository.note import NoteRepository
+from app.models import Note, NoteTag, NoteTagMap, Topic, User
+
+TAGS_PER_NOTE = 2
+
+
+def _seed(session: Session, notes_per_topic: List[int]) -> Tuple[str, List[str]]:
+    user = User(username="query-count-check", email="query-count-check@example.com", hashed_password="-")
+    session.add(user)
+    session.flush()
+
+    tags = [NoteTag(name=f"tag {i}", user_id=user.id) for i in range(TAGS_PER_NOTE)]
+    topics = [Topic(title=f"topic {i}", user_id=user.id) for i in range(len(notes_per_topic))]
+    session.add_all(tags + topics)
+    session.flush()
+
+    for topic, count in zip(topics, notes_per_topic):
+        notes = [Note(title=f"note {i}", content="-", topic_id=topic.id, user_id=user.id) for i in range(count)]
+        session.add_all(notes)
+        session.flush()
+        session.add_all([NoteTagMap(note_id=note.id, tag_id=tag.id) for note in notes for tag in tags])
+    session.flush()
+    # Listing must not be served from the identity map
+    session.expunge_all()
+    return str(user.id), [str(topic.id) for topic in topics]
+
+
+def _count(connection, run: Callable[[], list]) -> Tuple[int, int]:
+    """Run a listing; return (statements emitted, notes listed)"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        listed = run()
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+    return len(statements), len(listed)
+
+
+def check(connection, notes: int) -> List[Tuple[str, List[Tuple[int, int]]]]:
+    """Return (listing name, [(notes, statements)]) for every listing whose statement count grew."""
+    session = Session(bind=connection)
+    user_id, topic_ids = _seed(session, [notes, notes * 10])
+    repository = NoteRepository(session)
+
+    listings = {
+        "notes.read_all_notes_with_tags": lambda topic_id: repository.read_all_notes_with_tags(topic_id, user_id),
+        "notes.read_notes_with_tags_page": lambda topic_id: repository.read_notes_with_tags_page(topic_id, user_id, notes * 10)[0],
+    }
+
+    regressions = []
+    for name, listing in listings.items():
+        counts = []
+        for topic_id in topic_ids:
+            statements, listed = _count(connection, lambda: listing(topic_id))
+            session.expunge_all()
+            counts.append((listed, statements))
+        constant = len({statements for _, statements in counts}) == 1
+        print(f"{'ok  ' if constant else 'GREW'} {name}: " + ", ".join(f"{listed} notes -> {statements} statements" for listed, statements in counts))
+        if not constant:
+            regressions.append((name, counts))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default="sqlite://", help="defaults to a throwaway in-memory SQLite database")
+    parser.add_argument("--notes", type=int, default=20, help="notes in the smaller topic; the larger one gets ten times as many")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            if engine.dialect.name == "sqlite":
+                SQLModel.metadata.create_all(connection)
+            regressions = check(connection, args.notes)
+        finally:
+            transaction.rollback()
+    engine.dispose()
+
+    if regressions:
+        print(f"\n{len(regressions)} listing(s) issue more statements for larger topics, likely one per note.")
+        sys.exit(1)
+    print("\nNote listings cost the same number of statements at every size.")
+
+
+if __name__ == "__main__":
+    main()
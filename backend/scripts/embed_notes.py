@@ -0,0 +1,35 @@
+"""Embed every note that has no up-to-date vector.
+
+Notes are embedded in the background after they are created or edited. Run
+this once after applying the note embeddings migration, and again after
+changing EMBEDDING_PROVIDER or EMBEDDING_MODEL, to index existing notes.
+It can be stopped and restarted at any time; each batch commits on its own.
+
+Usage (from the backend directory):
+
+    python -m scripts.embed_notes
+"""
+import argparse
+import time
+
+from app.core.config import settings
+from app.core.database import new_session
+from app.core.embedding_index import EmbeddingIndexer
+from app.core.embeddings import get_embedder
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=settings.EMBEDDING_BATCH_SIZE)
+    parser.add_argument("--user-id", help="Only embed this user's notes")
+    args = parser.parse_args()
+
+    indexer = EmbeddingIndexer(new_session, args.batch_size)
+    started = time.perf_counter()
+    embedded = indexer.index_stale(args.user_id)
+    elapsed = time.perf_counter() - started
+    print(f"Embedded {embedded} notes with {get_embedder().name} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
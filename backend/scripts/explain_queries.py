@@ -0,0 +1,154 @@
+"""Fail if a repository read query plans a sequential scan on PostgreSQL.
+
+Seeds a small user graph inside a transaction, runs the repository read
+methods while recording the SELECT statements they emit, and EXPLAINs each one
+with ``enable_seqscan`` off. With the tables this small the planner would pick
+sequential scans anyway, so disabling them leaves a ``Seq Scan`` in the plan
+only when no index can serve the query. Everything is rolled back at the end.
+
+Usage (from the backend directory, against a migrated database):
+
+    python -m scripts.explain_queries
+"""
+import argparse
+import json
+import sys
+from typing import Callable, Iterator, List, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.data.repository.note import NoteRepository
+from app.data.repository.tag import TagRepository
+from app.data.repository.topic import TopicRepository
+from app.data.repository.topic_edge import TopicEdgeRepository
+from app.data.repository.user import UserRepository
+from app.models import Note, NoteTag, NoteTagMap, Topic, TopicEdge, User
+
+APP_TABLES = {"users", "topics", "topic_edges", "notes", "note_tags", "note_tag_map"}
+
+
+def _seed(session: Session) -> dict:
+    user = User(username="explain-check", email="explain-check@example.com", hashed_password="-")
+    session.add(user)
+    session.flush()
+
+    topics = [Topic(title=f"topic {i}", user_id=user.id) for i in range(3)]
+    session.add_all(topics)
+    session.flush()
+
+    session.add_all([
+        TopicEdge(source=topics[0].id, target=topics[1].id, relation_type="related"),
+        TopicEdge(source=topics[1].id, target=topics[2].id, relation_type="related"),
+    ])
+    tags = [NoteTag(name=f"tag {i}", user_id=user.id) for i in range(2)]
+    notes = [Note(title=f"note {i}", content="-", topic_id=topics[0].id, user_id=user.id) for i in range(3)]
+    session.add_all(tags + notes)
+    session.flush()
+
+    session.add_all([NoteTagMap(note_id=note.id, tag_id=tags[0].id) for note in notes])
+    session.flush()
+    return {"user": user, "topics": topics, "tags": tags, "notes": notes}
+
+
+def _queries(session: Session, seed: dict) -> Iterator[Tuple[str, Callable[[], object]]]:
+    user_id = str(seed["user"].id)
+    topic = seed["topics"][0]
+    note = seed["notes"][0]
+    tag = seed["tags"][0]
+    note_cursor = (note.created_at, note.id)
+
+    topics = TopicRepository(session)
+    edges = TopicEdgeRepository(session)
+    notes = NoteRepository(session)
+    tags = TagRepository(session)
+    users = UserRepository(session)
+
+    yield "topics.get_topic_by_id", lambda: topics.get_topic_by_id(str(topic.id), user_id)
+    yield "topics.get_all_topics", lambda: topics.get_all_topics(user_id)
+    yield "topics.get_topics_page", lambda: topics.get_topics_page(user_id, 2, (topic.created_at, topic.id))
+    yield "topics.has_at_least_notes", lambda: topics.has_at_least_notes(str(topic.id), user_id, 2)
+    yield "edges.get_edges_by_source", lambda: edges.get_edges_by_source(str(topic.id))
+    yield "edges.get_edges_by_target", lambda: edges.get_edges_by_target(str(topic.id))
+    yield "edges.get_all_edges_for_topic", lambda: edges.get_all_edges_for_topic(str(topic.id))
+    yield "edges.get_edges_for_user", lambda: edges.get_edges_for_user(user_id)
+    yield "notes.read_note_with_tags", lambda: notes.read_note_with_tags(str(note.id), user_id)
+    yield "notes.read_all_notes_with_tags", lambda: notes.read_all_notes_with_tags(str(topic.id), user_id)
+    yield "notes.read_notes_with_tags_page", lambda: notes.read_notes_with_tags_page(str(topic.id), user_id, 2, note_cursor)
+    yield "notes.validate_tags_belong_to_user", lambda: notes.validate_tags_belong_to_user([tag.id], user_id)
+    yield "tags.get_tag_by_id", lambda: tags.get_tag_by_id(str(tag.id), user_id)
+    yield "tags.get_tag_by_name", lambda: tags.get_tag_by_name(tag.name, user_id)
+    yield "tags.get_tags_page", lambda: tags.get_tags_page(user_id, 2, (tag.created_at, tag.id))
+    yield "users.get_user_by_email", lambda: users.get_user_by_email(seed["user"].email)
+    yield "users.get_stats_counts", lambda: users.get_stats_counts(user_id)
+    yield "users.get_topic_note_counts", lambda: users.get_topic_note_counts(user_id)
+
+
+def _seq_scans(plan: dict) -> List[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in APP_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+def check(connection) -> List[Tuple[str, str, List[str]]]:
+    """Return (query name, statement, scanned tables) for every plan with a sequential scan."""
+    captured: List[Tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    session = Session(bind=connection)
+    seed = _seed(session)
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+
+    regressions = []
+    for name, run in _queries(session, seed):
+        captured.clear()
+        event.listen(connection, "before_cursor_execute", capture)
+        try:
+            run()
+        finally:
+            event.remove(connection, "before_cursor_execute", capture)
+
+        statements = list(captured)
+        for statement, parameters in statements:
+            result = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            tables = _seq_scans(plan[0]["Plan"])
+            print(f"{'SEQ ' if tables else 'ok  '} {name}")
+            if tables:
+                regressions.append((name, statement, tables))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=settings.sync_database_url)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            regressions = check(connection)
+        finally:
+            transaction.rollback()
+    engine.dispose()
+
+    if regressions:
+        print(f"\n{len(regressions)} plan(s) fell back to a sequential scan:")
+        for name, statement, tables in regressions:
+            print(f"\n{name} scans {', '.join(sorted(set(tables)))}:\n{statement}")
+        sys.exit(1)
+    print("\nNo sequential scans on application tables.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Report where cold start time goes: module imports and app startup.
+
+Runs ``python -X importtime`` on the app in a fresh interpreter and summarises
+the result: total import time, the slowest modules by cumulative and by self
+time, and the time spent per top-level package. Startup (building the app and
+running its lifespan) is timed separately unless ``--imports-only`` is given.
+
+Usage (from the backend directory):
+
+    python -m scripts.startup_report
+    python -m scripts.startup_report --top 30 --json > startup.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+STARTUP_PROBE = """
+import asyncio, time
+started = time.perf_counter()
+from {module} import app
+imported = time.perf_counter()
+async def run():
+    async with app.router.lifespan_context(app):
+        pass
+asyncio.run(run())
+print(f"startup-timing {{imported - started}} {{time.perf_counter() - imported}}")
+"""
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def collect_import_times(module: str) -> List[ImportTime]:
+    """Import `module` in a fresh interpreter with -X importtime and parse its report."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=os.getcwd(),
+    )
+    if result.returncode != 0:
+        sys.exit(result.stderr)
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        entries.append(ImportTime(
+            module=name.strip(),
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+        ))
+    return entries
+
+
+def time_startup(module: str) -> Dict[str, float]:
+    """Seconds to import the app and to run its lifespan startup/shutdown, in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        cwd=os.getcwd(),
+    )
+    if result.returncode != 0:
+        sys.exit(result.stderr)
+    for line in result.stdout.splitlines():
+        if line.startswith("startup-timing "):
+            imported, lifespan = line.split()[1:]
+            return {"import_seconds": float(imported), "lifespan_seconds": float(lifespan)}
+    sys.exit("startup probe produced no timing")
+
+
+def summarise(entries: List[ImportTime], top: int) -> dict:
+    packages: Dict[str, int] = defaultdict(int)
+    for entry in entries:
+        packages[entry.module.split(".")[0]] += entry.self_us
+
+    return {
+        "total_import_ms": sum(e.self_us for e in entries) / 1000,
+        "modules_imported": len(entries),
+        "by_cumulative": [
+            {"module": e.module, "cumulative_ms": e.cumulative_us / 1000, "self_ms": e.self_us / 1000}
+            for e in sorted(entries, key=lambda e: e.cumulative_us, reverse=True)[:top]
+        ],
+        "by_self": [
+            {"module": e.module, "self_ms": e.self_us / 1000}
+            for e in sorted(entries, key=lambda e: e.self_us, reverse=True)[:top]
+        ],
+        "by_package": [
+            {"package": name, "self_ms": us / 1000}
+            for name, us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="main", help="Module that defines the FastAPI `app`")
+    parser.add_argument("--top", type=int, default=20, help="Rows per table")
+    parser.add_argument("--imports-only", action="store_true", help="Skip running the app lifespan")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable output")
+    args = parser.parse_args()
+
+    report = summarise(collect_import_times(args.module), args.top)
+    if not args.imports_only:
+        report["startup"] = time_startup(args.module)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Imported {report['modules_imported']} modules in {report['total_import_ms']:.1f} ms")
+    if "startup" in report:
+        startup = report["startup"]
+        print(f"App import {startup['import_seconds'] * 1000:.1f} ms, lifespan {startup['lifespan_seconds'] * 1000:.1f} ms")
+
+    print(f"\n{'cumulative ms':>14} {'self ms':>9}  module")
+    for row in report["by_cumulative"]:
+        print(f"{row['cumulative_ms']:>14.1f} {row['self_ms']:>9.1f}  {row['module']}")
+
+    print(f"\n{'self ms':>14}  module")
+    for row in report["by_self"]:
+        print(f"{row['self_ms']:>14.1f}  {row['module']}")
+
+    print(f"\n{'self ms':>14}  package")
+    for row in report["by_package"]:
+        print(f"{row['self_ms']:>14.1f}  {row['package']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,4 +8,8 @@ echo "Installing backend dependencies..."
 cd backend
 pip install -r requirements.txt
 
+# Tables are managed by Alembic; the app does not create them at startup
+echo "Applying database migrations..."
+alembic upgrade head
+
 echo "Build completed successfully!"
@@ -19,40 +19,14 @@ const Dashboard = () => {
 
   const fetchDashboardData = async () => {
     try {
-      // Fetch topics for stats and recent topics
-      const topics = await apiService.getTopics();
-      setStats(prev => ({
-        ...prev,
-        topicsCount: topics.length || 0
-      }));
-
-      // Get recent topics (last 3)
-      const sortedTopics = (topics || []).sort((a, b) =>
-        new Date(b.created_at) - new Date(a.created_at)
-      );
-      setRecentTopics(sortedTopics.slice(0, 3));
-
-      // Fetch all notes across all topics
-      let allNotes = [];
-      if (topics.length > 0) {
-        const notesPromises = topics.map(topic =>
-          apiService.getNotesByTopic(topic.id).catch(() => [])
-        );
-        const notesArrays = await Promise.all(notesPromises);
-        allNotes = notesArrays.flat();
-      }
-
-      setStats(prev => ({
-        ...prev,
-        notesCount: allNotes.length || 0
-      }));
-
-      // Fetch tags
-      const tags = await apiService.getTags();
-      setStats(prev => ({
-        ...prev,
-        tagsCount: tags.length || 0
-      }));
+      // Fetch aggregate counts and recent topics in one request
+      const userStats = await apiService.getUserStats(3);
+      setStats({
+        topicsCount: userStats.topics_count || 0,
+        notesCount: userStats.notes_count || 0,
+        tagsCount: userStats.tags_count || 0
+      });
+      setRecentTopics(userStats.recent_topics || []);
     } catch (error) {
       console.error('Failed to fetch dashboard data:', error);
     } finally {
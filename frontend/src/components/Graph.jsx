@@ -98,8 +98,9 @@ const Graph = () => {
       setLoading(true);
       setError(null);
 
-      // Fetch all topics
-      const topics = await apiService.getTopics();
+      // Fetch all topics and edges in a single request
+      const graph = await apiService.getTopicGraph();
+      const topics = graph.topics || [];
 
       // Convert topics to nodes with better positioning
       const nodeList = topics.map((topic, index) => {
@@ -150,19 +151,10 @@ const Graph = () => {
         }
       }
 
-      // Fetch edges for each topic and create edge list
-      const edgeList = [];
-      for (const topic of topics) {
-        try {
-          const topicEdges = await apiService.getTopicEdges(topic.id);
-
-          topicEdges.forEach(edge => {
-            edgeList.push(buildEdge(topic.id, edge.target_topic_id, edge.relation_type));
-          });
-        } catch (err) {
-          console.warn(`Failed to fetch edges for topic ${topic.id}:`, err);
-        }
-      }
+      // Create edge list
+      const edgeList = (graph.edges || []).map(edge =>
+        buildEdge(edge.source, edge.target, edge.relation_type)
+      );
 
       setNodes(nodeList);
       setEdges(edgeList);
@@ -172,9 +164,7 @@ const Graph = () => {
 
       // Persist computed positions for topics that had no saved positions
       if (toPersist.length > 0) {
-        Promise.allSettled(
-          toPersist.map(({ id, position }) => apiService.updateTopic(id, { position }))
-        ).catch(() => {});
+        apiService.updateTopicPositions(toPersist).catch(() => {});
       }
     } catch (err) {
       console.error('Failed to load graph data:', err);
@@ -267,8 +257,10 @@ const Graph = () => {
       const removedEdges = originalEdges.filter(e => !currentEdgeIds.includes(e.id));
 
       // Create new edges
-      for (const edge of addedEdges) {
-        await apiService.createTopicEdge(edge.source, edge.target, edge.label || 'related');
+      if (addedEdges.length > 0) {
+        await apiService.createTopicEdges(
+          addedEdges.map(edge => ({ source: edge.source, target: edge.target, relation_type: edge.label || 'related' }))
+        );
       }
 
       // Delete removed edges
@@ -282,11 +274,11 @@ const Graph = () => {
         const orig = originalPositions[n.id];
         if (!orig) continue;
         if (Math.round(n.position.x) !== Math.round(orig.x) || Math.round(n.position.y) !== Math.round(orig.y)) {
-          positionUpdates.push(apiService.updateTopic(n.id, { position: n.position }));
+          positionUpdates.push({ id: n.id, position: n.position });
         }
       }
       if (positionUpdates.length > 0) {
-        await Promise.all(positionUpdates);
+        await apiService.updateTopicPositions(positionUpdates);
       }
 
       // Update original edges to current state
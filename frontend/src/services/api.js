@@ -83,6 +83,62 @@ class ApiService {
     return data.data || data;
   }
 
+  async getUserStats(recentLimit = 3) {
+    const response = await fetch(`${API_BASE_URL}/user/stats?recent_limit=${recentLimit}`, {
+      method: 'GET',
+      headers: this.getHeaders(true),
+    });
+
+    const data = await this.handleResponse(response);
+    return data.data || data;
+  }
+
+  // Whole account as an NDJSON file; returns a Blob to save
+  async exportData(compression = 'none') {
+    const response = await fetch(`${API_BASE_URL}/user/export?compression=${compression}`, {
+      method: 'GET',
+      headers: this.getHeaders(true),
+    });
+
+    // Errors come back as the usual JSON envelope
+    if (!response.ok || response.headers.get('Content-Type')?.includes('application/json')) {
+      await this.handleResponse(response);
+    }
+    return response.blob();
+  }
+
+  // Bulk import from an NDJSON file or Blob; returns { created, error_count, errors }
+  async importData(file, dryRun = false) {
+    const response = await fetch(`${API_BASE_URL}/import/?dry_run=${dryRun}`, {
+      method: 'POST',
+      headers: { ...this.getHeaders(true), 'Content-Type': 'application/x-ndjson' },
+      body: file,
+    });
+
+    const data = await this.handleResponse(response);
+    return data.data || data;
+  }
+
+  // Follow next_cursor until every page of a paginated list has been fetched
+  async fetchAllPages(path, pageSize = 100) {
+    const items = [];
+    let cursor = null;
+    do {
+      const params = new URLSearchParams({ limit: pageSize });
+      if (cursor) params.set('cursor', cursor);
+      const response = await fetch(`${API_BASE_URL}${path}?${params}`, {
+        method: 'GET',
+        headers: this.getHeaders(true),
+      });
+
+      const data = await this.handleResponse(response);
+      const page = data.data || {};
+      items.push(...(page.items || []));
+      cursor = page.next_cursor;
+    } while (cursor);
+    return items;
+  }
+
   setAuthToken(token) {
     localStorage.setItem('access_token', token);
   }
@@ -97,13 +153,7 @@ class ApiService {
 
   // Topic API methods
   async getTopics() {
-    const response = await fetch(`${API_BASE_URL}/topics/`, {
-      method: 'GET',
-      headers: this.getHeaders(true),
-    });
-
-    const data = await this.handleResponse(response);
-    return data.data || data;
+    return this.fetchAllPages('/topics/');
   }
 
   async getTopic(topicId) {
@@ -138,6 +188,17 @@ class ApiService {
     return data.data || data;
   }
 
+  async updateTopicPositions(positions) {
+    const response = await fetch(`${API_BASE_URL}/topics/positions`, {
+      method: 'PATCH',
+      headers: this.getHeaders(true),
+      body: JSON.stringify(positions),
+    });
+
+    const data = await this.handleResponse(response);
+    return data.data;
+  }
+
   async deleteTopic(topicId) {
     const response = await fetch(`${API_BASE_URL}/topics/${topicId}`, {
       method: 'DELETE',
@@ -148,6 +209,16 @@ class ApiService {
     return data.data || data;
   }
 
+  async getTopicGraph(includeDescription = true) {
+    const response = await fetch(`${API_BASE_URL}/topics/graph?include_description=${includeDescription}`, {
+      method: 'GET',
+      headers: this.getHeaders(true),
+    });
+
+    const data = await this.handleResponse(response);
+    return data.data || data;
+  }
+
   async getTopicEdges(topicId) {
     const response = await fetch(`${API_BASE_URL}/topics/${topicId}/edges`, {
       method: 'GET',
@@ -172,6 +243,17 @@ class ApiService {
     const data = await this.handleResponse(response);
     return data.data || data;
   }
+  async createTopicEdges(edges) {
+    const response = await fetch(`${API_BASE_URL}/topics/topic-edges/bulk`, {
+      method: 'POST',
+      headers: this.getHeaders(true),
+      body: JSON.stringify(edges),
+    });
+
+    const data = await this.handleResponse(response);
+    return data.data;
+  }
+
 
   async deleteTopicEdge(sourceTopicId, targetTopicId) {
     const response = await fetch(`${API_BASE_URL}/topics/topic-edges/${sourceTopicId}/${targetTopicId}`, {
@@ -185,13 +267,7 @@ class ApiService {
 
   // Note API methods
   async getNotesByTopic(topicId) {
-    const response = await fetch(`${API_BASE_URL}/notes/${topicId}`, {
-      method: 'GET',
-      headers: this.getHeaders(true),
-    });
-
-    const data = await this.handleResponse(response);
-    return data.data || data;
+    return this.fetchAllPages(`/notes/${topicId}`);
   }
 
   async getNote(noteId) {
@@ -238,13 +314,7 @@ class ApiService {
 
   // Tag API methods
   async getTags() {
-    const response = await fetch(`${API_BASE_URL}/tags/`, {
-      method: 'GET',
-      headers: this.getHeaders(true),
-    });
-
-    const data = await this.handleResponse(response);
-    return data.data || data;
+    return this.fetchAllPages('/tags/');
   }
 
   async createTag(tagData) {
@@ -278,6 +348,20 @@ class ApiService {
     const data = await this.handleResponse(response);
     return data.data || data;
   }
+
+  // Search API methods
+  // Returns one page ({ items, next_cursor }); pass next_cursor back for more
+  async search(query, cursor = null, limit = 20) {
+    const params = new URLSearchParams({ q: query, limit });
+    if (cursor) params.set('cursor', cursor);
+    const response = await fetch(`${API_BASE_URL}/search/?${params}`, {
+      method: 'GET',
+      headers: this.getHeaders(true),
+    });
+
+    const data = await this.handleResponse(response);
+    return data.data || data;
+  }
 }
 
 export const apiService = new ApiService();